@@ -1,3 +1,4 @@
+import os
 from pathlib import Path
 from decouple import config
 
@@ -25,6 +26,7 @@ MIDDLEWARE = [
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
+    "src.application.shared.utils.plot_store.PlotStoreMiddleware",
 ]
 
 ROOT_URLCONF = "config.urls"
@@ -42,6 +44,7 @@ TEMPLATES = [
             "context_processors": [
                 "django.template.context_processors.debug",
                 "django.template.context_processors.request",
+                "src.application.shared.utils.plot_store.plots_context",
             ],
         },
     },
@@ -74,3 +77,30 @@ STATICFILES_DIRS = [
 
 
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
+
+
+EXPRESSION_CACHE_SIZE = config("EXPRESSION_CACHE_SIZE", default=256, cast=int)
+
+DERIVATIVE_ENGINE = config("DERIVATIVE_ENGINE", default="automatic")
+
+STARTUP_TIME_BUDGET_MS = config("STARTUP_TIME_BUDGET_MS", default=1000, cast=float)
+
+PLOT_RENDERER = config("PLOT_RENDERER", default="svg")
+
+PLOT_SIMPLIFY_TOLERANCE = config("PLOT_SIMPLIFY_TOLERANCE", default=0.25, cast=float)
+
+PLOT_MAX_POINTS = config("PLOT_MAX_POINTS", default=1000, cast=int)
+
+PLOT_STORE_BACKEND = config("PLOT_STORE_BACKEND", default="directory")
+
+PLOT_STORE_LOCATION = config("PLOT_STORE_LOCATION", default=str(BASE_DIR / "plot_store"))
+
+PLOT_STORE_MAX_ENTRIES = config("PLOT_STORE_MAX_ENTRIES", default=256, cast=int)
+
+SPECTRAL_RADIUS_TOLERANCE = config("SPECTRAL_RADIUS_TOLERANCE", default=1e-4, cast=float)
+
+SPECTRAL_RADIUS_MAX_ITERATIONS = config("SPECTRAL_RADIUS_MAX_ITERATIONS", default=100, cast=int)
+
+JACOBI_WORKERS = config("JACOBI_WORKERS", default=os.cpu_count() or 1, cast=int)
+
+JACOBI_PARALLEL_MIN_NONZEROS = config("JACOBI_PARALLEL_MIN_NONZEROS", default=1_000_000, cast=int)
@@ -12,6 +12,7 @@ class NumericalMethodConfig(AppConfig):
             modules=[
                 "src.application.numerical_method.views.bisection_view",
                 "src.application.numerical_method.views.regula_falsi_view",
+                "src.application.numerical_method.views.brent_view",
                 "src.application.numerical_method.views.fixed_point_view",
                 "src.application.numerical_method.views.newton_raphson_view",
                 "src.application.numerical_method.views.secant_view",
@@ -20,6 +21,9 @@ class NumericalMethodConfig(AppConfig):
                 "src.application.numerical_method.views.jacobi_view",
                 "src.application.numerical_method.views.gauss_seidel_view",
                 "src.application.numerical_method.views.sor_view",
+                "src.application.numerical_method.views.conjugate_gradient_view",
+                "src.application.numerical_method.views.gmres_view",
+                "src.application.numerical_method.views.bicgstab_view",
                 "src.application.numerical_method.views.vandermonde_view",
                 "src.application.numerical_method.views.spline_linear_view",
                 "src.application.numerical_method.views.spline_cubic_view",
@@ -1,4 +1,9 @@
 from abc import ABC, abstractmethod
+from src.application.shared.utils.iteration_table import (
+    DEFAULT_RETENTION,
+    RetentionPolicy,
+)
+from src.application.shared.utils.stream_iterations import IterationGenerator
 
 
 class IntervalMethod(ABC):
@@ -14,6 +19,19 @@ class IntervalMethod(ABC):
     ) -> dict:
         pass
 
+    @abstractmethod
+    def iterate(
+        self,
+        interval_a: float,
+        interval_b: float,
+        tolerance: float,
+        max_iterations: int,
+        function_f: str,
+        precision: int,
+        retention: RetentionPolicy | None = DEFAULT_RETENTION,
+    ) -> IterationGenerator:
+        pass
+
     @abstractmethod
     def validate_input(
         interval_a: float,
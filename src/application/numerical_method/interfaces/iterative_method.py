@@ -1,4 +1,9 @@
 from abc import ABC, abstractmethod
+from src.application.shared.utils.iteration_table import (
+    DEFAULT_RETENTION,
+    RetentionPolicy,
+)
+from src.application.shared.utils.stream_iterations import IterationGenerator
 
 
 class IterativeMethod(ABC):
@@ -14,6 +19,19 @@ class IterativeMethod(ABC):
     ) -> dict:
         pass
 
+    @abstractmethod
+    def iterate(
+        self,
+        x0: float,
+        tolerance: float,
+        max_iterations: int,
+        precision: int,
+        function_f: str,
+        retention: RetentionPolicy | None = DEFAULT_RETENTION,
+        **kwargs,
+    ) -> IterationGenerator:
+        pass
+
     @abstractmethod
     def validate_input(
         self,
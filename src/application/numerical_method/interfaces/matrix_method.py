@@ -1,4 +1,9 @@
 from abc import ABC, abstractmethod
+from src.application.shared.utils.iteration_table import (
+    DEFAULT_RETENTION,
+    RetentionPolicy,
+)
+from src.application.shared.utils.stream_iterations import IterationGenerator
 
 
 class MatrixMethod(ABC):
@@ -14,6 +19,19 @@ class MatrixMethod(ABC):
     ) -> dict:
         pass
 
+    @abstractmethod
+    def iterate(
+        self,
+        A: list[list[float]],
+        b: list[float],
+        x0: list[float],
+        tolerance: float,
+        max_iterations: int,
+        retention: RetentionPolicy | None = DEFAULT_RETENTION,
+        **kwargs,
+    ) -> IterationGenerator:
+        pass
+
     @abstractmethod
     def validate_input(
         self,
@@ -0,0 +1,107 @@
+import json
+import subprocess
+import sys
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+"""
+
+Reporta el tiempo de arranque de la aplicación y el tiempo de importación de cada módulo. Cada medición se hace en un intérprete nuevo para que los módulos ya cargados no alteren el resultado.
+
+Uso:
+    python manage.py import_time_report
+    python manage.py import_time_report src.application.numerical_method.services.jacobi_service
+    python manage.py import_time_report --budget 500
+
+"""
+
+# Librerías pesadas que no deberían cargarse al arrancar la aplicación.
+HEAVY_LIBRARIES = ["numpy", "scipy", "sympy", "matplotlib"]
+
+# Script que se ejecuta en un intérprete nuevo: arranca Django y mide la importación pedida.
+MEASURE_SCRIPT = """
+import json, os, sys, time
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
+start = time.perf_counter()
+import django
+django.setup()
+import importlib
+from django.conf import settings
+importlib.import_module(settings.ROOT_URLCONF)
+startup = time.perf_counter() - start
+module = sys.argv[1]
+start = time.perf_counter()
+if module:
+    importlib.import_module(module)
+elapsed = time.perf_counter() - start
+print(json.dumps({
+    "startup_ms": startup * 1000,
+    "import_ms": elapsed * 1000,
+    "loaded": [name for name in %r if name in sys.modules],
+}))
+""" % (HEAVY_LIBRARIES,)
+
+
+class Command(BaseCommand):
+    help = "Mide el tiempo de arranque de la aplicación y el tiempo de importación en frío de cada módulo."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "modules",
+            nargs="*",
+            help="Módulos a medir. Por defecto se miden todos los módulos de src/application.",
+        )
+        parser.add_argument(
+            "--budget",
+            type=float,
+            default=settings.STARTUP_TIME_BUDGET_MS,
+            help="Tiempo máximo de arranque en milisegundos. El comando falla si se supera.",
+        )
+
+    def handle(self, *args, **options):
+        startup = self.measure("")
+        self.stdout.write(f"Arranque de Django: {startup['startup_ms']:.1f} ms")
+        if startup["loaded"]:
+            self.stdout.write(
+                self.style.WARNING(
+                    "Librerías pesadas cargadas al arrancar: "
+                    + ", ".join(startup["loaded"])
+                )
+            )
+
+        modules = options["modules"] or self.discover_modules()
+        results = [(module, self.measure(module)) for module in modules]
+        results.sort(key=lambda result: result[1]["import_ms"], reverse=True)
+
+        self.stdout.write("\nTiempo de importación por módulo (después del arranque):")
+        for module, result in results:
+            loaded = f"  [{', '.join(result['loaded'])}]" if result["loaded"] else ""
+            self.stdout.write(f"{result['import_ms']:10.1f} ms  {module}{loaded}")
+
+        if startup["startup_ms"] > options["budget"]:
+            raise CommandError(
+                f"El arranque tomó {startup['startup_ms']:.1f} ms y supera el presupuesto de {options['budget']:.1f} ms."
+            )
+
+    def measure(self, module: str) -> dict:
+        completed = subprocess.run(
+            [sys.executable, "-c", MEASURE_SCRIPT, module],
+            cwd=settings.BASE_DIR,
+            capture_output=True,
+            text=True,
+        )
+        if completed.returncode != 0:
+            raise CommandError(
+                f"No se pudo importar {module or settings.ROOT_URLCONF}:\n{completed.stderr}"
+            )
+        return json.loads(completed.stdout.strip().splitlines()[-1])
+
+    def discover_modules(self) -> list[str]:
+        application_dir = settings.BASE_DIR / "src" / "application"
+        modules = []
+        for path in sorted(application_dir.rglob("*.py")):
+            relative_path = path.relative_to(settings.BASE_DIR).with_suffix("")
+            if path.name == "__init__.py" or "management" in relative_path.parts:
+                continue
+            modules.append(".".join(relative_path.parts))
+        return modules
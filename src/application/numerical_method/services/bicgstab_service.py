@@ -0,0 +1,287 @@
+import numpy as np
+from scipy import sparse
+from src.application.numerical_method.interfaces.matrix_method import MatrixMethod
+from src.application.shared.utils.plot_matrix_solution import plot_matrix_solution, plot_system_equations
+from src.application.shared.utils.iteration_table import (
+    DEFAULT_RETENTION,
+    IterationTable,
+    RetentionPolicy,
+    table_components,
+)
+from src.application.shared.utils.linear_operator import (
+    as_linear_operator,
+    is_matrix_free,
+)
+from src.application.shared.utils.preconditioners import (
+    NONSYMMETRIC_PRECONDITIONERS,
+    build_preconditioner,
+)
+from src.application.shared.utils.sparse_matrix import (
+    dense_rows,
+    validate_sparse_system,
+)
+from src.application.shared.utils.stream_iterations import (
+    IterationGenerator,
+    run_iterations,
+)
+
+
+class BiCGSTABService(MatrixMethod):
+    def solve(
+        self,
+        A: list[list[float]],  # Matriz de coeficientes, matriz dispersa u operador sin matriz
+        b: list[float],  # Vector de términos independientes
+        x0: list[float],  # Vector inicial de aproximación
+        tolerance: float,  # Tolerancia para la norma del residuo
+        max_iterations: int,  # Número máximo de iteraciones
+        precision_type: str = "decimales_correctos",  # Tipo de precisión
+        preconditioner: str = "none",  # Precondicionador: "none", "jacobi", "ssor", "ilu" o una función
+        **kwargs,
+    ) -> dict:
+        return run_iterations(
+            self.iterate(
+                A=A,
+                b=b,
+                x0=x0,
+                tolerance=tolerance,
+                max_iterations=max_iterations,
+                precision_type=precision_type,
+                preconditioner=preconditioner,
+                **kwargs,
+            )
+        )
+
+    def iterate(
+        self,
+        A: list[list[float]],  # Matriz de coeficientes, matriz dispersa u operador sin matriz
+        b: list[float],  # Vector de términos independientes
+        x0: list[float],  # Vector inicial de aproximación
+        tolerance: float,  # Tolerancia para la norma del residuo
+        max_iterations: int,  # Número máximo de iteraciones
+        precision_type: str = "decimales_correctos",  # Tipo de precisión
+        preconditioner: str = "none",  # Precondicionador: "none", "jacobi", "ssor", "ilu" o una función
+        retention: RetentionPolicy | None = DEFAULT_RETENTION,
+        **kwargs,
+    ) -> IterationGenerator:
+
+        b = np.array(b, dtype=float)
+        x = np.array(x0, dtype=float)
+
+        n = len(b)
+        components = table_components(n)
+        current_error = tolerance + 1
+        current_iteration = 0
+        table = IterationTable(
+            ("Error", "Residuo"), vector_columns={"X": components}, retention=retention
+        )
+
+        def failure(message: str) -> dict:
+            return {
+                "message_method": message,
+                "table": table,
+                "is_successful": False,
+                "have_solution": False,
+                "solution": [],
+            }
+
+        def breakdown(reason: str) -> dict:
+            # Las divisiones de BiCGSTAB pueden anularse aunque A sea invertible; GMRES no tiene ese problema
+            return failure(
+                f"El método BiCGSTAB se interrumpió en la iteración {current_iteration + 1}: {reason}. Intente con otro vector inicial o con GMRES."
+            )
+
+        # A puede ser densa, dispersa (CSR) o un operador sin matriz: solo se usa A @ v
+        try:
+            if is_matrix_free(A):
+                A = as_linear_operator(A, n)
+            elif sparse.issparse(A):
+                A = sparse.csr_matrix(A)
+            else:
+                A = np.array(A, dtype=float)
+            # Precondicionamiento por la derecha: el residuo r es el del sistema original
+            apply_preconditioner = build_preconditioner(A, preconditioner)
+        except ValueError as error:
+            return failure(str(error))
+
+        residual = b - A @ x
+        residual_norm = float(np.linalg.norm(residual))
+        # Residuo sombra: fija el espacio de Krylov de Aᵀ contra el que se biortogonaliza
+        shadow = residual.copy()
+        rho = alpha = omega = 1.0
+        direction = np.zeros(n)
+        a_direction = np.zeros(n)
+
+        while residual_norm > tolerance and current_iteration < max_iterations:
+            next_rho = float(shadow @ residual)
+            if next_rho == 0:
+                return breakdown("el residuo quedó ortogonal al residuo sombra")
+
+            # Paso de BiCG: nueva dirección de búsqueda
+            beta = (next_rho / rho) * (alpha / omega)
+            rho = next_rho
+            direction = residual + beta * (direction - omega * a_direction)
+            preconditioned_direction = apply_preconditioner(direction)
+            a_direction = A @ preconditioned_direction
+            shadow_projection = float(shadow @ a_direction)
+            if shadow_projection == 0:
+                return breakdown("la dirección de búsqueda quedó ortogonal al residuo sombra")
+            alpha = rho / shadow_projection
+            half_residual = residual - alpha * a_direction
+            step = alpha * preconditioned_direction
+
+            # Paso estabilizador: minimiza el residuo en la dirección A·M⁻¹·s
+            if np.linalg.norm(half_residual) > tolerance:
+                preconditioned_half = apply_preconditioner(half_residual)
+                a_half = A @ preconditioned_half
+                a_half_norm = float(a_half @ a_half)
+                omega = float(a_half @ half_residual) / a_half_norm if a_half_norm else 0.0
+                if omega == 0:
+                    return breakdown("el paso estabilizador es nulo")
+                step += omega * preconditioned_half
+                residual = half_residual - omega * a_half
+            else:
+                residual = half_residual
+
+            x = x + step
+            residual_norm = float(np.linalg.norm(residual))
+
+            # El residuo actualizado se aleja del verdadero por redondeo: antes de aceptar la
+            # convergencia se recalcula b - A·x y, si no cumple, se reinicia desde él
+            if residual_norm <= tolerance:
+                residual = b - A @ x
+                residual_norm = float(np.linalg.norm(residual))
+                if residual_norm > tolerance:
+                    shadow = residual.copy()
+                    rho = alpha = omega = 1.0
+                    direction = np.zeros(n)
+                    a_direction = np.zeros(n)
+            current_error = np.linalg.norm(step, ord=np.inf)
+
+            # Aplicar precisión según el tipo seleccionado (en la tabla solo se guardan las primeras componentes)
+            formatted_x = self.apply_precision(x[:components].tolist(), precision_type, tolerance)
+            formatted_error, formatted_residual = self.apply_precision(
+                [current_error, residual_norm], precision_type, tolerance
+            )
+
+            # Guardamos la información de la iteración actual
+            table.append(
+                current_iteration + 1,
+                X=formatted_x,
+                Error=formatted_error,
+                Residuo=formatted_residual,
+            )
+            yield table.last_row()
+
+            current_iteration += 1
+
+        formatted_x = self.apply_precision(x.tolist(), precision_type, tolerance)
+        details = f"; residuo final ‖b - A·x‖ = {residual_norm:.3e}"
+
+        # Verificación de éxito o fallo tras las iteraciones
+        result = {}
+        if residual_norm <= tolerance:
+            result = {
+                "message_method": f"Aproximación de la solución con tolerancia = {tolerance}{details}",
+                "table": table,
+                "is_successful": True,
+                "have_solution": True,
+                "solution": formatted_x,
+                "residual_norm": residual_norm,
+            }
+        elif current_iteration >= max_iterations:
+            result = {
+                "message_method": f"El método funcionó correctamente, pero no se encontró una solución en {max_iterations} iteraciones{details}.",
+                "table": table,
+                "is_successful": True,
+                "have_solution": False,
+                "solution": formatted_x,
+                "residual_norm": residual_norm,
+            }
+        else:
+            result = failure("El método falló al intentar aproximar una solución")
+
+        # Si la matriz es 2x2, generar las gráficas
+        if n == 2 and table.total_rows:
+            plot_matrix_solution(table, formatted_x, None)
+            plot_system_equations(dense_rows(A), b.tolist(), formatted_x)
+
+        return result
+
+    def apply_precision(self, values, precision_type, tolerance):
+        """
+        Aplica precisión a una lista de valores basada en el tipo de precisión seleccionado.
+        """
+        if precision_type == "cifras_significativas":
+            # Calcular cifras significativas según la tolerancia
+            significant_figures = -int(np.floor(np.log10(tolerance)))
+            return [round(value, significant_figures) for value in values]
+        elif precision_type == "decimales_correctos":
+            # Usar la cantidad de decimales basada en la tolerancia
+            decimal_places = -int(np.floor(np.log10(tolerance)))
+            return [round(value, decimal_places) for value in values]
+        else:
+            # Sin cambios si no se selecciona un tipo válido
+            return values
+
+    def validate_input(
+        self,
+        matrix_a_raw: str,
+        vector_b_raw: str,
+        initial_guess_raw: str,
+        tolerance: float,
+        max_iterations: int,
+        matrix_size: int,
+        matrix_format: str = "dense",
+        preconditioner: str = "none",
+        **kwargs,
+    ) -> str | list:
+
+        # Validación de los parámetros de entrada tolerancia positiva
+        if not isinstance(tolerance, (int, float)) or tolerance <= 0:
+            return "La tolerancia debe ser un número positivo"
+
+        # Validación de los parámetros de entrada maximo numero de iteraciones positivo
+        if not isinstance(max_iterations, int) or max_iterations <= 0:
+            return "El máximo número de iteraciones debe ser un entero positivo."
+
+        if preconditioner not in NONSYMMETRIC_PRECONDITIONERS:
+            return f"El precondicionador debe ser uno de: {', '.join(NONSYMMETRIC_PRECONDITIONERS)}."
+
+        # Los formatos dispersos no tienen el límite de 6x6; BiCGSTAB no divide entre la diagonal de A
+        if matrix_format != "dense":
+            return validate_sparse_system(
+                matrix_a_raw,
+                vector_b_raw,
+                initial_guess_raw,
+                matrix_format,
+                nonzero_diagonal=False,
+            )
+
+        # Validación de las entradas numéricas
+        try:
+            A = [
+                [float(num) for num in row.strip().split()]
+                for row in matrix_a_raw.split(";")
+                if row.strip()
+            ]
+
+            b = [float(num) for num in vector_b_raw.strip().split()]
+            x0 = [float(num) for num in initial_guess_raw.strip().split()]
+        except ValueError:
+            return "Todas las entradas deben ser numéricas."
+
+        # Validar que A es cuadrada y coincide con el tamaño seleccionado
+        if len(A) != matrix_size or any(len(row) != matrix_size for row in A):
+            return f"La matriz A debe ser cuadrada y coincidir con el tamaño seleccionado ({matrix_size}x{matrix_size})."
+
+        # Validar que A es cuadrada y de máximo tamaño 6x6
+        if len(A) > 6 or any(len(row) != len(A) for row in A):
+            return "La matriz A debe ser cuadrada de hasta 6x6."
+
+        # Validar que b y x0 tengan tamaños compatibles con A
+        if len(b) != len(A) or len(x0) != len(A):
+            return (
+                "El vector b y x0 deben ser compatibles con el tamaño de la matriz A."
+            )
+
+        return [A, b, x0]
@@ -1,5 +1,20 @@
 import math
 from src.application.shared.utils.plot_function import plot_function
+from src.application.shared.utils.compile_expression import compile_expression
+from src.application.shared.utils.iteration_table import (
+    DEFAULT_RETENTION,
+    IterationTable,
+    RetentionPolicy,
+)
+from src.application.shared.utils.stream_iterations import (
+    IterationGenerator,
+    run_iterations,
+)
+from src.application.shared.utils.bracket_roots import (
+    DEFAULT_GRID_POINTS,
+    bisect_brackets,
+    find_sign_changes,
+)
 from src.application.numerical_method.interfaces.interval_method import (
     IntervalMethod,
 )
@@ -8,6 +23,8 @@ from src.application.numerical_method.interfaces.interval_method import (
 
 El método de bisección es una técnica numérica para encontrar raíces de ecuaciones no lineales en un intervalo [a,b], donde la función f(x) es continua y se cumple que f(a)×f(b)<0, lo que indica la existencia de al menos una raíz. El proceso consiste en calcular el punto medio m=a+b/2​ y evaluar la función en este punto. Si f(m) es cero, m es la raíz. De lo contrario, se elige el subintervalo [a,m] o [m,b] donde la multiplicación de las funciones cambia de signo, y se repite el proceso hasta aproximar la raíz con la precisión deseada.
 
+En el modo "todas las raíces" se buscan los cambios de signo de f(x) sobre una malla fina del intervalo y se aplica la bisección a todos los subintervalos encontrados al mismo tiempo, obteniendo una tabla de iteraciones por cada raíz.
+
 """
 
 
@@ -21,12 +38,35 @@ class BisectionService(IntervalMethod):
         function_f: str,
         precision: int,
     ) -> dict:
+        return run_iterations(
+            self.iterate(
+                interval_a=interval_a,
+                interval_b=interval_b,
+                tolerance=tolerance,
+                max_iterations=max_iterations,
+                function_f=function_f,
+                precision=precision,
+            )
+        )
+
+    def iterate(
+        self,
+        interval_a: float,
+        interval_b: float,
+        tolerance: float,
+        max_iterations: int,
+        function_f: str,
+        precision: int,
+        retention: RetentionPolicy | None = DEFAULT_RETENTION,
+    ) -> IterationGenerator:
 
         # Definición del intervalo inicial.
         interval = [interval_a, interval_b]
 
         # Definición de tabla que contiene todo el proceso
-        table = {}
+        table = IterationTable(
+            ("approximate_value", "f_evaluated", "error"), retention=retention
+        )
 
         # Inicializamos el contador de iteraciones para controlar el número máximo de iteraciones permitidas (Criterio pesimista).
         current_iteration = 1
@@ -34,11 +74,12 @@ class BisectionService(IntervalMethod):
         # Inicializamos el error actual con infinito para asegurar que el primer cálculo de error sea significativo.
         current_error = math.inf
 
+        # Compilamos la función una sola vez para evaluarla en cada iteración sin volver a interpretarla.
+        evaluate_f = compile_expression(function_f)
+
         # Evaluamos la función en los extremos del intervalo para verificar si alguno de ellos es una raíz exacta.
-        x = interval[0]
-        fa = eval(function_f)
-        x = interval[1]
-        fb = eval(function_f)
+        fa = evaluate_f(interval[0])
+        fb = evaluate_f(interval[1])
 
         # Si el valor en el extremo inferior es cero, ese punto es una raíz.
         if fa == 0:
@@ -66,16 +107,12 @@ class BisectionService(IntervalMethod):
 
         # Ejecutamos el proceso de bisección mientras no se exceda el número máximo de iteraciones.
         while current_iteration <= max_iterations:
-            # Almacenamos la información de la iteración actual en la tabla.
-            table[current_iteration] = {}
-
             # Calculamos el punto medio del intervalo actual.
             Xn = (interval[0] + interval[1]) / 2
 
             # Evaluamos la función en el punto medio.
             try:
-                x = Xn
-                f = eval(function_f)
+                f = evaluate_f(Xn)
             except Exception as e:
                 return {
                     "message_method": f"Error al evaluar la función en el punto medio: {str(e)}.",
@@ -85,32 +122,24 @@ class BisectionService(IntervalMethod):
                     "root": 0.0,
                 }
 
-            # Guardamos los datos de la iteración actual en la tabla.
-            table[current_iteration]["iteration"] = current_iteration
-            table[current_iteration]["approximate_value"] = Xn
-            table[current_iteration]["f_evaluated"] = f
-
             # Para la primera iteración, el error se mantiene como infinito (no hay valor previo para comparar).
-            if current_iteration == 1:
-                table[current_iteration]["error"] = current_error
-
             # Calculamos el error como la diferencia absoluta entre el punto medio actual y el anterior. (Error de dispersión)
-            else:
+            if current_iteration > 1:
                 if precision:
-                    current_error = abs(
-                        table[current_iteration]["approximate_value"]
-                        - table[current_iteration - 1]["approximate_value"]
-                    )
-                    table[current_iteration]["error"] = current_error
+                    current_error = abs(Xn - table.last("approximate_value"))
                 else:
                     current_error = abs(
-                        (
-                            table[current_iteration]["approximate_value"]
-                            - table[current_iteration - 1]["approximate_value"]
-                        )
-                        / table[current_iteration]["approximate_value"]
+                        (Xn - table.last("approximate_value")) / Xn
                     )
-                    table[current_iteration]["error"] = current_error
+
+            # Guardamos los datos de la iteración actual en la tabla.
+            table.append(
+                current_iteration,
+                approximate_value=Xn,
+                f_evaluated=f,
+                error=current_error,
+            )
+            yield table.last_row()
 
             # Si la función evaluada en el punto medio es cero, hemos encontrado la raíz exacta.
             if f == 0:
@@ -143,10 +172,8 @@ class BisectionService(IntervalMethod):
                 interval = [Xn, interval[1]]
 
             # Se evalua la función en el nuevo intervalo
-            x = interval[0]
-            fa = eval(function_f)
-            x = interval[1]
-            fb = eval(function_f)
+            fa = evaluate_f(interval[0])
+            fb = evaluate_f(interval[1])
 
             # Incrementamos el contador de iteraciones.
             current_iteration += 1
@@ -162,6 +189,80 @@ class BisectionService(IntervalMethod):
             "root": 0.0,
         }
 
+    def solve_all(
+        self,
+        interval_a: float,
+        interval_b: float,
+        tolerance: float,
+        max_iterations: int,
+        function_f: str,
+        precision: int,
+        grid_points: int = DEFAULT_GRID_POINTS,
+    ) -> dict:
+
+        # Buscamos en una sola evaluación vectorizada todos los subintervalos donde f(x) cambia de signo.
+        brackets, exact_roots = find_sign_changes(
+            function_f, interval_a, interval_b, grid_points
+        )
+
+        # Los puntos de la malla donde f(x) es cero ya son raíces y no necesitan iteraciones.
+        roots = [
+            {
+                "root": float(root),
+                "table": {},
+                "have_solution": True,
+                "message_method": "{} es raiz de f(x)".format(root),
+            }
+            for root in exact_roots
+        ]
+
+        # Refinamos todos los subintervalos a la vez con bisección sobre arreglos.
+        for result in bisect_brackets(
+            function_f, brackets, tolerance, max_iterations, precision
+        ):
+            if result["have_solution"]:
+                message = "{} es una aproximación de la raiz de f(x) con un error de {}".format(
+                    result["root"], result["error"]
+                )
+            else:
+                message = "No se encontró solución en [{}, {}] para {} iteraciones".format(
+                    *result["interval"], max_iterations
+                )
+            roots.append(
+                {
+                    "root": result["root"],
+                    "table": result["table"],
+                    "have_solution": result["have_solution"],
+                    "message_method": message,
+                }
+            )
+
+        roots.sort(key=lambda root: root["root"])
+        found = [root for root in roots if root["have_solution"]]
+
+        if not roots:
+            return {
+                "message_method": "La función no cambia de signo en el intervalo [{}, {}], no se encontraron raíces".format(
+                    interval_a, interval_b
+                ),
+                "table": {},
+                "roots": [],
+                "is_successful": True,
+                "have_solution": False,
+                "root": 0.0,
+            }
+
+        return {
+            "message_method": "Se encontraron {} raíces de f(x) en el intervalo [{}, {}]".format(
+                len(found), interval_a, interval_b
+            ),
+            "table": {},
+            "roots": roots,
+            "is_successful": True,
+            "have_solution": bool(found),
+            "root": found[0]["root"] if found else 0.0,
+        }
+
     def validate_input(
         self,
         interval_a: float,
@@ -169,6 +270,7 @@ class BisectionService(IntervalMethod):
         tolerance: float,
         max_iterations: int,
         function_f: str,
+        all_roots: bool = False,
     ) -> str | bool:
 
         # Validación de los parámetros de entrada tolerancia positiva
@@ -183,10 +285,9 @@ class BisectionService(IntervalMethod):
 
         # Validación de la función ingresada
         try:
-            x = interval_a
-            fa = eval(function_f)
-            x = interval_b
-            fb = eval(function_f)
+            evaluate_f = compile_expression(function_f)
+            fa = evaluate_f(interval_a)
+            fb = evaluate_f(interval_b)
         except ValueError:
             plot_function(function_f, False, [(interval_a, 0), (interval_b, 0)]);
             return "Error: Valor fuera del dominio permitido para la función. Verifique que los valores de 'x' sean válidos en el dominio de la función."
@@ -204,7 +305,8 @@ class BisectionService(IntervalMethod):
         except Exception as e:
             return f"Error desconocido: {str(e)}."
         
-        if fa * fb > 0:
+        # En el modo de todas las raíces el intervalo puede contener un número par de raíces.
+        if not all_roots and fa * fb > 0:
             plot_function(function_f, False, [(interval_a, 0), (interval_b, 0)]);
             return "El intervalo es inadecuado, recuerde que se debe encontrar un raíz para el intervalo dado"
 
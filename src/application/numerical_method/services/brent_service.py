@@ -0,0 +1,298 @@
+import math
+import sys
+from src.application.shared.utils.plot_function import plot_function
+from src.application.shared.utils.compile_expression import compile_expression
+from src.application.shared.utils.iteration_table import (
+    DEFAULT_RETENTION,
+    IterationTable,
+    RetentionPolicy,
+)
+from src.application.shared.utils.stream_iterations import (
+    IterationGenerator,
+    run_iterations,
+)
+from src.application.numerical_method.interfaces.interval_method import (
+    IntervalMethod,
+)
+
+"""
+
+El método de Brent es una técnica numérica para encontrar raíces de ecuaciones no lineales en un intervalo [a,b], donde la función f(x) es continua y se cumple que f(a)×f(b)<0. Combina la bisección con la interpolación lineal (secante) y la interpolación cuadrática inversa: en cada iteración intenta el paso por interpolación y, si el punto obtenido sale del intervalo o no reduce el intervalo lo suficiente, toma un paso de bisección. Así conserva la convergencia garantizada de la bisección pero normalmente converge de forma superlineal, evaluando la función una sola vez por iteración.
+
+"""
+
+# Factor en que debe bajar |f(b)| en una iteración, si el intervalo no se redujo a la mitad, para volver a interpolar.
+PROGRESS_FACTOR = 10
+
+
+class BrentService(IntervalMethod):
+    def solve(
+        self,
+        interval_a: float,
+        interval_b: float,
+        tolerance: float,
+        max_iterations: int,
+        function_f: str,
+        precision: int,
+    ) -> dict:
+        return run_iterations(
+            self.iterate(
+                interval_a=interval_a,
+                interval_b=interval_b,
+                tolerance=tolerance,
+                max_iterations=max_iterations,
+                function_f=function_f,
+                precision=precision,
+            )
+        )
+
+    def iterate(
+        self,
+        interval_a: float,
+        interval_b: float,
+        tolerance: float,
+        max_iterations: int,
+        function_f: str,
+        precision: int,
+        retention: RetentionPolicy | None = DEFAULT_RETENTION,
+    ) -> IterationGenerator:
+
+        # Definición de tabla que contiene todo el proceso
+        table = IterationTable(
+            ("approximate_value", "f_evaluated", "error"), retention=retention
+        )
+
+        # Inicializamos el contador de iteraciones para controlar el número máximo de iteraciones permitidas (Criterio pesimista).
+        current_iteration = 1
+
+        # Inicializamos el error actual con infinito para asegurar que el primer cálculo de error sea significativo.
+        current_error = math.inf
+
+        # Compilamos la función una sola vez para evaluarla en cada iteración sin volver a interpretarla.
+        evaluate_f = compile_expression(function_f)
+
+        # Evaluamos la función en los extremos del intervalo para verificar si alguno de ellos es una raíz exacta.
+        a, b = interval_a, interval_b
+        fa = evaluate_f(a)
+        fb = evaluate_f(b)
+
+        # Si el valor en el extremo inferior es cero, ese punto es una raíz.
+        if fa == 0:
+            return {
+                "message_method": "{} es raiz de f(x) y es el extremo inferior del intervalo".format(
+                    a
+                ),
+                "table": {},
+                "is_successful": True,
+                "have_solution": True,
+                "root": a,
+            }
+
+        # Si el valor en el extremo superior es cero, ese punto es una raíz.
+        elif fb == 0:
+            return {
+                "message_method": "{} es raiz de f(x) y es el extremo superior del intervalo".format(
+                    b
+                ),
+                "table": {},
+                "is_successful": True,
+                "have_solution": True,
+                "root": b,
+            }
+
+        # c es el extremo opuesto a b del intervalo que contiene la raíz; step es el último paso y previous_step el penúltimo.
+        c, fc = a, fa
+        step = previous_step = b - a
+
+        # Ancho del intervalo [b, c] y |f(b)| en la última iteración que avanzó hacia la raíz.
+        bracket_width = abs(b - a)
+        best_residual = max(abs(fa), abs(fb))
+
+        # Ejecutamos el proceso de Brent mientras no se exceda el número máximo de iteraciones.
+        while current_iteration <= max_iterations:
+            # Si b y c quedaron del mismo lado de la raíz, el extremo opuesto vuelve a ser a.
+            if fb * fc > 0:
+                c, fc = a, fa
+                step = previous_step = b - a
+
+            # b debe ser siempre el extremo con el menor |f|, es decir, la mejor aproximación.
+            if abs(fc) < abs(fb):
+                a, b, c = b, c, b
+                fa, fb, fc = fb, fc, fb
+
+            # Paso mínimo permitido y mitad del intervalo actual [b, c].
+            step_tolerance = 2 * sys.float_info.epsilon * abs(b) + tolerance / 2
+            half_width = (c - b) / 2
+
+            # Si el intervalo [b, c] que contiene la raíz ya es menor que la tolerancia, b es una aproximación de la raíz.
+            # Sin este criterio, cerca de una raíz múltiple los pasos mínimos hacen que el error entre iteraciones nunca baje de la tolerancia.
+            if abs(half_width) <= step_tolerance:
+                return {
+                    "message_method": "{} es una aproximación de la raiz de f(x): el intervalo que la contiene mide {}".format(
+                        b, abs(c - b)
+                    ),
+                    "table": table,
+                    "is_successful": True,
+                    "have_solution": True,
+                    "root": b,
+                }
+
+            # Cerca de una raíz múltiple la interpolación avanza muy despacio: el intervalo casi no se reduce y |f(b)| baja poco.
+            # Si desde el último avance el intervalo no se redujo a la mitad ni |f(b)| a la décima parte, se hace un paso de bisección.
+            stalled = abs(c - b) > bracket_width / 2 and abs(fb) > best_residual / PROGRESS_FACTOR
+            if not stalled:
+                bracket_width, best_residual = abs(c - b), abs(fb)
+
+            # Intentamos interpolar solo si el penúltimo paso fue suficientemente grande y la iteración anterior avanzó.
+            if not stalled and abs(previous_step) >= step_tolerance and abs(fa) > abs(fb):
+                s = fb / fa
+                if a == c:
+                    # Interpolación lineal (secante) con solo dos puntos distintos.
+                    p = 2 * half_width * s
+                    q = 1 - s
+                else:
+                    # Interpolación cuadrática inversa con los puntos a, b y c.
+                    q = fa / fc
+                    r = fb / fc
+                    p = s * (2 * half_width * q * (q - r) - (b - a) * (r - 1))
+                    q = (q - 1) * (r - 1) * (s - 1)
+                if p > 0:
+                    q = -q
+                else:
+                    p = -p
+
+                # Aceptamos la interpolación si cae dentro del intervalo y reduce el paso a menos de la mitad del penúltimo.
+                if 2 * p < min(
+                    3 * half_width * q - abs(step_tolerance * q), abs(previous_step * q)
+                ):
+                    previous_step = step
+                    step = p / q
+                else:
+                    step = previous_step = half_width
+            else:
+                step = previous_step = half_width
+
+            # Calculamos la nueva aproximación; el paso nunca es menor que la tolerancia mínima.
+            a, fa = b, fb
+            if abs(step) > step_tolerance:
+                b += step
+            else:
+                b += math.copysign(step_tolerance, half_width)
+            Xn = b
+
+            # Evaluamos la función en la nueva aproximación (única evaluación de la iteración).
+            try:
+                fb = evaluate_f(Xn)
+            except Exception as e:
+                return {
+                    "message_method": f"Error al evaluar la función en Xn: {str(e)}.",
+                    "table": table,
+                    "is_successful": True,
+                    "have_solution": False,
+                    "root": 0.0,
+                }
+            f = fb
+
+            # Para la primera iteración, el error se mantiene como infinito (no hay valor previo para comparar).
+            # Calculamos el error como la diferencia absoluta entre el valor aproximado actual y el anterior. (Error de dispersión)
+            if current_iteration > 1:
+                if precision:
+                    current_error = abs(Xn - table.last("approximate_value"))
+                else:
+                    current_error = abs(
+                        (Xn - table.last("approximate_value")) / Xn
+                    )
+
+            # Guardamos los datos de la iteración actual en la tabla.
+            table.append(
+                current_iteration,
+                approximate_value=Xn,
+                f_evaluated=f,
+                error=current_error,
+            )
+            yield table.last_row()
+
+            # Si la función evaluada en el valor aproximado es cero, hemos encontrado la raíz exacta.
+            if f == 0:
+                return {
+                    "message_method": "{} es raiz de f(x)".format(Xn),
+                    "table": table,
+                    "is_successful": True,
+                    "have_solution": True,
+                    "root": Xn,
+                }
+
+            # Si el error es menor que la tolerancia especificada, aceptamos el valor aproximado como una aproximación de la raíz.
+            elif current_error < tolerance:
+                return {
+                    "message_method": "{} es una aproximación de la raiz de f(x) con un error de {}".format(
+                        Xn, current_error
+                    ),
+                    "table": table,
+                    "is_successful": True,
+                    "have_solution": True,
+                    "root": Xn,
+                }
+
+            # Incrementamos el contador de iteraciones.
+            current_iteration += 1
+
+        # Si se alcanza el número máximo de iteraciones sin encontrar una raíz, se retorna un mensaje de fallo.
+        return {
+            "message_method": "El método funcionó correctamente pero no se encontró solución para {} iteraciones".format(
+                max_iterations
+            ),
+            "table": table,
+            "is_successful": True,
+            "have_solution": False,
+            "root": 0.0,
+        }
+
+    def validate_input(
+        self,
+        interval_a: float,
+        interval_b: float,
+        tolerance: float,
+        max_iterations: int,
+        function_f: str,
+    ) -> str | bool:
+
+        # Validación de los parámetros de entrada tolerancia positiva
+        if not isinstance(tolerance, (int, float)) or tolerance <= 0:
+            plot_function(function_f, False, [(interval_a, 0), (interval_b, 0)])
+            return "La tolerancia debe ser un número positivo"
+
+        # Validación de los parámetros de entrada maximo numero de iteraciones positivo
+        if not isinstance(max_iterations, int) or max_iterations <= 0:
+            plot_function(function_f, False, [(interval_a, 0), (interval_b, 0)])
+            return "El máximo número de iteraciones debe ser un entero positivo."
+
+        # Validación de la función ingresada
+        try:
+            evaluate_f = compile_expression(function_f)
+            fa = evaluate_f(interval_a)
+            fb = evaluate_f(interval_b)
+
+        except ValueError:
+            plot_function(function_f, False, [(interval_a, 0), (interval_b, 0)])
+            return "Error: Valor fuera del dominio permitido para la función. Verifique que los valores de 'x' sean válidos en el dominio de la función."
+
+        except SyntaxError:
+            return "Error de sintaxis en la función ingresada: Verifique la expresión y asegúrese de que sea válida en Python."
+
+        except NameError:
+            return "Error de nombre en la función ingresada: Nombre no definido en la función. Asegúrese de usar la variable 'x' y las funciones de la biblioteca 'math' correctamente."
+
+        except ZeroDivisionError:
+            plot_function(function_f, False, [(interval_a, 0), (interval_b, 0)])
+            return "Error: División por cero en la función. Asegúrese de que la función no tenga denominadores que se anulen en el intervalo dado."
+
+        except Exception as e:
+            return f"Error desconocido: {str(e)}."
+        
+        # Si el producto de los valores en los extremos del intervalo es positivo, no se puede garantizar la existencia de una raíz.
+        if fa * fb > 0:
+            plot_function(function_f, False, [(interval_a, 0), (interval_b, 0)])
+            return "El intervalo es inadecuado, recuerde que se debe encontrar un raíz para el intervalo dado"
+
+        return True
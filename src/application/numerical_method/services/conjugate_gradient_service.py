@@ -0,0 +1,286 @@
+import numpy as np
+from scipy import sparse
+from scipy.linalg import eigvalsh_tridiagonal
+from src.application.numerical_method.interfaces.matrix_method import MatrixMethod
+from src.application.shared.utils.plot_matrix_solution import plot_matrix_solution, plot_system_equations
+from src.application.shared.utils.iteration_table import (
+    DEFAULT_RETENTION,
+    IterationTable,
+    RetentionPolicy,
+    table_components,
+)
+from src.application.shared.utils.preconditioners import (
+    PRECONDITIONERS,
+    build_preconditioner,
+)
+from src.application.shared.utils.sparse_matrix import (
+    dense_rows,
+    validate_sparse_system,
+)
+from src.application.shared.utils.stream_iterations import (
+    IterationGenerator,
+    run_iterations,
+)
+
+
+class ConjugateGradientService(MatrixMethod):
+    def solve(
+        self,
+        A: list[list[float]],  # Matriz de coeficientes (simétrica definida positiva)
+        b: list[float],  # Vector de términos independientes
+        x0: list[float],  # Vector inicial de aproximación
+        tolerance: float,  # Tolerancia para el error
+        max_iterations: int,  # Número máximo de iteraciones
+        precision_type: str = "decimales_correctos",  # Tipo de precisión
+        preconditioner: str = "none",  # Precondicionador: "none", "jacobi", "ssor" o "ichol"
+        **kwargs,
+    ) -> dict:
+        return run_iterations(
+            self.iterate(
+                A=A,
+                b=b,
+                x0=x0,
+                tolerance=tolerance,
+                max_iterations=max_iterations,
+                precision_type=precision_type,
+                preconditioner=preconditioner,
+                **kwargs,
+            )
+        )
+
+    def iterate(
+        self,
+        A: list[list[float]],  # Matriz de coeficientes (simétrica definida positiva)
+        b: list[float],  # Vector de términos independientes
+        x0: list[float],  # Vector inicial de aproximación
+        tolerance: float,  # Tolerancia para el error
+        max_iterations: int,  # Número máximo de iteraciones
+        precision_type: str = "decimales_correctos",  # Tipo de precisión
+        preconditioner: str = "none",  # Precondicionador: "none", "jacobi", "ssor" o "ichol"
+        retention: RetentionPolicy | None = DEFAULT_RETENTION,
+        **kwargs,
+    ) -> IterationGenerator:
+
+        # A puede ser densa (lista de filas) o dispersa (CSR, ver sparse_matrix.py)
+        is_sparse = sparse.issparse(A)
+        A = sparse.csr_matrix(A) if is_sparse else np.array(A, dtype=float)
+        b = np.array(b, dtype=float)
+        x = np.array(x0, dtype=float)
+
+        n = len(b)
+        components = table_components(n)
+        current_error = tolerance + 1
+        current_iteration = 0
+        table = IterationTable(("Error",), vector_columns={"X": components}, retention=retention)
+
+        def failure(message: str) -> dict:
+            return {
+                "message_method": message,
+                "table": table,
+                "is_successful": False,
+                "have_solution": False,
+                "solution": [],
+            }
+
+        # M⁻¹ se aplica como una función (ver preconditioners.py)
+        try:
+            apply_preconditioner = build_preconditioner(A, preconditioner)
+        except ValueError as error:
+            return failure(str(error))
+
+        # Residuo inicial y primera dirección de búsqueda
+        residual = b - A @ x
+        z = apply_preconditioner(residual)
+        direction = z.copy()
+        residual_z = float(residual @ z)
+
+        # Coeficientes de Lanczos (alfa y beta de cada iteración) para estimar el número de condición de M⁻¹·A
+        alphas, betas = [], []
+
+        while (
+            current_error > tolerance
+            and current_iteration < max_iterations
+            and residual_z != 0
+        ):
+            # Un producto matriz-vector por iteración
+            a_direction = A @ direction
+            curvature = float(direction @ a_direction)
+            if curvature <= 0:
+                return failure(
+                    "La matriz A no es definida positiva: el método del gradiente conjugado no se puede aplicar."
+                )
+
+            alpha = residual_z / curvature
+            x += alpha * direction
+            residual -= alpha * a_direction
+
+            # El error es la norma infinito del paso, como en Jacobi, Gauss-Seidel y SOR
+            current_error = abs(alpha) * np.linalg.norm(direction, ord=np.inf)
+
+            z = apply_preconditioner(residual)
+            next_residual_z = float(residual @ z)
+            beta = next_residual_z / residual_z
+            direction = z + beta * direction
+            residual_z = next_residual_z
+            alphas.append(alpha)
+            betas.append(beta)
+
+            # Aplicar precisión según el tipo seleccionado (en la tabla solo se guardan las primeras componentes)
+            formatted_x = self.apply_precision(x[:components].tolist(), precision_type, tolerance)
+            formatted_error = self.apply_precision([current_error], precision_type, tolerance)[0]
+
+            # Guardamos la información de la iteración actual
+            table.append(
+                current_iteration + 1,
+                X=formatted_x,
+                Error=formatted_error,
+            )
+            yield table.last_row()
+
+            current_iteration += 1
+
+        formatted_x = self.apply_precision(x.tolist(), precision_type, tolerance)
+        residual_norm = float(np.linalg.norm(b - A @ x))
+        condition_number = self.estimate_condition_number(alphas, betas)
+
+        details = f"; residuo final ‖b - A·x‖ = {residual_norm:.3e}"
+        if condition_number is not None:
+            details += f" y número de condición estimado de M⁻¹·A ≈ {condition_number:.4g}"
+
+        # Verificación de éxito o fallo tras las iteraciones
+        result = {}
+        if current_error <= tolerance or residual_z == 0:
+            result = {
+                "message_method": f"Aproximación de la solución con tolerancia = {tolerance}{details}",
+                "table": table,
+                "is_successful": True,
+                "have_solution": True,
+                "solution": formatted_x,
+                "condition_number": condition_number,
+            }
+        elif current_iteration >= max_iterations:
+            result = {
+                "message_method": f"El método funcionó correctamente, pero no se encontró una solución en {max_iterations} iteraciones{details}.",
+                "table": table,
+                "is_successful": True,
+                "have_solution": False,
+                "solution": formatted_x,
+                "condition_number": condition_number,
+            }
+        else:
+            result = failure("El método falló al intentar aproximar una solución")
+
+        # Si la matriz es 2x2, generar las gráficas
+        if n == 2 and table.total_rows:
+            plot_matrix_solution(table, formatted_x, None)
+            plot_system_equations(dense_rows(A), b.tolist(), formatted_x)
+
+        return result
+
+    def estimate_condition_number(self, alphas: list[float], betas: list[float]) -> float | None:
+        """
+        Estima el número de condición de M⁻¹·A con los valores propios extremos de la matriz tridiagonal de Lanczos que el gradiente conjugado construye implícitamente.
+        """
+        if len(alphas) < 2:
+            return None
+        alphas = np.array(alphas)
+        betas = np.array(betas[:-1])
+        diagonal = 1 / alphas
+        diagonal[1:] += betas / alphas[:-1]
+        off_diagonal = np.sqrt(np.maximum(betas, 0)) / alphas[:-1]
+        eigenvalues = eigvalsh_tridiagonal(diagonal, off_diagonal)
+        if eigenvalues[0] <= 0:
+            return None
+        return float(eigenvalues[-1] / eigenvalues[0])
+
+    def apply_precision(self, values, precision_type, tolerance):
+        """
+        Aplica precisión a una lista de valores basada en el tipo de precisión seleccionado.
+        """
+        if precision_type == "cifras_significativas":
+            # Calcular cifras significativas según la tolerancia
+            significant_figures = -int(np.floor(np.log10(tolerance)))
+            return [round(value, significant_figures) for value in values]
+        elif precision_type == "decimales_correctos":
+            # Usar la cantidad de decimales basada en la tolerancia
+            decimal_places = -int(np.floor(np.log10(tolerance)))
+            return [round(value, decimal_places) for value in values]
+        else:
+            # Sin cambios si no se selecciona un tipo válido
+            return values
+
+    def validate_input(
+        self,
+        matrix_a_raw: str,
+        vector_b_raw: str,
+        initial_guess_raw: str,
+        tolerance: float,
+        max_iterations: int,
+        matrix_size: int,
+        matrix_format: str = "dense",
+        preconditioner: str = "none",
+        **kwargs,
+    ) -> str | list:
+
+        # Validación de los parámetros de entrada tolerancia positiva
+        if not isinstance(tolerance, (int, float)) or tolerance <= 0:
+            return "La tolerancia debe ser un número positivo"
+
+        # Validación de los parámetros de entrada maximo numero de iteraciones positivo
+        if not isinstance(max_iterations, int) or max_iterations <= 0:
+            return "El máximo número de iteraciones debe ser un entero positivo."
+
+        if preconditioner not in PRECONDITIONERS:
+            return f"El precondicionador debe ser uno de: {', '.join(PRECONDITIONERS)}."
+
+        # Los formatos dispersos no tienen el límite de 6x6
+        if matrix_format != "dense":
+            response = validate_sparse_system(
+                matrix_a_raw, vector_b_raw, initial_guess_raw, matrix_format
+            )
+            if isinstance(response, str):
+                return response
+            return self.validate_spd(response[0]) or response
+
+        # Validación de las entradas numéricas
+        try:
+            A = [
+                [float(num) for num in row.strip().split()]
+                for row in matrix_a_raw.split(";")
+                if row.strip()
+            ]
+
+            b = [float(num) for num in vector_b_raw.strip().split()]
+            x0 = [float(num) for num in initial_guess_raw.strip().split()]
+        except ValueError:
+            return "Todas las entradas deben ser numéricas."
+
+        # Validar que A es cuadrada y coincide con el tamaño seleccionado
+        if len(A) != matrix_size or any(len(row) != matrix_size for row in A):
+            return f"La matriz A debe ser cuadrada y coincidir con el tamaño seleccionado ({matrix_size}x{matrix_size})."
+
+        # Validar que A es cuadrada y de máximo tamaño 6x6
+        if len(A) > 6 or any(len(row) != len(A) for row in A):
+            return "La matriz A debe ser cuadrada de hasta 6x6."
+
+        # Validar que b y x0 tengan tamaños compatibles con A
+        if len(b) != len(A) or len(x0) != len(A):
+            return (
+                "El vector b y x0 deben ser compatibles con el tamaño de la matriz A."
+            )
+
+        return self.validate_spd(np.array(A)) or [A, b, x0]
+
+    def validate_spd(self, A) -> str | None:
+        """
+        Revisa las condiciones necesarias de una matriz simétrica definida positiva que se pueden verificar sin factorizarla.
+        """
+        scale = abs(A).max()
+        asymmetry = abs(A - A.T).max()
+        if asymmetry > 1e-12 * scale:
+            return "La matriz A debe ser simétrica para el método del gradiente conjugado."
+
+        if np.any(A.diagonal() <= 0):
+            return "La diagonal de la matriz A debe ser positiva para el método del gradiente conjugado."
+
+        return None
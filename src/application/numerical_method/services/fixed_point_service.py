@@ -1,5 +1,15 @@
 import math
 from src.application.shared.utils.plot_function import plot_function
+from src.application.shared.utils.compile_expression import compile_expression
+from src.application.shared.utils.iteration_table import (
+    DEFAULT_RETENTION,
+    IterationTable,
+    RetentionPolicy,
+)
+from src.application.shared.utils.stream_iterations import (
+    IterationGenerator,
+    run_iterations,
+)
 from src.application.numerical_method.interfaces.iterative_method import (
     IterativeMethod,
 )
@@ -8,8 +18,31 @@ from src.application.numerical_method.interfaces.iterative_method import (
 
 El método de punto fijo es una técnica para resolver ecuaciones no lineales. Consiste en reformular la ecuación original f(x)=0 en la forma x=g(x), donde g(x) es una función que se elige para que sus iteraciones sucesivas converjan a una raíz de f(x). A partir de un valor inicial, se evalúa iterativamente g(x), y los valores obtenidos tienden a aproximarse cada vez más a la raíz de la ecuación original.
 
+La iteración de punto fijo converge linealmente y puede necesitar cientos de iteraciones cuando |g'(x)| es cercano a 1. Con la extrapolación Δ² de Aitken se toman tres iterados consecutivos x0, x1, x2 y se calcula x0 - (x1 - x0)²/(x2 - 2x1 + x0), que elimina el término lineal del error. Aitken aplica la extrapolación sobre la sucesión normal de iterados; Steffensen reinicia la iteración desde el valor extrapolado en cada paso y converge cuadráticamente.
+
 """
 
+# Modos de aceleración disponibles para la iteración de punto fijo.
+ACCELERATION_MODES = ("none", "aitken", "steffensen")
+
+
+def aitken_extrapolation(x0: float, x1: float, x2: float) -> float:
+    """
+    Aplica la extrapolación Δ² de Aitken a tres iterados consecutivos.
+
+    Args:
+        x0 (float): Primer iterado.
+        x1 (float): Segundo iterado, g(x0).
+        x2 (float): Tercer iterado, g(x1).
+
+    Returns:
+        float: Valor extrapolado; si la segunda diferencia es cero se retorna x2.
+    """
+    denominator = x2 - 2 * x1 + x0
+    if denominator == 0:
+        return x2
+    return x0 - (x1 - x0) ** 2 / denominator
+
 
 class FixedPointService(IterativeMethod):
     def solve(
@@ -21,10 +54,53 @@ class FixedPointService(IterativeMethod):
         function_f: str,
         **kwargs,
     ) -> dict:
+        return run_iterations(
+            self.iterate(
+                x0=x0,
+                tolerance=tolerance,
+                max_iterations=max_iterations,
+                precision=precision,
+                function_f=function_f,
+                **kwargs,
+            )
+        )
+
+    def iterate(
+        self,
+        x0: float,
+        tolerance: float,
+        max_iterations: int,
+        precision: int,
+        function_f: str,
+        retention: RetentionPolicy | None = DEFAULT_RETENTION,
+        **kwargs,
+    ) -> IterationGenerator:
         function_g = kwargs.get("function_g")
+        acceleration = kwargs.get("acceleration", "none")
+
+        # Compilamos las funciones una sola vez para evaluarlas en cada iteración sin volver a interpretarlas.
+        evaluate_f = compile_expression(function_f)
+        evaluate_g = compile_expression(function_g)
+
+        # Con aceleración se usa la extrapolación de Aitken o el método de Steffensen.
+        if acceleration != "none":
+            return (
+                yield from self.iterate_accelerated(
+                    x0,
+                    tolerance,
+                    max_iterations,
+                    precision,
+                    evaluate_f,
+                    evaluate_g,
+                    acceleration,
+                    retention,
+                )
+            )
 
         # Definición de tabla que contiene todo el proceso
-        table = {}
+        table = IterationTable(
+            ("approximate_value", "f_evaluated", "error"), retention=retention
+        )
 
         # Inicializamos el contador de iteraciones para controlar el número máximo de iteraciones permitidas (Criterio pesimista).
         current_iteration = 1
@@ -34,17 +110,12 @@ class FixedPointService(IterativeMethod):
 
         # Ejecutamos el proceso de punto fijo mientras no se exceda el número máximo de iteraciones.
         while current_iteration <= max_iterations:
-            # Almacenamos la información de la iteración actual en la tabla.
-            table[current_iteration] = {}
-
             try:
                 # Evaluamos el punto inicial en la función g(x) que es equivalente a f(x)
-                x = x0
-                g = eval(function_g)
+                g = evaluate_g(x0)
 
                 # El resultado de la función g evaluada en el x0 lo evaluamos en f(x)
-                x = g
-                f = eval(function_f)
+                f = evaluate_f(g)
             except Exception as e:
                 return {
                     "message_method": f"El x evaluado en g(x) no pertenece al dominio de la función, la descripción de este error fué: {str(e)}.",
@@ -54,32 +125,24 @@ class FixedPointService(IterativeMethod):
                     "root": 0.0,
                 }
 
-            # Guardamos los datos de la iteración actual en la tabla.
-            table[current_iteration]["iteration"] = current_iteration
-            table[current_iteration]["approximate_value"] = g
-            table[current_iteration]["f_evaluated"] = f
-
             # Para la primera iteración, el error se mantiene como infinito (no hay valor previo para comparar).
-            if current_iteration == 1:
-                table[current_iteration]["error"] = current_error
-
             # Calculamos el error como la diferencia absoluta entre el valor aproximado actual y el anterior. (Error de dispersión)
-            else:
+            if current_iteration > 1:
                 if precision:
-                    current_error = abs(
-                        table[current_iteration]["approximate_value"]
-                        - table[current_iteration - 1]["approximate_value"]
-                    )
-                    table[current_iteration]["error"] = current_error
+                    current_error = abs(g - table.last("approximate_value"))
                 else:
                     current_error = abs(
-                        (
-                            table[current_iteration]["approximate_value"]
-                            - table[current_iteration - 1]["approximate_value"]
-                        )
-                        / table[current_iteration]["approximate_value"]
+                        (g - table.last("approximate_value")) / g
                     )
-                    table[current_iteration]["error"] = current_error
+
+            # Guardamos los datos de la iteración actual en la tabla.
+            table.append(
+                current_iteration,
+                approximate_value=g,
+                f_evaluated=f,
+                error=current_error,
+            )
+            yield table.last_row()
 
             # Si la función evaluada en el valor aproximado es cero, hemos encontrado la raíz exacta.
             if f == 0:
@@ -119,6 +182,189 @@ class FixedPointService(IterativeMethod):
             "root": 0.0,
         }
 
+    def iterate_accelerated(
+        self,
+        x0: float,
+        tolerance: float,
+        max_iterations: int,
+        precision: int,
+        evaluate_f,
+        evaluate_g,
+        acceleration: str,
+        retention: RetentionPolicy | None = DEFAULT_RETENTION,
+    ) -> IterationGenerator:
+        # Definición de tabla que contiene todo el proceso; cada fila guarda el iterado sin acelerar y el acelerado.
+        table = IterationTable(
+            ("raw_value", "approximate_value", "f_evaluated", "error"),
+            retention=retention,
+        )
+
+        # Inicializamos el contador de iteraciones para controlar el número máximo de iteraciones permitidas (Criterio pesimista).
+        current_iteration = 1
+
+        # Inicializamos el error actual con infinito para asegurar que el primer cálculo de error sea significativo.
+        current_error = math.inf
+
+        # Contador de evaluaciones de g(x) y últimos tres iterados sin acelerar (para Aitken).
+        function_evaluations = 0
+        raw_values = [x0]
+        # Primer paso |g(x0) - x0| de la iteración sin acelerar, para estimar cuánto habría tardado.
+        first_step = None
+
+        # Ejecutamos el proceso acelerado mientras no se exceda el número máximo de iteraciones.
+        while current_iteration <= max_iterations:
+            try:
+                if acceleration == "steffensen":
+                    # Steffensen: dos evaluaciones de g(x) y se reinicia desde el valor extrapolado.
+                    x1 = evaluate_g(x0)
+                    x2 = evaluate_g(x1)
+                    function_evaluations += 2
+                    raw_value = x2
+                    Xn = aitken_extrapolation(x0, x1, x2)
+                    # Cerca de la raíz los pasos quedan en el nivel del redondeo y su razón ya no dice nada
+                    if function_evaluations == 2 or abs(x2 - x1) > 1e-8 * max(1.0, abs(x2)):
+                        plain_iterates = [x0, x1, x2]
+                else:
+                    # Aitken: una evaluación de g(x) y se extrapola con los tres últimos iterados.
+                    raw_value = evaluate_g(raw_values[-1])
+                    function_evaluations += 1
+                    raw_values = (raw_values + [raw_value])[-3:]
+                    Xn = (
+                        aitken_extrapolation(*raw_values)
+                        if len(raw_values) == 3
+                        else raw_value
+                    )
+                    plain_iterates = raw_values
+
+                # El valor acelerado lo evaluamos en f(x)
+                f = evaluate_f(Xn)
+            except Exception as e:
+                return {
+                    "message_method": f"El x evaluado en g(x) no pertenece al dominio de la función, la descripción de este error fué: {str(e)}.",
+                    "table": table,
+                    "is_successful": True,
+                    "have_solution": False,
+                    "root": 0.0,
+                }
+
+            if first_step is None:
+                first_step = abs(plain_iterates[1] - plain_iterates[0])
+
+            # Para la primera iteración, el error se mantiene como infinito (no hay valor previo para comparar).
+            # Calculamos el error como la diferencia entre el valor acelerado actual y el anterior. (Error de dispersión)
+            if current_iteration > 1:
+                previous_value = table.last("approximate_value")
+                if precision:
+                    current_error = abs(Xn - previous_value)
+                else:
+                    current_error = abs((Xn - previous_value) / Xn)
+
+            # Guardamos los datos de la iteración actual en la tabla.
+            table.append(
+                current_iteration,
+                raw_value=raw_value,
+                approximate_value=Xn,
+                f_evaluated=f,
+                error=current_error,
+            )
+            yield table.last_row()
+
+            # Si f(x) es cero o el error es menor que la tolerancia, aceptamos el valor acelerado como raíz.
+            if f == 0 or current_error < tolerance:
+                plain_evaluations = self.estimate_plain_evaluations(
+                    first_step, plain_iterates, tolerance, max_iterations, precision
+                )
+                if plain_evaluations is None:
+                    comparison = "según su razón de convergencia, la iteración sin acelerar no converge en {} iteraciones".format(
+                        max_iterations
+                    )
+                    saved_evaluations = None
+                else:
+                    saved_evaluations = plain_evaluations - function_evaluations
+                    comparison = "{} evaluaciones menos que la iteración sin acelerar (≈ {} evaluaciones estimadas)".format(
+                        saved_evaluations, plain_evaluations
+                    )
+                if f == 0:
+                    message = "{} es raiz de f(x)".format(Xn)
+                else:
+                    message = "{} es una aproximación de la raiz de f(x) con un error de {}".format(
+                        Xn, current_error
+                    )
+                return {
+                    "message_method": "{} ({}: {} evaluaciones de g(x), {})".format(
+                        message, acceleration.capitalize(), function_evaluations, comparison
+                    ),
+                    "table": table,
+                    "is_successful": True,
+                    "have_solution": True,
+                    "root": Xn,
+                    "function_evaluations": function_evaluations,
+                    "plain_evaluations": plain_evaluations,
+                    "saved_evaluations": saved_evaluations,
+                }
+
+            # Steffensen continúa desde el valor extrapolado.
+            if acceleration == "steffensen":
+                x0 = Xn
+
+            # Incrementamos el contador de iteraciones.
+            current_iteration += 1
+
+        # Si se alcanza el número máximo de iteraciones sin encontrar una raíz, se retorna un mensaje de fallo.
+        return {
+            "message_method": "El método funcionó correctamente pero no se encontró solución para {} iteraciones".format(
+                max_iterations
+            ),
+            "table": table,
+            "is_successful": True,
+            "have_solution": False,
+            "root": 0.0,
+            "function_evaluations": function_evaluations,
+        }
+
+    def estimate_plain_evaluations(
+        self,
+        first_step: float,
+        plain_iterates: list[float],
+        tolerance: float,
+        max_iterations: int,
+        precision: int,
+    ) -> int | None:
+        """
+        Estima las evaluaciones de g(x) que necesitaría la iteración de punto fijo sin acelerar, sin volver a ejecutarla.
+
+        Cerca de la raíz la iteración sin acelerar converge linealmente: cada paso se reduce en la razón q ≈ |x2 - x1| / |x1 - x0| ≈ |g'(raíz)|, así que el paso k mide aproximadamente first_step·q^k y la tolerancia se alcanza tras log(tol / first_step) / log(q) pasos.
+
+        Args:
+            first_step (float): Primer paso |g(x0) - x0| de la iteración sin acelerar.
+            plain_iterates (list[float]): Últimos iterados consecutivos sin acelerar (x, g(x), g(g(x))).
+            tolerance (float): Tolerancia del método.
+            max_iterations (int): Número máximo de iteraciones.
+            precision (int): 1 si el error es absoluto, 0 si es relativo.
+
+        Returns:
+            int | None: Número estimado de evaluaciones, o None si no convergería en el máximo de iteraciones.
+        """
+        if len(plain_iterates) < 3:
+            # La raíz se encontró en la primera evaluación, igual que sin acelerar
+            return len(plain_iterates) - 1
+
+        x0, x1, x2 = plain_iterates
+        target = tolerance if precision else tolerance * abs(x2)
+        if target <= 0:
+            return None
+        if first_step < target or x2 == x1:
+            return 2
+        if x1 == x0:
+            return None
+
+        ratio = abs(x2 - x1) / abs(x1 - x0)
+        if ratio >= 1:
+            return None
+        # En la iteración i el error es el paso i - 1 (la primera iteración no tiene error)
+        evaluations = math.floor(math.log(target / first_step) / math.log(ratio)) + 2
+        return evaluations if evaluations <= max_iterations else None
+
     def validate_input(
         self,
         x0: float,
@@ -129,6 +375,13 @@ class FixedPointService(IterativeMethod):
     ) -> str | bool:
 
         function_g = kwargs.get("function_g")
+        acceleration = kwargs.get("acceleration", "none")
+
+        # Validación del modo de aceleración
+        if acceleration not in ACCELERATION_MODES:
+            return "Error desconocido: el modo de aceleración {} no existe, use uno de {}.".format(
+                acceleration, ", ".join(ACCELERATION_MODES)
+            )
 
         # Validación de los parámetros de entrada tolerancia positiva
         if not isinstance(tolerance, (int, float)) or tolerance <= 0:
@@ -142,11 +395,11 @@ class FixedPointService(IterativeMethod):
 
         # Validación de las funciones ingresadas
         try:
-            x = x0
-            g = eval(function_g)
+            evaluate_f = compile_expression(function_f)
+            evaluate_g = compile_expression(function_g)
+            g = evaluate_g(x0)
 
-            x = g
-            f = eval(function_f)
+            f = evaluate_f(g)
         except ValueError:
             plot_function(function_f, False, [(x0, 0)]);
             return "Error: Valor fuera del dominio permitido para la función (f(x) o g(x)). Verifique que los valores de 'x' sean válidos en el dominio de la función."
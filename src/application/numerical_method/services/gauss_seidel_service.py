@@ -1,6 +1,27 @@
 import numpy as np
+from scipy import sparse
 from src.application.numerical_method.interfaces.matrix_method import MatrixMethod
+from src.application.shared.utils.multicolor import MulticolorSweep
 from src.application.shared.utils.plot_matrix_solution import plot_matrix_solution, plot_system_equations
+from src.application.shared.utils.iteration_table import (
+    DEFAULT_RETENTION,
+    IterationTable,
+    RetentionPolicy,
+    table_components,
+)
+from src.application.shared.utils.sparse_matrix import (
+    dense_rows,
+    triangular_solver,
+    validate_sparse_system,
+)
+from src.application.shared.utils.spectral_radius import (
+    estimate_spectral_radius,
+    spectral_radius_message,
+)
+from src.application.shared.utils.stream_iterations import (
+    IterationGenerator,
+    run_iterations,
+)
 
 
 class GaussSeidelService(MatrixMethod):
@@ -14,59 +35,113 @@ class GaussSeidelService(MatrixMethod):
         precision: int,  # Tipo de precisión (1 para decimales correctos, 0 para cifras significativas)
         **kwargs,
     ) -> dict:
+        return run_iterations(
+            self.iterate(
+                A=A,
+                b=b,
+                x0=x0,
+                tolerance=tolerance,
+                max_iterations=max_iterations,
+                precision=precision,
+                **kwargs,
+            )
+        )
+
+    def iterate(
+        self,
+        A: list[list[float]],  # Matriz de coeficientes
+        b: list[float],  # Vector de términos independientes
+        x0: list[float],  # Vector inicial de aproximación
+        tolerance: float,  # Tolerancia para el error
+        max_iterations: int,  # Número máximo de iteraciones
+        precision: int,  # Tipo de precisión (1 para decimales correctos, 0 para cifras significativas)
+        retention: RetentionPolicy | None = DEFAULT_RETENTION,
+        compute_spectral_radius: bool = True,  # Estimar el radio espectral de T
+        ordering: str = "natural",  # Orden de actualización: "natural" o "multicolor"
+        colors: list[int] | None = None,  # Coloración de las filas para el orden multicolor
+        **kwargs,
+    ) -> IterationGenerator:
 
-        A = np.array(A)
-        b = np.array(b)
-        x0 = np.array(x0)
+        # A puede ser densa (lista de filas) o dispersa (CSR, ver sparse_matrix.py)
+        is_sparse = sparse.issparse(A)
+        A = sparse.csr_matrix(A) if is_sparse else np.array(A, dtype=float)
+        b = np.array(b, dtype=float)
+        x0 = np.array(x0, dtype=float)
 
         n = len(b)
+        components = table_components(n)
         x1 = np.zeros_like(x0)
         current_error = tolerance + 1
         current_iteration = 0
-        table = {}
-
-        # Inicialización de matrices para el cálculo de T y C
-        D = np.diag(np.diag(A))
-        L = np.tril(A, -1)
-        U = np.triu(A, 1)
-
-        # Cálculo de la matriz de iteración T para el método Gauss-Seidel
-        T = np.linalg.inv(D - L).dot(U)
-        spectral_radius = max(abs(np.linalg.eigvals(T)))
+        table = IterationTable(("Error",), vector_columns={"X": components}, retention=retention)
+
+        if ordering == "multicolor":
+            # Orden multicolor: las filas de un mismo color se actualizan juntas (ver multicolor.py)
+            try:
+                multicolor = MulticolorSweep(A, colors=colors)
+            except ValueError as error:
+                return {
+                    "message_method": str(error),
+                    "table": table,
+                    "is_successful": False,
+                    "have_solution": False,
+                    "solution": [],
+                }
+            sweep = multicolor.sweep
+        else:
+            # Cada barrido es una sustitución hacia adelante: (D + L)·x1 = b - U·x0
+            multicolor = None
+            if is_sparse:
+                lower = sparse.tril(A, format="csr")
+                upper = sparse.triu(A, 1, format="csr")
+            else:
+                lower = np.tril(A)
+                upper = np.triu(A, 1)
+
+            solve_lower = triangular_solver(lower, lower=True)
+
+            def sweep(x, rhs):
+                return solve_lower(rhs - upper @ x)
+
+        # T es un barrido con b = 0; se aplica sin invertir D + L
+        spectral_radius = None
+        if compute_spectral_radius:
+            zeros = np.zeros(n)
+            spectral_radius = estimate_spectral_radius(lambda v: sweep(v, zeros), n)
 
         while current_error > tolerance and current_iteration < max_iterations:
             # Iteración de Gauss-Seidel
-            for i in range(n):
-                sum_others = np.dot(A[i, :i], x1[:i]) + np.dot(A[i, i + 1:], x1[i + 1:])
-                x1[i] = (b[i] - sum_others) / A[i, i]
+            x1 = sweep(x0, b)
 
             current_error = np.linalg.norm(x1 - x0, ord=np.inf)
 
-            # Aplicar precisión según el tipo seleccionado
-            if precision == 1:  # Decimales correctos
-                x1_rounded = [round(value, len(str(tolerance).split(".")[1])) for value in x1]
-                error_rounded = round(current_error, len(str(tolerance).split(".")[1]))
-            elif precision == 0:  # Cifras significativas
-                significant_digits = len(str(tolerance).replace("0.", ""))
-                x1_rounded = [float(f"{value:.{significant_digits}g}") for value in x1]
-                error_rounded = float(f"{current_error:.{significant_digits}g}")
+            # Aplicar precisión según el tipo seleccionado (en la tabla solo se guardan las primeras componentes)
+            x1_rounded = self.apply_precision(x1[:components], precision, tolerance)
+            error_rounded = self.apply_precision([current_error], precision, tolerance)[0]
 
             # Guardamos la información de la iteración actual
-            table[current_iteration + 1] = {
-                "iteration": current_iteration + 1,
-                "X": x1_rounded,
-                "Error": error_rounded,
-            }
+            table.append(
+                current_iteration + 1,
+                X=x1_rounded,
+                Error=error_rounded,
+            )
+            yield table.last_row()
 
             # Preparación para la siguiente iteración
             x0 = x1.copy()
             current_iteration += 1
 
+        if current_iteration and components < n:
+            x1_rounded = self.apply_precision(x1, precision, tolerance)
+
         # Verificación de éxito o fallo tras las iteraciones
+        radius_message = spectral_radius_message(spectral_radius, n, compute_spectral_radius)
+        if multicolor is not None:
+            radius_message += f" (orden multicolor con {multicolor.n_colors} colores)"
         result = {}
         if current_error <= tolerance:
             result = {
-                "message_method": f"Aproximación de la solución con tolerancia = {tolerance} y el radio espectral es de = {spectral_radius}",
+                "message_method": f"Aproximación de la solución con tolerancia = {tolerance}{radius_message}",
                 "table": table,
                 "is_successful": True,
                 "have_solution": True,
@@ -75,7 +150,7 @@ class GaussSeidelService(MatrixMethod):
             }
         elif current_iteration >= max_iterations:
             result = {
-                "message_method": f"El método funcionó correctamente, pero no se encontró una solución en {max_iterations} iteraciones y el radio espectral es de = {spectral_radius}.",
+                "message_method": f"El método funcionó correctamente, pero no se encontró una solución en {max_iterations} iteraciones{radius_message}.",
                 "table": table,
                 "is_successful": True,
                 "have_solution": False,
@@ -92,12 +167,25 @@ class GaussSeidelService(MatrixMethod):
             }
 
         # Si la matriz es 2x2, generar las gráficas
-        if len(A) == 2:
+        if n == 2:
             plot_matrix_solution(table, x1_rounded, spectral_radius)
-            plot_system_equations(A.tolist(), b.tolist(), x1_rounded)
+            plot_system_equations(dense_rows(A), b.tolist(), x1_rounded)
 
         return result
 
+    def apply_precision(self, values, precision, tolerance) -> list:
+        """
+        Aplica precisión a una lista de valores basada en el tipo de precisión seleccionado.
+        """
+        values = np.asarray(values).tolist()
+        if precision == 1:  # Decimales correctos
+            decimal_places = len(str(tolerance).split(".")[1])
+            return [round(value, decimal_places) for value in values]
+        elif precision == 0:  # Cifras significativas
+            significant_digits = len(str(tolerance).replace("0.", ""))
+            return [float(f"{value:.{significant_digits}g}") for value in values]
+        return values
+
     def validate_input(
         self,
         matrix_a_raw: str,
@@ -106,6 +194,7 @@ class GaussSeidelService(MatrixMethod):
         tolerance: float,
         max_iterations: int,
         matrix_size: int,
+        matrix_format: str = "dense",
         **kwargs,
     ) -> str | list:
 
@@ -117,6 +206,12 @@ class GaussSeidelService(MatrixMethod):
         if not isinstance(max_iterations, int) or max_iterations <= 0:
             return "El máximo número de iteraciones debe ser un entero positivo."
 
+        # Los formatos dispersos no tienen el límite de 6x6
+        if matrix_format != "dense":
+            return validate_sparse_system(
+                matrix_a_raw, vector_b_raw, initial_guess_raw, matrix_format
+            )
+
         # Validación de las entradas numéricas
         try:
             A = [
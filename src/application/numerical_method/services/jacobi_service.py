@@ -1,6 +1,27 @@
 import numpy as np
+from django.conf import settings
+from scipy import sparse
 from src.application.numerical_method.interfaces.matrix_method import MatrixMethod
 from src.application.shared.utils.plot_matrix_solution import plot_matrix_solution, plot_system_equations
+from src.application.shared.utils.parallel_jacobi import ParallelJacobiSweep
+from src.application.shared.utils.iteration_table import (
+    DEFAULT_RETENTION,
+    IterationTable,
+    RetentionPolicy,
+    table_components,
+)
+from src.application.shared.utils.sparse_matrix import (
+    dense_rows,
+    validate_sparse_system,
+)
+from src.application.shared.utils.spectral_radius import (
+    estimate_spectral_radius,
+    spectral_radius_message,
+)
+from src.application.shared.utils.stream_iterations import (
+    IterationGenerator,
+    run_iterations,
+)
 
 
 class JacobiService(MatrixMethod):
@@ -12,58 +33,123 @@ class JacobiService(MatrixMethod):
         tolerance: float,  # Tolerancia para el error
         max_iterations: int,  # Número máximo de iteraciones
         precision_type: str = "decimales_correctos",  # Tipo de precisión
+        workers: int | None = None,  # Hilos del barrido por bloques; por defecto JACOBI_WORKERS
         **kwargs,
     ) -> dict:
+        return run_iterations(
+            self.iterate(
+                A=A,
+                b=b,
+                x0=x0,
+                tolerance=tolerance,
+                max_iterations=max_iterations,
+                precision_type=precision_type,
+                workers=workers,
+                **kwargs,
+            )
+        )
 
-        A = np.array(A)
-        b = np.array(b)
-        x0 = np.array(x0)
+    def iterate(
+        self,
+        A: list[list[float]],  # Matriz de coeficientes
+        b: list[float],  # Vector de términos independientes
+        x0: list[float],  # Vector inicial de aproximación
+        tolerance: float,  # Tolerancia para el error
+        max_iterations: int,  # Número máximo de iteraciones
+        precision_type: str = "decimales_correctos",  # Tipo de precisión
+        retention: RetentionPolicy | None = DEFAULT_RETENTION,
+        compute_spectral_radius: bool = True,  # Estimar el radio espectral de T
+        workers: int | None = None,  # Hilos del barrido por bloques; por defecto JACOBI_WORKERS
+        **kwargs,
+    ) -> IterationGenerator:
+
+        # A puede ser densa (lista de filas) o dispersa (CSR, ver sparse_matrix.py)
+        is_sparse = sparse.issparse(A)
+        A = sparse.csr_matrix(A) if is_sparse else np.array(A, dtype=float)
+        b = np.array(b, dtype=float)
 
         n = len(b)
-        x1 = np.zeros_like(x0)
+        components = table_components(n)
         current_error = tolerance + 1
         current_iteration = 0
-        table = {}
-
-        # Inicialización de matrices para el cálculo de T y C
-        D = np.diag(np.diag(A))
-        L = np.tril(A, -1)
-        U = np.triu(A, 1)
-
-        # Cálculo de la matriz de iteración T para el método Jacobi
-        T = np.linalg.inv(D).dot(L + U)
-        spectral_radius = max(abs(np.linalg.eigvals(T)))
-
-        while current_error > tolerance and current_iteration < max_iterations:
-            # Iteración de Jacobi
-            for i in range(n):
-                sum_others = np.dot(A[i, :i], x0[:i]) + np.dot(
-                    A[i, i + 1 :], x0[i + 1 :]
-                )
-                x1[i] = (b[i] - sum_others) / A[i, i]
+        table = IterationTable(("Error",), vector_columns={"X": components}, retention=retention)
 
-            current_error = np.linalg.norm(x1 - x0, ord=np.inf)
+        # Cada barrido es un solo producto matriz-vector: x1 = (b - R·x0) / diag(A), con R = L + U
+        inverse_diagonal = 1 / A.diagonal()
+        if is_sparse:
+            R = (A - sparse.diags(A.diagonal())).tocsr()
+            R.eliminate_zeros()
+        else:
+            R = A - np.diag(A.diagonal())
 
-            # Aplicar precisión según el tipo seleccionado
-            formatted_x1 = self.apply_precision(x1.tolist(), precision_type, tolerance)
-            formatted_error = self.apply_precision([current_error], precision_type, tolerance)[0]
+        # T = D⁻¹·R se aplica sin formarla; la estimación se omite si no se pide
+        spectral_radius = None
+        if compute_spectral_radius:
+            spectral_radius = estimate_spectral_radius(
+                lambda v: inverse_diagonal * (R @ v), n
+            )
 
-            # Guardamos la información de la iteración actual
-            table[current_iteration + 1] = {
-                "iteration": current_iteration + 1,
-                "X": formatted_x1,
-                "Error": formatted_error,
-            }
+        # Dos vectores preasignados que se intercambian en cada iteración, más uno para la diferencia
+        x0 = np.array(x0, dtype=float)
+        x1 = np.empty_like(x0)
+        difference = np.empty_like(x0)
+
+        # En sistemas grandes, densos o dispersos, el barrido se hace por bloques de filas repartidos entre
+        # varios hilos (ver parallel_jacobi.py); los bloques no dependen de los hilos, así que el resultado tampoco
+        if workers is None:
+            workers = settings.JACOBI_WORKERS
+        parallel_sweep = None
+        nonzeros = R.nnz if is_sparse else n * n
+        if nonzeros >= settings.JACOBI_PARALLEL_MIN_NONZEROS:
+            parallel_sweep = ParallelJacobiSweep(R, inverse_diagonal, b, workers)
+
+        try:
+            while current_error > tolerance and current_iteration < max_iterations:
+                # Iteración de Jacobi
+                if parallel_sweep is not None:
+                    current_error = parallel_sweep.sweep(x0, x1)
+                else:
+                    if is_sparse:
+                        np.subtract(b, R @ x0, out=x1)
+                    else:
+                        np.dot(R, x0, out=x1)
+                        np.subtract(b, x1, out=x1)
+                    np.multiply(x1, inverse_diagonal, out=x1)
+
+                    np.subtract(x1, x0, out=difference)
+                    current_error = np.linalg.norm(difference, ord=np.inf)
+
+                # Aplicar precisión según el tipo seleccionado (en la tabla solo se guardan las primeras componentes)
+                formatted_x1 = self.apply_precision(x1[:components].tolist(), precision_type, tolerance)
+                formatted_error = self.apply_precision([current_error], precision_type, tolerance)[0]
 
-            # Preparación para la siguiente iteración
-            x0 = x1.copy()
-            current_iteration += 1
+                # Guardamos la información de la iteración actual
+                table.append(
+                    current_iteration + 1,
+                    X=formatted_x1,
+                    Error=formatted_error,
+                )
+                yield table.last_row()
+
+                # Preparación para la siguiente iteración: x0 pasa a ser la aproximación recién calculada
+                x0, x1 = x1, x0
+                current_iteration += 1
+        finally:
+            # También si el cliente deja de leer la transmisión y el generador se cierra
+            if parallel_sweep is not None:
+                parallel_sweep.close()
+
+        if current_iteration and components < n:
+            formatted_x1 = self.apply_precision(x0.tolist(), precision_type, tolerance)
 
         # Verificación de éxito o fallo tras las iteraciones
+        radius_message = spectral_radius_message(spectral_radius, n, compute_spectral_radius)
+        if parallel_sweep is not None:
+            radius_message += f" (barrido por bloques de filas con {parallel_sweep.workers} hilos)"
         result = {}
         if current_error <= tolerance:
             result = {
-                "message_method": f"Aproximación de la solución con tolerancia = {tolerance} y el radio espectral es de = {spectral_radius}",
+                "message_method": f"Aproximación de la solución con tolerancia = {tolerance}{radius_message}",
                 "table": table,
                 "is_successful": True,
                 "have_solution": True,
@@ -72,7 +158,7 @@ class JacobiService(MatrixMethod):
             }
         elif current_iteration >= max_iterations:
             result = {
-                "message_method": f"El método funcionó correctamente, pero no se encontró una solución en {max_iterations} iteraciones y el radio espectral es de = {spectral_radius}.",
+                "message_method": f"El método funcionó correctamente, pero no se encontró una solución en {max_iterations} iteraciones{radius_message}.",
                 "table": table,
                 "is_successful": True,
                 "have_solution": False,
@@ -89,9 +175,9 @@ class JacobiService(MatrixMethod):
             }
 
         # Si la matriz es 2x2, generar la gráfica
-        if len(A) == 2:
-            plot_matrix_solution(table, x1.tolist(), spectral_radius)
-            plot_system_equations(A.tolist(), b.tolist(), x1.tolist())
+        if n == 2:
+            plot_matrix_solution(table, x0.tolist(), spectral_radius)
+            plot_system_equations(dense_rows(A), b.tolist(), x0.tolist())
 
         return result
 
@@ -119,6 +205,8 @@ class JacobiService(MatrixMethod):
         tolerance: float,
         max_iterations: int,
         matrix_size: int,
+        matrix_format: str = "dense",
+        workers: int | None = None,
         **kwargs,
     ) -> str | list:
 
@@ -130,6 +218,16 @@ class JacobiService(MatrixMethod):
         if not isinstance(max_iterations, int) or max_iterations <= 0:
             return "El máximo número de iteraciones debe ser un entero positivo."
 
+        # Validación del número de hilos del barrido por bloques (opcional)
+        if workers is not None and (not isinstance(workers, int) or workers <= 0):
+            return "El número de hilos debe ser un entero positivo."
+
+        # Los formatos dispersos no tienen el límite de 6x6; un archivo Matrix Market "array" se deja denso
+        if matrix_format != "dense":
+            return validate_sparse_system(
+                matrix_a_raw, vector_b_raw, initial_guess_raw, matrix_format, keep_dense=True
+            )
+
         # Validación de las entradas numéricas
         try:
             A = [
@@ -1,12 +1,24 @@
-import sympy as sp
 import math
 from src.application.numerical_method.interfaces.iterative_method import (
     IterativeMethod,
 )
-from src.application.shared.utils.convert_math_to_simply import convert_math_to_sympy
+from src.application.shared.utils.compile_derivatives import compile_derivatives
 from src.application.shared.utils.plot_function import plot_function
+from src.application.shared.utils.iteration_table import (
+    DEFAULT_RETENTION,
+    IterationTable,
+    RetentionPolicy,
+)
+from src.application.shared.utils.stream_iterations import (
+    IterationGenerator,
+    run_iterations,
+)
 
 class MultipleRoots2Service(IterativeMethod):
+    def __init__(self, derivative_engine: str = "automatic"):
+        # Motor de derivación: "automatic" (números duales) o "sympy" (derivación simbólica)
+        self.derivative_engine = derivative_engine
+
     def solve(
         self,
         x0: float,
@@ -16,24 +28,43 @@ class MultipleRoots2Service(IterativeMethod):
         function_f: str,
         **kwargs,
     ) -> dict:
-        # Inicializa la variable simbólica para usar en SymPy
-        x = sp.symbols("x")
-
-        # Convierte la función ingresada de `math` a `SymPy`
-        sympy_function_f = convert_math_to_sympy(function_f)
-
-        # Intenta convertir la función a una expresión simbólica usando sympify
-        f_expr = sp.sympify(sympy_function_f)
-        f_prime_expr = sp.diff(f_expr, x)  # Primera derivada
-        f_double_prime_expr = sp.diff(f_prime_expr, x)  # Segunda derivada
-
-        # Crea funciones evaluables en Python utilizando lambdify
-        f = sp.lambdify(x, f_expr, modules=["math"])
-        f_prime = sp.lambdify(x, f_prime_expr, modules=["math"])
-        f_double_prime = sp.lambdify(x, f_double_prime_expr, modules=["math"])
+        return run_iterations(
+            self.iterate(
+                x0=x0,
+                tolerance=tolerance,
+                max_iterations=max_iterations,
+                precision=precision,
+                function_f=function_f,
+                **kwargs,
+            )
+        )
+
+    def iterate(
+        self,
+        x0: float,
+        tolerance: float,
+        max_iterations: int,
+        precision: int,
+        function_f: str,
+        retention: RetentionPolicy | None = DEFAULT_RETENTION,
+        **kwargs,
+    ) -> IterationGenerator:
+        # Obtiene f(x) y sus dos primeras derivadas en una sola evaluación (desde la caché de derivadas)
+        derivatives = compile_derivatives(function_f, self.derivative_engine)
+        evaluate = derivatives["evaluate"]
 
         # Definición de tabla que contiene todo el proceso
-        table = {}
+        table = IterationTable(
+            (
+                "approximate_value",
+                "f_evaluated",
+                "f_prime_evaluated",
+                "f_double_prime_evaluated",
+                "next_x",
+                "error",
+            ),
+            retention=retention,
+        )
 
         # Inicializa el valor inicial y error actual
         x0_current = x0
@@ -43,9 +74,7 @@ class MultipleRoots2Service(IterativeMethod):
         # Bucle del método de raíces múltiples con segunda derivada
         while current_iteration <= max_iterations:
             try:
-                fx = f(x0_current)
-                f_prime_x = f_prime(x0_current)
-                f_double_prime_x = f_double_prime(x0_current)
+                fx, f_prime_x, f_double_prime_x = evaluate(x0_current, 2)
 
                 if f_prime_x == 0 or f_double_prime_x == 0:
                     return {
@@ -69,25 +98,24 @@ class MultipleRoots2Service(IterativeMethod):
                     "root": 0.0,
                 }
 
-            # Guardar los datos de la iteración actual en la tabla
-            table[current_iteration] = {
-                "iteration": current_iteration,
-                "approximate_value": x0_current,
-                "f_evaluated": fx,
-                "f_prime_evaluated": f_prime_x,
-                "f_double_prime_evaluated": f_double_prime_x,
-                "next_x": x_next,
-            }
-
-            # Calcular el error dependiendo de la precisión
+            # Calcular el error dependiendo de la precisión; en la primera iteración se mantiene infinito.
             if current_iteration > 1:
                 if precision:  # Error absoluto
                     current_error = abs(x_next - x0_current)
                 else:  # Error relativo
                     current_error = abs((x_next - x0_current) / x_next)
-                table[current_iteration]["error"] = current_error
-            else:
-                table[current_iteration]["error"] = current_error  # Primera iteración
+
+            # Guardar los datos de la iteración actual en la tabla
+            table.append(
+                current_iteration,
+                approximate_value=x0_current,
+                f_evaluated=fx,
+                f_prime_evaluated=f_prime_x,
+                f_double_prime_evaluated=f_double_prime_x,
+                next_x=x_next,
+                error=current_error,
+            )
+            yield table.last_row()
 
             # Verificar si se ha encontrado una raíz exacta o una aproximación aceptable
             if fx == 0:
@@ -128,11 +156,6 @@ class MultipleRoots2Service(IterativeMethod):
         function_f: str,
         **kwargs,
     ) -> str | bool:
-        # Inicializa la variable simbólica para usar en SymPy
-        x = sp.symbols("x")
-        # Convierte la función ingresada de `math` a `SymPy`
-        sympy_function_f = convert_math_to_sympy(function_f)
-
         # Validación de los parámetros de entrada tolerancia positiva
         if not isinstance(tolerance, (int, float)) or tolerance <= 0:
             plot_function(function_f, False, [(x0, 0)])
@@ -144,19 +167,10 @@ class MultipleRoots2Service(IterativeMethod):
             return "El máximo número de iteraciones debe ser un entero positivo."
 
         try:
-            f_expr = sp.sympify(sympy_function_f)
-            if f_expr.free_symbols != {x}:
+            derivatives = compile_derivatives(function_f, self.derivative_engine)
+            if not derivatives["uses_x"]:
                 return "Error al interpretar la función: utilice la variable 'x'."
-            f_prime_expr = sp.diff(f_expr, x)
-            f_double_prime_expr = sp.diff(f_prime_expr, x)
         except Exception as e:
             return f"Error al interpretar o derivar la función ingresada: {str(e)}."
 
-        try:
-            sp.lambdify(x, f_expr, modules=["math"])
-            sp.lambdify(x, f_prime_expr, modules=["math"])
-            sp.lambdify(x, f_double_prime_expr, modules=["math"])
-        except Exception as e:
-            return f"Error al convertir la función o sus derivadas a formato numérico: {str(e)}."
-
         return True
@@ -1,13 +1,25 @@
-import sympy as sp
 import math
+from collections import deque
 from src.application.numerical_method.interfaces.iterative_method import (
     IterativeMethod,
 )
-from src.application.shared.utils.convert_math_to_simply import convert_math_to_sympy
+from src.application.shared.utils.compile_derivatives import compile_derivatives
 from src.application.shared.utils.plot_function import plot_function
+from src.application.shared.utils.iteration_table import (
+    DEFAULT_RETENTION,
+    IterationTable,
+    RetentionPolicy,
+)
+from src.application.shared.utils.stream_iterations import (
+    IterationGenerator,
+    run_iterations,
+)
 
 
 class NewtonService(IterativeMethod):
+    def __init__(self, derivative_engine: str = "automatic"):
+        # Motor de derivación: "automatic" (números duales) o "sympy" (derivación simbólica)
+        self.derivative_engine = derivative_engine
 
     def solve(
         self,
@@ -18,30 +30,55 @@ class NewtonService(IterativeMethod):
         function_f: str,
         **kwargs,
     ) -> dict:
-        # Inicializa la variable simbólica para usar en SymPy
-        x = sp.symbols("x")
-        # Convierte la función ingresada de `math` a `SymPy`
-        sympy_function_f = convert_math_to_sympy(function_f)
-        # Intenta convertir la función a una expresión simbólica usando sympify
-        f_expr = sp.sympify(sympy_function_f)
-        f_prime_expr = sp.diff(f_expr, x)  # Calcular la derivada simbólicamente
-        # Crea funciones evaluables en Python utilizando lambdify
-        f = sp.lambdify(x, f_expr, modules=["math"])
-        f_prime = sp.lambdify(x, f_prime_expr, modules=["math"])
+        return run_iterations(
+            self.iterate(
+                x0=x0,
+                tolerance=tolerance,
+                max_iterations=max_iterations,
+                precision=precision,
+                function_f=function_f,
+                **kwargs,
+            )
+        )
+
+    def iterate(
+        self,
+        x0: float,
+        tolerance: float,
+        max_iterations: int,
+        precision: int,
+        function_f: str,
+        retention: RetentionPolicy | None = DEFAULT_RETENTION,
+        **kwargs,
+    ) -> IterationGenerator:
+        # Obtiene f(x) y su derivada en una sola evaluación (desde la caché de derivadas)
+        derivatives = compile_derivatives(function_f, self.derivative_engine)
+        evaluate = derivatives["evaluate"]
 
         # Definición de tabla que contiene todo el proceso
-        table = {}
+        table = IterationTable(
+            (
+                "approximate_value",
+                "f_evaluated",
+                "f_prime_evaluated",
+                "next_x",
+                "error",
+            ),
+            retention=retention,
+        )
         # Inicializa el valor inicial y error actual
         x0_current = x0
         current_error = math.inf
         current_iteration = 1
-        points = [(x0_current, 0)]  # Para graficar
+        # Para graficar; con una política de retención solo se conservan los últimos puntos.
+        points = deque(
+            [(x0_current, 0)], maxlen=retention.max_rows if retention else None
+        )
 
         while current_iteration <= max_iterations:
             # Evaluar f(x) y f'(x) en el valor actual de x0
             try:
-                fx = f(x0_current)
-                f_prime_x = f_prime(x0_current)
+                fx, f_prime_x = evaluate(x0_current, 1)
                 if f_prime_x == 0:
                     return self._prepare_response(
                         message=f"La derivada es cero en x = {x0_current}. No se puede continuar.",
@@ -70,14 +107,15 @@ class NewtonService(IterativeMethod):
                 else abs((x_next - x0_current) / x_next)  # Error relativo
             )
 
-            table[current_iteration] = {
-                "iteration": current_iteration,
-                "approximate_value": x0_current,
-                "f_evaluated": fx,
-                "f_prime_evaluated": f_prime_x,
-                "next_x": x_next,
-                "error": error_value,
-            }
+            table.append(
+                current_iteration,
+                approximate_value=x0_current,
+                f_evaluated=fx,
+                f_prime_evaluated=f_prime_x,
+                next_x=x_next,
+                error=error_value,
+            )
+            yield table.last_row()
             points.append((x0_current, fx))  # Agregar puntos para graficar
 
             # Verificar si se ha encontrado una raíz exacta o una aproximación aceptable
@@ -108,10 +146,10 @@ class NewtonService(IterativeMethod):
     def _prepare_response(
         self,
         message: str,
-        table: dict,
+        table: IterationTable,
         is_successful: bool,
         have_solution: bool,
-        points: list,
+        points: deque,
         function: str,
     ) -> dict:
         """Prepara la respuesta y genera la gráfica de la función."""
@@ -137,9 +175,6 @@ class NewtonService(IterativeMethod):
         **kwargs,
     ) -> str | bool:
         # Validaciones
-        x = sp.symbols("x")
-        sympy_function_f = convert_math_to_sympy(function_f)
-
         if not isinstance(tolerance, (int, float)) or tolerance <= 0:
             plot_function(function_f, False, [(x0, 0)])
             return "La tolerancia debe ser un número positivo"
@@ -149,10 +184,9 @@ class NewtonService(IterativeMethod):
             return "El máximo número de iteraciones debe ser un entero positivo."
 
         try:
-            f_expr = sp.sympify(sympy_function_f)
-            if f_expr.free_symbols != {x}:
+            derivatives = compile_derivatives(function_f, self.derivative_engine)
+            if not derivatives["uses_x"]:
                 return "Error al interpretar la función: utilice la variable 'x'."
-            sp.diff(f_expr, x)
         except Exception as e:
             return f"Error al interpretar la función ingresada: {str(e)}."
 
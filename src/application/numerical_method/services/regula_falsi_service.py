@@ -1,5 +1,18 @@
 import math
 from src.application.shared.utils.plot_function import plot_function
+from src.application.shared.utils.compile_expression import compile_expression
+from src.application.shared.utils.iteration_table import (
+    DEFAULT_RETENTION,
+    IterationTable,
+    RetentionPolicy,
+)
+from src.application.shared.utils.stream_iterations import (
+    IterationGenerator,
+    run_iterations,
+)
+from src.application.shared.utils.convergence_order import (
+    estimate_convergence_order,
+)
 from src.application.numerical_method.interfaces.interval_method import (
     IntervalMethod,
 )
@@ -8,9 +21,30 @@ from src.application.numerical_method.interfaces.interval_method import (
 
 El método de regla falsa es una técnica numérica para encontrar raíces de ecuaciones no lineales en un intervalo [a,b], donde la función f(x) es continua y se cumple que f(a)×f(b)<0, lo que indica la existencia de al menos una raíz. El proceso consiste en calcular el punto de intersección de la linea secante entre (a,f(a)) y (b,f(b)) con el eje x (c=(a*f(b)-b*f(a))/(f(b)-f(a))) y evaluar la función en este punto. Si f(c) es cero, c es la raíz. De lo contrario, se elige el subintervalo [a,c] o [c,b] donde la multiplicación de las funciones cambia de signo, y se repite el proceso hasta aproximar la raíz con la precisión deseada.
 
+En la regla falsa clásica un extremo puede quedar fijo durante muchas iteraciones cuando la función es convexa o cóncava, y la convergencia es lineal. Las variantes Illinois, Pegasus y Anderson-Björck multiplican el valor f del extremo que se retiene dos veces seguidas por un factor m<1, lo que desplaza la secante hacia la raíz y da convergencia superlineal con una sola evaluación de la función por iteración.
+
 """
 
 
+# Factor m con el que se escala f del extremo retenido, a partir de f del extremo reemplazado y f(Xn).
+REGULA_FALSI_VARIANTS = {
+    "plain": lambda f_replaced, f: 1.0,
+    "illinois": lambda f_replaced, f: 0.5,
+    "pegasus": lambda f_replaced, f: f_replaced / (f_replaced + f),
+    "anderson_bjorck": lambda f_replaced, f: (
+        1 - f / f_replaced if 1 - f / f_replaced > 0 else 0.5
+    ),
+}
+
+# Orden de convergencia teórico de cada variante.
+REGULA_FALSI_ORDERS = {
+    "plain": 1.0,
+    "illinois": 1.442,
+    "pegasus": 1.642,
+    "anderson_bjorck": 1.7,
+}
+
+
 class RegulaFalsiService(IntervalMethod):
     def solve(
         self,
@@ -20,13 +54,39 @@ class RegulaFalsiService(IntervalMethod):
         max_iterations: int,
         function_f: str,
         precision: int,
+        variant: str = "plain",
     ) -> dict:
+        return run_iterations(
+            self.iterate(
+                interval_a=interval_a,
+                interval_b=interval_b,
+                tolerance=tolerance,
+                max_iterations=max_iterations,
+                function_f=function_f,
+                precision=precision,
+                variant=variant,
+            )
+        )
+
+    def iterate(
+        self,
+        interval_a: float,
+        interval_b: float,
+        tolerance: float,
+        max_iterations: int,
+        function_f: str,
+        precision: int,
+        variant: str = "plain",
+        retention: RetentionPolicy | None = DEFAULT_RETENTION,
+    ) -> IterationGenerator:
 
         # Definición del intervalo inicial.
         interval = [interval_a, interval_b]
 
         # Definición de tabla que contiene todo el proceso
-        table = {}
+        table = IterationTable(
+            ("approximate_value", "f_evaluated", "error"), retention=retention
+        )
 
         # Inicializamos el contador de iteraciones para controlar el número máximo de iteraciones permitidas (Criterio pesimista).
         current_iteration = 1
@@ -34,11 +94,17 @@ class RegulaFalsiService(IntervalMethod):
         # Inicializamos el error actual con infinito para asegurar que el primer cálculo de error sea significativo.
         current_error = math.inf
 
+        # Compilamos la función una sola vez para evaluarla en cada iteración sin volver a interpretarla.
+        evaluate_f = compile_expression(function_f)
+
         # Evaluamos la función en los extremos del intervalo para verificar si alguno de ellos es una raíz exacta.
-        x = interval[0]
-        fa = eval(function_f)
-        x = interval[1]
-        fb = eval(function_f)
+        fa = evaluate_f(interval[0])
+        fb = evaluate_f(interval[1])
+        function_evaluations = 2
+
+        # Factor de escala de la variante elegida y extremo retenido en la iteración anterior ("a" o "b").
+        scale_factor = REGULA_FALSI_VARIANTS[variant]
+        retained_side = None
 
         # Si el valor en el extremo inferior es cero, ese punto es una raíz.
         if fa == 0:
@@ -50,6 +116,8 @@ class RegulaFalsiService(IntervalMethod):
                 "is_successful": True,
                 "have_solution": True,
                 "root": interval[0],
+                "function_evaluations": function_evaluations,
+                "convergence_order": None,
             }
 
         # Si el valor en el extremo superior es cero, ese punto es una raíz.
@@ -62,19 +130,18 @@ class RegulaFalsiService(IntervalMethod):
                 "is_successful": True,
                 "have_solution": True,
                 "root": interval[1],
+                "function_evaluations": function_evaluations,
+                "convergence_order": None,
             }
 
         # Ejecutamos el proceso de regla falsa mientras no se exceda el número máximo de iteraciones.
         while current_iteration <= max_iterations:
-            # Almacenamos la información de la iteración actual en la tabla.
-            table[current_iteration] = {}
-
             # Calculamos el valor aproximado que se obtiene a partir de la intersección de y=0 y la recta secante utilizando el intervalo actual del intervalo actual.
             Xn = (interval[0] * fb - interval[1] * fa) / (fb - fa)
 
             try:
-                x = Xn
-                f = eval(function_f)
+                f = evaluate_f(Xn)
+                function_evaluations += 1
             except Exception as e:
                 return {
                     "message_method": f"Error al evaluar la función en Xn: {str(e)}.",
@@ -82,83 +149,96 @@ class RegulaFalsiService(IntervalMethod):
                     "is_successful": True,
                     "have_solution": False,
                     "root": 0.0,
+                    "function_evaluations": function_evaluations,
+                    "convergence_order": None,
                 }
 
-            # Guardamos los datos de la iteración actual en la tabla.
-            table[current_iteration]["iteration"] = current_iteration
-            table[current_iteration]["approximate_value"] = Xn
-            table[current_iteration]["f_evaluated"] = f
-
             # Para la primera iteración, el error se mantiene como infinito (no hay valor previo para comparar).
-            if current_iteration == 1:
-                table[current_iteration]["error"] = current_error
-
             # Calculamos el error como la diferencia absoluta entre el valor aproximado actual y el anterior. (Error de dispersión)
-            else:
+            if current_iteration > 1:
                 if precision:
-                    current_error = abs(
-                        table[current_iteration]["approximate_value"]
-                        - table[current_iteration - 1]["approximate_value"]
-                    )
-                    table[current_iteration]["error"] = current_error
+                    current_error = abs(Xn - table.last("approximate_value"))
                 else:
                     current_error = abs(
-                        (
-                            table[current_iteration]["approximate_value"]
-                            - table[current_iteration - 1]["approximate_value"]
-                        )
-                        / table[current_iteration]["approximate_value"]
+                        (Xn - table.last("approximate_value")) / Xn
                     )
-                    table[current_iteration]["error"] = current_error
+
+            # Guardamos los datos de la iteración actual en la tabla.
+            table.append(
+                current_iteration,
+                approximate_value=Xn,
+                f_evaluated=f,
+                error=current_error,
+            )
+            yield table.last_row()
 
             # Si la función evaluada en el valor aproximado es cero, hemos encontrado la raíz exacta.
             if f == 0:
                 return {
-                    "message_method": "{} es raiz de f(x)".format(Xn),
+                    "message_method": "{} es raiz de f(x) ({} evaluaciones de la función)".format(
+                        Xn, function_evaluations
+                    ),
                     "table": table,
                     "is_successful": True,
                     "have_solution": True,
                     "root": Xn,
+                    "function_evaluations": function_evaluations,
+                    "convergence_order": estimate_convergence_order(table),
                 }
 
             # Si el error es menor que la tolerancia especificada, aceptamos el valor aproximado como una aproximación de la raíz.
             elif current_error < tolerance:
+                convergence_order = estimate_convergence_order(table)
                 return {
-                    "message_method": "{} es una aproximación de la raiz de f(x) con un error de {}".format(
-                        Xn, current_error
+                    "message_method": "{} es una aproximación de la raiz de f(x) con un error de {} ({} evaluaciones de la función, orden de convergencia estimado {}, teórico {})".format(
+                        Xn,
+                        current_error,
+                        function_evaluations,
+                        (
+                            round(convergence_order, 3)
+                            if convergence_order is not None
+                            else "no disponible"
+                        ),
+                        REGULA_FALSI_ORDERS[variant],
                     ),
                     "table": table,
                     "is_successful": True,
                     "have_solution": True,
                     "root": Xn,
+                    "function_evaluations": function_evaluations,
+                    "convergence_order": convergence_order,
                 }
 
-            # Si el producto f(a) * f(Xn) es negativo, la raíz está en el subintervalo [a, Xn].
+            # Si el producto f(a) * f(Xn) es negativo, la raíz está en el subintervalo [a, Xn] y se retiene el extremo a.
             elif fa * f < 0:
+                if retained_side == "a":
+                    fa *= scale_factor(fb, f)
                 interval = [interval[0], Xn]
+                fb = f
+                retained_side = "a"
 
-            # Si el producto f(b) * f(Xn) es negativo, la raíz está en el subintervalo [Xn, b].
-            elif fb * f < 0:
+            # En otro caso la raíz está en el subintervalo [Xn, b] y se retiene el extremo b.
+            else:
+                if retained_side == "b":
+                    fb *= scale_factor(fa, f)
                 interval = [Xn, interval[1]]
-
-            # Se evalua la función en el nuevo intervalo
-            x = interval[0]
-            fa = eval(function_f)
-            x = interval[1]
-            fb = eval(function_f)
+                fa = f
+                retained_side = "b"
 
             # Incrementamos el contador de iteraciones.
             current_iteration += 1
 
         # Si se alcanza el número máximo de iteraciones sin encontrar una raíz, se retorna un mensaje de fallo.
         return {
-            "message_method": "El método funcionó correctamente pero no se encontró solución para {} iteraciones".format(
-                max_iterations
+            "message_method": "El método funcionó correctamente pero no se encontró solución para {} iteraciones ({} evaluaciones de la función)".format(
+                max_iterations, function_evaluations
             ),
             "table": table,
             "is_successful": True,
             "have_solution": False,
             "root": 0.0,
+            "function_evaluations": function_evaluations,
+            "convergence_order": estimate_convergence_order(table),
         }
 
     def validate_input(
@@ -168,8 +248,15 @@ class RegulaFalsiService(IntervalMethod):
         tolerance: float,
         max_iterations: int,
         function_f: str,
+        variant: str = "plain",
     ) -> str | bool:
 
+        # Validación de la variante del método
+        if variant not in REGULA_FALSI_VARIANTS:
+            return "Error desconocido: la variante {} no existe, use una de {}.".format(
+                variant, ", ".join(REGULA_FALSI_VARIANTS)
+            )
+
         # Validación de los parámetros de entrada tolerancia positiva
         if not isinstance(tolerance, (int, float)) or tolerance <= 0:
             plot_function(function_f, False, [(interval_a, 0), (interval_b, 0)]);
@@ -182,10 +269,9 @@ class RegulaFalsiService(IntervalMethod):
 
         # Validación de la función ingresada
         try:
-            x = interval_a
-            fa = eval(function_f)
-            x = interval_b
-            fb = eval(function_f)
+            evaluate_f = compile_expression(function_f)
+            fa = evaluate_f(interval_a)
+            fb = evaluate_f(interval_b)
 
         except ValueError:
             plot_function(function_f, False, [(interval_a, 0), (interval_b, 0)]);
@@ -3,6 +3,16 @@ from src.application.numerical_method.interfaces.interval_method import (
     IntervalMethod,
 )
 from src.application.shared.utils.plot_function import plot_function
+from src.application.shared.utils.compile_expression import compile_expression
+from src.application.shared.utils.iteration_table import (
+    DEFAULT_RETENTION,
+    IterationTable,
+    RetentionPolicy,
+)
+from src.application.shared.utils.stream_iterations import (
+    IterationGenerator,
+    run_iterations,
+)
 """
 El método de la secante es una técnica numérica para encontrar raíces de ecuaciones no lineales utilizando dos puntos iniciales interval_a y interval_b. La idea es aproximar la raíz mediante la intersección de la recta secante entre (a, f(a)) y (b, f(b)) con el eje x, y luego usar este nuevo punto como base para iterar el proceso hasta alcanzar una tolerancia deseada.
 """
@@ -18,26 +28,48 @@ class SecantService(IntervalMethod):
         function_f: str,
         **kwargs,
     ) -> dict:
+        return run_iterations(
+            self.iterate(
+                x0=x0,
+                tolerance=tolerance,
+                max_iterations=max_iterations,
+                precision=precision,
+                function_f=function_f,
+                **kwargs,
+            )
+        )
+
+    def iterate(
+        self,
+        x0: float,
+        tolerance: float,
+        max_iterations: int,
+        precision: int,
+        function_f: str,
+        retention: RetentionPolicy | None = DEFAULT_RETENTION,
+        **kwargs,
+    ) -> IterationGenerator:
 
         interval_a = x0
         interval_b = kwargs.get("interval_b")
 
         # Definición de tabla que contiene todo el proceso
-        table = {}
+        table = IterationTable(
+            ("a", "b", "f_a", "f_b", "approximate_value", "f_evaluated", "error"),
+            retention=retention,
+        )
         # Inicializamos el contador de iteraciones para controlar el número máximo de iteraciones permitidas.
         current_iteration = 1
         # Inicializamos el error actual con infinito para asegurar que el primer cálculo de error sea significativo.
         current_error = math.inf
+        # Compilamos la función una sola vez para evaluarla en cada iteración sin volver a interpretarla.
+        evaluate_f = compile_expression(function_f)
         # Evaluamos la función en los puntos iniciales interval_a y interval_b
-        x = interval_a
-        f_a = eval(function_f)
-        x = interval_b
-        f_b = eval(function_f)
+        f_a = evaluate_f(interval_a)
+        f_b = evaluate_f(interval_b)
 
         # Bucle del método de la secante
         while current_iteration <= max_iterations:
-            # Almacenamos la información de la iteración actual en la tabla.
-            table[current_iteration] = {}
             # Comprobamos si se puede continuar con la fórmula de la secante
             if f_b - f_a == 0:
                 return {
@@ -51,8 +83,7 @@ class SecantService(IntervalMethod):
             Xn = interval_b - (f_b * (interval_b - interval_a) / (f_b - f_a))
             # Evaluamos la función en el nuevo valor aproximado
             try:
-                x = Xn
-                f = eval(function_f)
+                f = evaluate_f(Xn)
             except Exception as e:
                 return {
                     "message_method": f"Error al evaluar la función en el punto aproximado: {str(e)}.",
@@ -61,33 +92,25 @@ class SecantService(IntervalMethod):
                     "have_solution": False,
                     "root": 0.0,
                 }
-            # Guardamos los datos de la iteración actual en la tabla.
-            table[current_iteration]["iteration"] = current_iteration
-            table[current_iteration]["a"] = interval_a
-            table[current_iteration]["b"] = interval_b
-            table[current_iteration]["f(a)"] = f_a
-            table[current_iteration]["f(b)"] = f_b
-            table[current_iteration]["approximate_value"] = Xn
-            table[current_iteration]["f_evaluated"] = f
             # Para la primera iteración, el error se mantiene como infinito (no hay valor previo para comparar).
-            if current_iteration == 1:
-                table[current_iteration]["error"] = current_error
             # Calculamos el error dependiendo de la precisión
-            else:
+            if current_iteration > 1:
                 if precision:  # Precisión absoluta
-                    current_error = abs(
-                        table[current_iteration]["approximate_value"]
-                        - table[current_iteration - 1]["approximate_value"]
-                    )
+                    current_error = abs(Xn - table.last("approximate_value"))
                 else:  # Precisión relativa
-                    current_error = abs(
-                        (
-                            table[current_iteration]["approximate_value"]
-                            - table[current_iteration - 1]["approximate_value"]
-                        )
-                        / table[current_iteration]["approximate_value"]
-                    )
-                table[current_iteration]["error"] = current_error
+                    current_error = abs((Xn - table.last("approximate_value")) / Xn)
+            # Guardamos los datos de la iteración actual en la tabla.
+            table.append(
+                current_iteration,
+                a=interval_a,
+                b=interval_b,
+                f_a=f_a,
+                f_b=f_b,
+                approximate_value=Xn,
+                f_evaluated=f,
+                error=current_error,
+            )
+            yield table.last_row()
             # Si la función evaluada en el valor aproximado es cero, hemos encontrado la raíz exacta.
             if f == 0:
                 return {
@@ -113,10 +136,8 @@ class SecantService(IntervalMethod):
             interval_b = Xn
             # Re-evaluar las funciones en los nuevos puntos
             try:
-                x = interval_a
-                f_a = eval(function_f)
-                x = interval_b
-                f_b = eval(function_f)
+                f_a = evaluate_f(interval_a)
+                f_b = evaluate_f(interval_b)
             except Exception as e:
                 return {
                     "message_method": f"Error durante la evaluación en el nuevo intervalo: {str(e)}.",
@@ -160,10 +181,9 @@ class SecantService(IntervalMethod):
         # Evaluamos la función en los puntos iniciales interval_a y interval_b
         
         try:
-            x = interval_a
-            f_a = eval(function_f)
-            x = interval_b
-            f_b = eval(function_f)
+            evaluate_f = compile_expression(function_f)
+            f_a = evaluate_f(interval_a)
+            f_b = evaluate_f(interval_b)
         except ValueError as ve:
             plot_function(function_f, False, [(interval_a, 0), (interval_b, 0)]);
             return f"Error de dominio matemático al evaluar la función: {str(ve)}. Asegúrese de que los valores iniciales están en el dominio válido de la función."
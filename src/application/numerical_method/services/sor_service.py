@@ -1,6 +1,31 @@
 import numpy as np
+from scipy import sparse
 from src.application.numerical_method.interfaces.matrix_method import MatrixMethod
+from src.application.shared.utils.multicolor import MulticolorSweep, is_consistently_ordered
 from src.application.shared.utils.plot_matrix_solution import plot_matrix_solution, plot_system_equations
+from src.application.shared.utils.iteration_table import (
+    DEFAULT_RETENTION,
+    IterationTable,
+    RetentionPolicy,
+    table_components,
+)
+from src.application.shared.utils.relaxation import (
+    RELAXATION_AUTO,
+    AutomaticRelaxation,
+)
+from src.application.shared.utils.sparse_matrix import (
+    dense_rows,
+    triangular_solver,
+    validate_sparse_system,
+)
+from src.application.shared.utils.spectral_radius import (
+    estimate_spectral_radius,
+    spectral_radius_message,
+)
+from src.application.shared.utils.stream_iterations import (
+    IterationGenerator,
+    run_iterations,
+)
 
 
 class SORService(MatrixMethod):
@@ -11,80 +36,176 @@ class SORService(MatrixMethod):
         x0: list[float],  # Vector inicial de aproximación
         tolerance: float,  # Tolerancia para el error
         max_iterations: int,  # Número máximo de iteraciones
-        relaxation_factor: float,  # Factor de relajación (w)
+        relaxation_factor: float | str,  # Factor de relajación (w) o "auto"
         precision_type: int,  # Tipo de precisión (1 para decimales, 0 para cifras significativas)
         **kwargs,
     ) -> dict:
+        return run_iterations(
+            self.iterate(
+                A=A,
+                b=b,
+                x0=x0,
+                tolerance=tolerance,
+                max_iterations=max_iterations,
+                relaxation_factor=relaxation_factor,
+                precision_type=precision_type,
+                **kwargs,
+            )
+        )
 
-        A = np.array(A)
-        b = np.array(b)
-        x0 = np.array(x0)
+    def iterate(
+        self,
+        A: list[list[float]],  # Matriz de coeficientes
+        b: list[float],  # Vector de términos independientes
+        x0: list[float],  # Vector inicial de aproximación
+        tolerance: float,  # Tolerancia para el error
+        max_iterations: int,  # Número máximo de iteraciones
+        relaxation_factor: float | str,  # Factor de relajación (w) o "auto"
+        precision_type: int,  # Tipo de precisión (1 para decimales, 0 para cifras significativas)
+        retention: RetentionPolicy | None = DEFAULT_RETENTION,
+        compute_spectral_radius: bool = True,  # Estimar el radio espectral de T
+        ordering: str = "natural",  # Orden de actualización: "natural" o "multicolor"
+        colors: list[int] | None = None,  # Coloración de las filas para el orden multicolor
+        **kwargs,
+    ) -> IterationGenerator:
+
+        # A puede ser densa (lista de filas) o dispersa (CSR, ver sparse_matrix.py)
+        is_sparse = sparse.issparse(A)
+        A = sparse.csr_matrix(A) if is_sparse else np.array(A, dtype=float)
+        b = np.array(b, dtype=float)
+        x0 = np.array(x0, dtype=float)
 
         n = len(b)
+        components = table_components(n)
         x = x0.copy()
-        table = {}
+        table = IterationTable(("Error",), vector_columns={"X": components}, retention=retention)
+
+        if ordering == "multicolor":
+            # Orden multicolor: las filas de un mismo color se actualizan juntas (ver multicolor.py)
+            try:
+                multicolor = MulticolorSweep(A, colors=colors)
+            except ValueError as error:
+                return {
+                    "message_method": str(error),
+                    "table": table,
+                    "is_successful": False,
+                    "have_solution": False,
+                    "solution": [],
+                }
+        else:
+            multicolor = None
+            if is_sparse:
+                diagonal = sparse.diags(A.diagonal())
+                lower = sparse.tril(A, -1)
+                upper = sparse.triu(A, 1)
+            else:
+                diagonal = np.diag(np.diag(A))
+                lower = np.tril(A, -1)
+                upper = np.triu(A, 1)
+
+        def build_sweep(relaxation_factor: float):
+            if multicolor is not None:
+                multicolor.relaxation_factor = relaxation_factor
+                return multicolor.sweep
 
-        # Inicialización de matrices para el cálculo de T y C
-        D = np.diag(np.diag(A))
-        L = -np.tril(A, -1)
-        U = -np.triu(A, 1)
+            # Cada barrido es una sustitución hacia adelante: (D + w·L)·x_new = w·b + ((1 - w)·D - w·U)·x
+            M = diagonal + relaxation_factor * lower
+            N = (1 - relaxation_factor) * diagonal - relaxation_factor * upper
+            if is_sparse:
+                N = N.tocsr()
+            solve_lower = triangular_solver(M, lower=True)
+            return lambda x, rhs: solve_lower(relaxation_factor * rhs + N @ x)
 
-        # Cálculo de la matriz de iteración T para el método SOR
-        T = np.linalg.inv(D - relaxation_factor * L).dot((1 - relaxation_factor) * D + relaxation_factor * U)
-        spectral_radius = max(abs(np.linalg.eigvals(T)))
+        # Con w = "auto" se calcula w_opt o se ajusta con los errores de las primeras iteraciones (ver relaxation.py)
+        automatic_relaxation = None
+        if relaxation_factor == RELAXATION_AUTO:
+            # El orden multicolor con dos colores es el rojo-negro; en el orden natural hay que verificarlo
+            consistently_ordered = (
+                multicolor.n_colors == 2 if multicolor is not None else is_consistently_ordered(A)
+            )
+            automatic_relaxation = AutomaticRelaxation(A, consistently_ordered)
+            relaxation_factor = automatic_relaxation.relaxation_factor
 
+        def round_value(value):
+            # Precisión seleccionada: decimales correctos (1) o cifras significativas (0)
+            if precision_type == 1:
+                return np.round(value, int(-np.floor(np.log10(tolerance))))
+            if precision_type == 0:
+                factor = 10 ** int(np.ceil(np.log10(abs(1 / tolerance))))
+                return np.round(value * factor) / factor
+            return value
+
+        sweep = build_sweep(relaxation_factor)
         current_error = tolerance + 1
         current_iteration = 0
 
         # Iteración SOR
         while current_error > tolerance and current_iteration < max_iterations:
-            x_new = x.copy()
-            for i in range(n):
-                sum_others = np.dot(A[i, :i], x_new[:i]) + np.dot(A[i, i + 1:], x[i + 1:])
-                x_new[i] = (1 - relaxation_factor) * x[i] + (relaxation_factor / A[i, i]) * (b[i] - sum_others)
+            x_new = sweep(x, b)
 
             # Calcular el error como norma infinito de la diferencia
             current_error = np.linalg.norm(x_new - x, ord=np.inf)
 
-            # Aplicar precisión al vector de soluciones y al error
-            if precision_type == 1:  # Decimales correctos
-                x_new = np.round(x_new, int(-np.floor(np.log10(tolerance))))
-                current_error = round(current_error, int(-np.floor(np.log10(tolerance))))
-            elif precision_type == 0:  # Cifras significativas
-                factor = 10 ** int(np.ceil(np.log10(abs(1 / tolerance))))
-                x_new = np.round(x_new * factor) / factor
-                current_error = round(current_error * factor) / factor
-
-            # Guardar información en la tabla para la iteración actual
-            table[current_iteration + 1] = {
-                "iteration": current_iteration + 1,
-                "X": x_new.tolist(),
-                "Error": current_error,
-            }
+            if automatic_relaxation is not None:
+                new_relaxation_factor = automatic_relaxation.observe(current_error)
+                if new_relaxation_factor is not None:
+                    relaxation_factor = new_relaxation_factor
+                    sweep = build_sweep(relaxation_factor)
+
+            # Aplicar precisión al error y a lo que se muestra; el siguiente barrido usa x_new sin redondear, porque
+            # redondear el iterado corta la oscilación de |λ| = w - 1 y con w cercano a w_opt SOR deja de avanzar
+            current_error = round_value(current_error)
+
+            # Guardar información en la tabla para la iteración actual (solo las primeras componentes de X)
+            table.append(
+                current_iteration + 1,
+                X=round_value(x_new[:components]).tolist(),
+                Error=current_error,
+            )
+            yield table.last_row()
 
             # Preparar para la siguiente iteración
             x = x_new
             current_iteration += 1
 
+        # T = M⁻¹·N es un barrido con b = 0 y el w con el que se terminó; se aplica sin invertir M
+        spectral_radius = None
+        if compute_spectral_radius:
+            zeros = np.zeros(n)
+            spectral_radius = estimate_spectral_radius(lambda v: sweep(v, zeros), n)
+
         # Verificación de éxito o fallo tras las iteraciones
+        radius_message = spectral_radius_message(spectral_radius, n, compute_spectral_radius)
+        if multicolor is not None:
+            radius_message += f" (orden multicolor con {multicolor.n_colors} colores)"
+        # Con w automático se informa el w elegido y el ahorro estimado
+        relaxation_message = (
+            automatic_relaxation.message() if automatic_relaxation is not None else ""
+        )
         result = {}
         if current_error <= tolerance:
             result = {
-                "message_method": f"Aproximación de la solución con tolerancia = {tolerance} y el radio espectral es de = {spectral_radius}",
+                "message_method": f"Aproximación de la solución con tolerancia = {tolerance}{radius_message}"
+                + (f". {relaxation_message}" if relaxation_message else ""),
                 "table": table,
                 "is_successful": True,
                 "have_solution": True,
-                "solution": x.tolist(),
+                "solution": round_value(x).tolist(),
                 "spectral_radius": spectral_radius,
+                "relaxation_factor": relaxation_factor,
+                "relaxation_message": relaxation_message,
             }
         elif current_iteration >= max_iterations:
             result = {
-                "message_method": f"El método funcionó correctamente, pero no se encontró una solución en {max_iterations} iteraciones y el radio espectral es de = {spectral_radius}.",
+                "message_method": f"El método funcionó correctamente, pero no se encontró una solución en {max_iterations} iteraciones{radius_message}."
+                + (f" {relaxation_message}" if relaxation_message else ""),
                 "table": table,
                 "is_successful": True,
                 "have_solution": False,
-                "solution": x.tolist(),
+                "solution": round_value(x).tolist(),
                 "spectral_radius": spectral_radius,
+                "relaxation_factor": relaxation_factor,
+                "relaxation_message": relaxation_message,
             }
         else:
             result = {
@@ -97,9 +218,9 @@ class SORService(MatrixMethod):
             }
 
         # Si la matriz es 2x2, generar las gráficas
-        if len(A) == 2:
-            plot_matrix_solution(table, x.tolist(), spectral_radius)
-            plot_system_equations(A.tolist(), b.tolist(), x.tolist())
+        if n == 2:
+            plot_matrix_solution(table, round_value(x).tolist(), spectral_radius)
+            plot_system_equations(dense_rows(A), b.tolist(), round_value(x).tolist())
 
         return result
 
@@ -110,8 +231,9 @@ class SORService(MatrixMethod):
         initial_guess_raw: str,
         tolerance: float,
         max_iterations: int,
-        relaxation_factor: float,
+        relaxation_factor: float | str,
         matrix_size: int,
+        matrix_format: str = "dense",
         **kwargs,
     ) -> str | list:
 
@@ -123,6 +245,16 @@ class SORService(MatrixMethod):
         if not isinstance(max_iterations, int) or max_iterations <= 0:
             return "El máximo número de iteraciones debe ser un entero positivo."
 
+        # Validar el rango del factor de relajación w (salvo si se elige automáticamente)
+        if relaxation_factor != RELAXATION_AUTO and (relaxation_factor <= 0 or relaxation_factor >= 2):
+            return "El factor de relajación w debe estar en el rango (0, 2)."
+
+        # Los formatos dispersos no tienen el límite de 6x6
+        if matrix_format != "dense":
+            return validate_sparse_system(
+                matrix_a_raw, vector_b_raw, initial_guess_raw, matrix_format
+            )
+
         # Validación de las entradas numéricas
         try:
             A = [
@@ -148,8 +280,4 @@ class SORService(MatrixMethod):
         if len(b) != len(A) or len(x0) != len(A):
             return "El vector b y x0 deben ser compatibles con el tamaño de la matriz A."
 
-        # Validar el rango del factor de relajación w
-        if relaxation_factor <= 0 or relaxation_factor >= 2:
-            return "El factor de relajación w debe estar en el rango (0, 2)."
-
         return [A, b, x0]
@@ -0,0 +1,51 @@
+from django.test import SimpleTestCase
+from src.application.numerical_method.services.bisection_service import BisectionService
+from src.application.numerical_method.services.brent_service import BrentService
+
+
+def iterations(result: dict) -> int:
+    # La tabla puede omitir filas intermedias; la última clave es el número de iteraciones
+    return max(result["table"]) if result["table"] else 0
+
+
+class BrentStoppingTests(SimpleTestCase):
+    """
+    Brent no debe necesitar muchas más iteraciones que la bisección, ni siquiera cerca de una raíz múltiple.
+    """
+
+    def solve(self, service, function_f: str, a: float, b: float, tolerance: float, precision: int = 1) -> dict:
+        return service.solve(
+            interval_a=a,
+            interval_b=b,
+            tolerance=tolerance,
+            max_iterations=500,
+            function_f=function_f,
+            precision=precision,
+        )
+
+    def test_multiple_roots_are_not_slower_than_twice_bisection(self):
+        for function_f, a, b, root in (
+            ("(x-1.1)**3", 0, 3, 1.1),
+            ("(x-1)**5", 0, 2.5, 1),
+            ("(x-0.7)**3", 0, 3, 0.7),
+        ):
+            with self.subTest(function_f=function_f):
+                brent = self.solve(BrentService(), function_f, a, b, 1e-12)
+                bisection = self.solve(BisectionService(), function_f, a, b, 1e-12)
+                self.assertTrue(brent["have_solution"], brent["message_method"])
+                self.assertAlmostEqual(brent["root"], root, places=6)
+                self.assertLessEqual(iterations(brent), 2 * iterations(bisection))
+
+    def test_simple_roots_stay_superlinear(self):
+        for function_f, a, b in (("math.cos(x)-x", 0, 1), ("x**3-2*x-5", 2, 3), ("x**2-2", 0, 2)):
+            with self.subTest(function_f=function_f):
+                result = self.solve(BrentService(), function_f, a, b, 1e-12)
+                self.assertTrue(result["have_solution"], result["message_method"])
+                self.assertLessEqual(iterations(result), 10)
+
+    def test_stops_when_the_bracket_is_smaller_than_the_tolerance(self):
+        # Con una función escalón |f| nunca baja, así que el criterio que la detiene es el ancho del intervalo
+        result = self.solve(BrentService(), "math.copysign(1, x - 0.3)", 0, 1, 1e-10, precision=0)
+        self.assertTrue(result["have_solution"], result["message_method"])
+        self.assertIn("el intervalo que la contiene mide", result["message_method"])
+        self.assertAlmostEqual(result["root"], 0.3, places=9)
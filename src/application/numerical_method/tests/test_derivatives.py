@@ -0,0 +1,93 @@
+from django.test import SimpleTestCase
+from src.application.numerical_method.services.multiple_roots_1_service import (
+    MultipleRoots1Service,
+)
+from src.application.numerical_method.services.multiple_roots_2_service import (
+    MultipleRoots2Service,
+)
+from src.application.numerical_method.services.newton_raphson_service import (
+    NewtonService,
+)
+from src.application.shared.utils.compile_derivatives import compile_derivatives
+
+# math.erf no tiene derivada automática, así que la función se deriva con SymPy aunque el motor sea "automatic".
+COMPLEX_AT_START = "x**0.5 - 1 + math.erf(x)*0"
+
+
+class ComplexDerivativeTests(SimpleTestCase):
+    """
+    Un resultado complejo de las funciones derivadas con SymPy se reporta como error de evaluación.
+    """
+
+    parameters = {"x0": -1, "tolerance": 1e-7, "max_iterations": 100, "precision": 1}
+
+    def assert_evaluation_error(self, result: dict):
+        self.assertTrue(result["is_successful"])
+        self.assertFalse(result["have_solution"])
+        self.assertIn("no es un número real", result["message_method"])
+
+    def test_services_with_both_engines(self):
+        for engine in ("automatic", "sympy"):
+            with self.subTest(engine=engine):
+                self.assert_evaluation_error(
+                    NewtonService(engine).solve(function_f=COMPLEX_AT_START, **self.parameters)
+                )
+                self.assert_evaluation_error(
+                    MultipleRoots1Service(engine).solve(
+                        function_f=COMPLEX_AT_START, multiplicity=2, **self.parameters
+                    )
+                )
+                self.assert_evaluation_error(
+                    MultipleRoots2Service(engine).solve(function_f=COMPLEX_AT_START, **self.parameters)
+                )
+
+    def test_views_return_the_error_message(self):
+        data = {
+            "x0": "-1",
+            "tolerance": "1e-7",
+            "max_iterations": "100",
+            "precision": "1",
+            "function_f": COMPLEX_AT_START,
+            "multiplicity": "2",
+        }
+        for url in (
+            "/numerical-methods/newton_raphson/",
+            "/numerical-methods/multiple_roots_1/",
+            "/numerical-methods/multiple_roots_2/",
+        ):
+            with self.subTest(url=url):
+                response = self.client.post(url, data)
+                self.assertEqual(response.status_code, 200)
+                self.assertContains(response, "no es un número real")
+
+
+class SingularDerivativeTests(SimpleTestCase):
+    """
+    Con diferenciación automática f se evalúa aunque f' o f'' sean singulares, igual que con SymPy.
+    """
+
+    cases = (
+        ("math.sqrt(x)", 0),
+        ("math.acos(x)", 1),
+        ("x**0.5", 0),
+        ("(-2)**x", 2),
+        ("math.sqrt(x)", 4),
+    )
+
+    def outcome(self, function, *args):
+        try:
+            return function(*args)
+        except Exception as error:
+            return type(error)
+
+    def test_engines_agree(self):
+        for function_f, x in self.cases:
+            automatic = compile_derivatives(function_f, "automatic")
+            symbolic = compile_derivatives(function_f, "sympy")
+            with self.subTest(function_f=function_f, x=x):
+                self.assertEqual(automatic["f"](x), symbolic["f"](x))
+                for order in (0, 1, 2):
+                    self.assertEqual(
+                        self.outcome(automatic["evaluate"], x, order),
+                        self.outcome(symbolic["evaluate"], x, order),
+                    )
@@ -0,0 +1,38 @@
+from django.test import SimpleTestCase
+from src.application.shared.utils.compile_derivatives import compile_derivatives
+from src.application.shared.utils.compile_expression import compile_expression
+
+PIECEWISE_FUNCTIONS = (
+    "x if x > 0 else -x",
+    "x**2 - 2 if 0 <= x < 5 and not x == 3 else 1",
+    "(x > 1) * (x - 1) - 0.5",
+    "math.exp(x) if x or x >= 2 else 1",
+)
+
+
+class ConditionalExpressionTests(SimpleTestCase):
+    """
+    Las funciones a trozos con comparaciones y expresiones condicionales se compilan y se derivan.
+    """
+
+    def test_conditionals_are_allowed(self):
+        absolute = compile_expression("x if x > 0 else -x")
+        self.assertEqual(absolute(-2), 2)
+        self.assertEqual(absolute(3), 3)
+        self.assertEqual(compile_expression("x**2 - 2 if 0 <= x < 5 and not x == 3 else 1")(3), 1)
+
+    def test_identity_and_membership_are_rejected(self):
+        for source in ("x is 1", "x in 1", "x not in 1"):
+            with self.subTest(source=source):
+                with self.assertRaises(SyntaxError):
+                    compile_expression(source)
+
+    def test_engines_differentiate_the_active_branch(self):
+        for source in PIECEWISE_FUNCTIONS:
+            for value in (-2.0, 0.5, 2.0, 3.0):
+                with self.subTest(source=source, x=value):
+                    automatic = compile_derivatives(source, "automatic")["evaluate"](value)
+                    symbolic = compile_derivatives(source, "sympy")["evaluate"](value)
+                    self.assertEqual(automatic[0], compile_expression(source)(value))
+                    for expected, actual in zip(symbolic, automatic):
+                        self.assertAlmostEqual(float(expected), float(actual))
@@ -0,0 +1,113 @@
+import io
+import numpy as np
+from django.test import SimpleTestCase, override_settings
+from scipy import sparse
+from scipy.io import mmwrite
+from src.application.numerical_method.services.jacobi_service import JacobiService
+from src.application.shared.utils.parallel_jacobi import ParallelJacobiSweep
+
+
+def dominant_dense_matrix(n: int) -> np.ndarray:
+    # Matriz aleatoria con diagonal estrictamente dominante
+    rng = np.random.default_rng(0)
+    A = rng.random((n, n))
+    A[np.diag_indices(n)] = 2 * A.sum(axis=1)
+    return A
+
+
+def dominant_sparse_matrix(n: int) -> sparse.csr_matrix:
+    return sparse.diags(
+        [-1.0, -1.0, 4.5, -1.0, -1.0], [-50, -1, 0, 1, 50], shape=(n, n)
+    ).tocsr()
+
+
+class ParallelSweepTests(SimpleTestCase):
+    """
+    El barrido por bloques da el mismo resultado, bit a bit, con uno o con varios hilos.
+    """
+
+    def sweeps(self, A, workers: int, iterations: int = 5):
+        R = A - (sparse.diags(A.diagonal()) if sparse.issparse(A) else np.diag(A.diagonal()))
+        inverse_diagonal = 1 / A.diagonal()
+        b = np.arange(1.0, A.shape[0] + 1)
+        sweep = ParallelJacobiSweep(R, inverse_diagonal, b, workers)
+        x0, x1 = np.zeros_like(b), np.empty_like(b)
+        errors = []
+        try:
+            for _ in range(iterations):
+                errors.append(sweep.sweep(x0, x1))
+                x0, x1 = x1, x0
+        finally:
+            sweep.close()
+        return x0, errors, len(sweep.blocks)
+
+    def test_sequential_and_threaded_sweeps_match(self):
+        for name, A in (
+            ("dense", dominant_dense_matrix(1100)),
+            ("sparse", dominant_sparse_matrix(80_000)),
+        ):
+            with self.subTest(matrix=name):
+                x_sequential, errors_sequential, blocks = self.sweeps(A, workers=1)
+                x_threaded, errors_threaded, _ = self.sweeps(A, workers=4)
+                self.assertGreater(blocks, 1)
+                self.assertTrue(np.array_equal(x_sequential, x_threaded))
+                self.assertEqual(errors_sequential, errors_threaded)
+
+    @override_settings(JACOBI_PARALLEL_MIN_NONZEROS=1)
+    def test_service_results_do_not_depend_on_workers(self):
+        A = dominant_dense_matrix(600)
+        n = A.shape[0]
+        results = [
+            JacobiService().solve(
+                A=A,
+                b=np.ones(n),
+                x0=np.zeros(n),
+                tolerance=1e-12,
+                max_iterations=200,
+                precision_type=None,
+                compute_spectral_radius=False,
+                workers=workers,
+            )
+            for workers in (1, 3)
+        ]
+        self.assertTrue(results[0]["have_solution"], results[0]["message_method"])
+        self.assertEqual(results[0]["solution"], results[1]["solution"])
+        self.assertEqual(results[0]["table"].column("Error"), results[1]["table"].column("Error"))
+        self.assertIn("3 hilos", results[1]["message_method"])
+
+
+class DenseMatrixMarketTests(SimpleTestCase):
+    """
+    Un archivo Matrix Market "array" se deja denso y no tiene el límite de 6x6.
+    """
+
+    def test_array_file_stays_dense(self):
+        n = 10
+        A = dominant_dense_matrix(n)
+        matrix_file = io.BytesIO()
+        mmwrite(matrix_file, A)
+        response = JacobiService().validate_input(
+            matrix_a_raw=matrix_file.getvalue().decode(),
+            vector_b_raw="1",
+            initial_guess_raw="0",
+            tolerance=1e-6,
+            max_iterations=100,
+            matrix_size=2,
+            matrix_format="matrix_market",
+            workers=2,
+        )
+        self.assertIsInstance(response, list)
+        self.assertIsInstance(response[0], np.ndarray)
+        self.assertTrue(np.array_equal(response[0], A))
+
+    def test_rejects_invalid_workers(self):
+        response = JacobiService().validate_input(
+            matrix_a_raw="4 1; 1 4",
+            vector_b_raw="1 1",
+            initial_guess_raw="0 0",
+            tolerance=1e-6,
+            max_iterations=100,
+            matrix_size=2,
+            workers=0,
+        )
+        self.assertEqual(response, "El número de hilos debe ser un entero positivo.")
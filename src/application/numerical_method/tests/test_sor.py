@@ -0,0 +1,39 @@
+import numpy as np
+from django.test import SimpleTestCase
+from scipy import sparse
+from src.application.numerical_method.services.sor_service import SORService
+
+
+def poisson_matrix(m: int) -> sparse.csr_matrix:
+    # Diferencias finitas de 5 puntos en una malla de m x m
+    T = sparse.diags([-1.0, 4.0, -1.0], [-1, 0, 1], shape=(m, m))
+    S = sparse.diags([-1.0, -1.0], [-1, 1], shape=(m, m))
+    identity = sparse.identity(m)
+    return (sparse.kron(identity, T) + sparse.kron(S, identity)).tocsr()
+
+
+class AutomaticRelaxationTests(SimpleTestCase):
+    """
+    Con w automático SOR converge aunque la vista redondee los resultados a la precisión pedida.
+    """
+
+    def test_auto_converges_with_rounding(self):
+        A = poisson_matrix(40)
+        n = A.shape[0]
+        for ordering in ("natural", "multicolor"):
+            for precision_type in (1, 0):
+                with self.subTest(ordering=ordering, precision_type=precision_type):
+                    result = SORService().solve(
+                        A=A,
+                        b=np.ones(n),
+                        x0=np.zeros(n),
+                        tolerance=1e-6,
+                        max_iterations=5000,
+                        precision_type=precision_type,
+                        relaxation_factor="auto",
+                        ordering=ordering,
+                        compute_spectral_radius=False,
+                    )
+                    self.assertTrue(result["have_solution"], result["message_method"])
+                    self.assertLess(result["table"].total_rows, 300)
+                    self.assertAlmostEqual(result["relaxation_factor"], 1.857785, places=4)
@@ -0,0 +1,39 @@
+import math
+import numpy as np
+from django.test import SimpleTestCase
+from scipy import sparse
+from src.application.numerical_method.tests.test_sor import poisson_matrix
+from src.application.shared.utils.sparse_matrix import triangular_solver
+from src.application.shared.utils.spectral_radius import estimate_spectral_radius
+
+
+def sor_iteration(A, w: float):
+    # T = (D + w·L)⁻¹·((1 - w)·D - w·U), aplicada sin formarla
+    diagonal = sparse.diags(A.diagonal())
+    M = (diagonal + w * sparse.tril(A, -1)).tocsr()
+    N = ((1 - w) * diagonal - w * sparse.triu(A, 1)).tocsr()
+    solve_lower = triangular_solver(M, lower=True)
+    return lambda v: solve_lower(N @ v)
+
+
+class SpectralRadiusTests(SimpleTestCase):
+    """
+    Radio espectral de matrices de iteración de Poisson en orden natural (1600 incógnitas, sin la descomposición densa).
+    """
+
+    A = poisson_matrix(40)
+    jacobi_radius = math.cos(math.pi / 41)
+    optimal_w = 2 / (1 + math.sqrt(1 - jacobi_radius**2))
+
+    def test_gauss_seidel(self):
+        radius = estimate_spectral_radius(sor_iteration(self.A, 1.0), self.A.shape[0])
+        self.assertAlmostEqual(radius, self.jacobi_radius**2, places=5)
+
+    def test_sor_with_optimal_w(self):
+        # Todos los valores propios quedan sobre |λ| = w - 1 y Arnoldi no converge; se usa la tasa de crecimiento
+        radius = estimate_spectral_radius(sor_iteration(self.A, self.optimal_w), self.A.shape[0])
+        self.assertIsNotNone(radius)
+        self.assertAlmostEqual(radius, self.optimal_w - 1, delta=0.01)
+
+    def test_zero_iteration_matrix(self):
+        self.assertEqual(estimate_spectral_radius(lambda v: np.zeros_like(v), 400), 0.0)
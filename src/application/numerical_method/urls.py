@@ -2,6 +2,7 @@ from django.urls import path
 from .views.file_download_view import FileDownloadView
 from .views.bisection_view import BisectionView
 from .views.regula_falsi_view import RegulaFalsiView
+from .views.brent_view import BrentView
 from .views.fixed_point_view import FixedPointView
 from .views.newton_raphson_view import NewtonRaphsonView
 from .views.secant_view import SecantView
@@ -10,6 +11,9 @@ from .views.multiple_roots_2_view import MultipleRoots2View
 from .views.jacobi_view import JacobiView
 from .views.gauss_seidel_view import GaussSeidelView
 from .views.sor_view import SORView
+from .views.conjugate_gradient_view import ConjugateGradientView
+from .views.gmres_view import GMRESView
+from .views.bicgstab_view import BiCGSTABView
 from .views.vandermonde_view import VandermondeView
 from .views.spline_linear_view import SplineLinearView
 from .views.spline_cubic_view import SplineCubicView
@@ -19,8 +23,13 @@ from .views.newton_interpol_view import NewtonInterpolView
 app_name = "numerical_method"
 urlpatterns = [
     path(
-        "download-svg/",
+        "plots/<str:key>.svg",
         FileDownloadView.as_view(),
+        name="plot",
+    ),
+    path(
+        "download-svg/<str:key>/",
+        FileDownloadView.as_view(as_attachment=True),
         name="download_svg",
     ),
     path(
@@ -33,6 +42,11 @@ urlpatterns = [
         RegulaFalsiView.as_view(),
         name="regula_falsi",
     ),
+    path(
+        "brent/",
+        BrentView.as_view(),
+        name="brent",
+    ),
     path(
         "fixed-point/",
         FixedPointView.as_view(),
@@ -73,6 +87,21 @@ urlpatterns = [
         SORView.as_view(),
         name="sor",
     ),
+    path(
+        "conjugate-gradient/",
+        ConjugateGradientView.as_view(),
+        name="conjugate_gradient",
+    ),
+    path(
+        "gmres/",
+        GMRESView.as_view(),
+        name="gmres",
+    ),
+    path(
+        "bicgstab/",
+        BiCGSTABView.as_view(),
+        name="bicgstab",
+    ),
     path(
         "vandermonde/",
         VandermondeView.as_view(),
@@ -0,0 +1,118 @@
+from django.views.generic import TemplateView
+from src.application.numerical_method.interfaces.matrix_method import MatrixMethod
+from src.application.numerical_method.containers.numerical_method_container import (
+    NumericalMethodContainer,
+)
+from dependency_injector.wiring import inject
+from django.http import HttpRequest, HttpResponse
+from src.application.shared.utils.iteration_table import table_components
+from src.application.shared.utils.stream_iterations import (
+    STREAM_RETENTION,
+    stream_iterations_response,
+)
+
+
+class BiCGSTABView(TemplateView):
+    template_name = "bicgstab.html"
+
+    @inject
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.method_service = NumericalMethodContainer.bicgstab_service()
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        # Agregando los tamaños de matriz al contexto
+        context["matrix_sizes"] = [2, 3, 4, 5, 6]
+        return context
+
+    def post(
+        self, request: HttpRequest, *args: object, **kwargs: object
+    ) -> HttpResponse:
+        context = self.get_context_data()
+
+        template_data = {}
+
+        # Capturar los datos del formulario
+        matrix_a_raw = request.POST.get("matrix_a", "")
+        vector_b_raw = request.POST.get("vector_b", "")
+        initial_guess_raw = request.POST.get("initial_guess", "")
+        tolerance = float(request.POST.get("tolerance"))
+        max_iterations = int(request.POST.get("max_iterations"))
+        matrix_size = int(request.POST.get("matrix_size"))
+
+        # Capturar la selección de precisión
+        precision_type = request.POST.get("precision_type", "decimales_correctos")
+
+        # Formato de la matriz A; también se puede cargar desde un archivo (por ejemplo un .mtx)
+        matrix_format = request.POST.get("matrix_format", "dense")
+        matrix_file = request.FILES.get("matrix_file")
+        if matrix_file is not None:
+            matrix_a_raw = matrix_file.read().decode("utf-8", errors="replace")
+
+        stream = request.POST.get("stream") == "1"
+
+        # Precondicionador: "none", "jacobi", "ssor" o "ilu" (ver preconditioners.py)
+        preconditioner = request.POST.get("preconditioner", "none")
+
+        response_validation = self.method_service.validate_input(
+            matrix_a_raw=matrix_a_raw,
+            vector_b_raw=vector_b_raw,
+            initial_guess_raw=initial_guess_raw,
+            tolerance=tolerance,
+            max_iterations=max_iterations,
+            matrix_size=matrix_size,
+            matrix_format=matrix_format,
+            preconditioner=preconditioner,
+        )
+
+        if isinstance(response_validation, str):
+            error_response = {
+                "message_method": response_validation,
+                "table": {},
+                "is_successful": False,
+                "have_solution": False,
+                "solution": [],
+            }
+            if stream:
+                return stream_iterations_response(None, result=error_response)
+            template_data = template_data | error_response
+            context["template_data"] = template_data
+            return self.render_to_response(context)
+
+        # Obtener los valores de A, b y x0
+        A = response_validation[0]
+        b = response_validation[1]
+        x0 = response_validation[2]
+
+        if stream:
+            # Las filas se envían al cliente a medida que se calculan.
+            return stream_iterations_response(
+                self.method_service.iterate(
+                    A=A,
+                    b=b,
+                    x0=x0,
+                    tolerance=tolerance,
+                    max_iterations=max_iterations,
+                    precision_type=precision_type,
+                    retention=STREAM_RETENTION,
+                    preconditioner=preconditioner,
+                ),
+            )
+
+        # Ejecutar BiCGSTAB con los parámetros recibidos y el tipo de precisión
+        method_response = self.method_service.solve(
+            A=A,
+            b=b,
+            x0=x0,
+            tolerance=tolerance,
+            max_iterations=max_iterations,
+            precision_type=precision_type,  # Pasar el tipo de precisión al servicio
+            preconditioner=preconditioner,
+        )
+
+        # Verificación de éxito y almacenamiento de la respuesta
+        template_data["indexes"] = list(range(1, table_components(len(b)) + 1))
+        template_data = template_data | method_response
+        context["template_data"] = template_data
+        return self.render_to_response(context)
@@ -8,6 +8,10 @@ from src.application.numerical_method.containers.numerical_method_container impo
 from dependency_injector.wiring import inject, Provide
 from src.application.shared.utils.plot_function import plot_function
 from django.http import HttpRequest, HttpResponse
+from src.application.shared.utils.stream_iterations import (
+    STREAM_RETENTION,
+    stream_iterations_response,
+)
 
 
 class BisectionView(TemplateView):
@@ -37,6 +41,9 @@ class BisectionView(TemplateView):
         max_iterations = int(request.POST.get("max_iterations"))
         function_f = request.POST.get("function_f")
         precision = int(request.POST.get("precision"))
+        all_roots = request.POST.get("all_roots") == "1"
+
+        stream = request.POST.get("stream") == "1" and not all_roots
 
         response_validation = self.method_service.validate_input(
             interval_a=interval_a,
@@ -44,6 +51,7 @@ class BisectionView(TemplateView):
             tolerance=tolerance,
             max_iterations=max_iterations,
             function_f=function_f,
+            all_roots=all_roots,
         )
 
         if isinstance(response_validation, str):
@@ -63,11 +71,44 @@ class BisectionView(TemplateView):
                     "have_solution": False,
                     "root": 0.0,
                 }
+            if stream:
+                return stream_iterations_response(None, result=error_response)
             template_data = template_data | error_response
             context["template_data"] = template_data
             return self.render_to_response(context)
 
-        method_response = self.method_service.solve(
+        def plot_result(method_response: dict) -> None:
+            if not method_response["is_successful"]:
+                return
+            if all_roots and method_response["have_solution"]:
+                points = [
+                    (root["root"], 0.0)
+                    for root in method_response["roots"]
+                    if root["have_solution"]
+                ]
+            elif all_roots:
+                points = [(interval_a, 0.0), (interval_b, 0.0)]
+            else:
+                points = [(method_response["root"], 0.0)]
+            plot_function(function_f, method_response["have_solution"], points)
+
+        if stream:
+            # Las filas se envían al cliente a medida que se calculan.
+            return stream_iterations_response(
+                self.method_service.iterate(
+                    interval_a=interval_a,
+                    interval_b=interval_b,
+                    tolerance=tolerance,
+                    max_iterations=max_iterations,
+                    function_f=function_f,
+                    precision=precision,
+                    retention=STREAM_RETENTION,
+                ),
+                on_result=plot_result,
+            )
+
+        solve = self.method_service.solve_all if all_roots else self.method_service.solve
+        method_response = solve(
             interval_a=interval_a,
             interval_b=interval_b,
             tolerance=tolerance,
@@ -76,12 +117,7 @@ class BisectionView(TemplateView):
             precision=precision,
         )
 
-        if method_response["is_successful"]:
-            plot_function(
-                function_f,
-                method_response["have_solution"],
-                [(method_response["root"], 0.0)],
-            )
+        plot_result(method_response)
 
         template_data = template_data | method_response
         context["template_data"] = template_data
@@ -1,16 +1,31 @@
-import os
-from django.http import FileResponse, Http404
+from django.http import Http404, HttpResponse, HttpResponseNotModified
 from django.views import View
-from django.conf import settings
+from src.application.shared.utils.plot_store import get_plot_store, is_plot_key
+
+# La llave depende solo del contenido, así que una gráfica nunca cambia y se puede guardar en caché por un año.
+PLOT_CACHE_CONTROL = "public, max-age=31536000, immutable"
 
 
 class FileDownloadView(View):
+    as_attachment = False
+
+    def get(self, request, key: str, *args, **kwargs):
+        if not is_plot_key(key):
+            raise Http404("La gráfica solicitada no existe.")
 
-    def get(self, request, *args, **kwargs):
-        file_path = os.path.join(
-            settings.BASE_DIR, "static/img/numerical_method/function_plot.svg"
-        )
+        etag = f'"{key}"'
+        if etag in request.headers.get("If-None-Match", ""):
+            response = HttpResponseNotModified()
+        else:
+            content = get_plot_store().get(key)
+            if content is None:
+                raise Http404("La gráfica solicitada no existe o ya no está disponible.")
+            response = HttpResponse(content, content_type="image/svg+xml")
+            if self.as_attachment:
+                response["Content-Disposition"] = (
+                    f'attachment; filename="plot_{key[:12]}.svg"'
+                )
 
-        response = FileResponse(open(file_path, "rb"), content_type="image/svg+xml")
-        response["Content-Disposition"] = 'attachment; filename="function_plot.svg"'
+        response["ETag"] = etag
+        response["Cache-Control"] = PLOT_CACHE_CONTROL
         return response
@@ -5,6 +5,11 @@ from src.application.numerical_method.containers.numerical_method_container impo
 )
 from dependency_injector.wiring import inject
 from django.http import HttpRequest, HttpResponse
+from src.application.shared.utils.iteration_table import table_components
+from src.application.shared.utils.stream_iterations import (
+    STREAM_RETENTION,
+    stream_iterations_response,
+)
 
 
 class GaussSeidelView(TemplateView):
@@ -36,6 +41,20 @@ class GaussSeidelView(TemplateView):
         matrix_size = int(request.POST.get("matrix_size"))
         precision = int(request.POST.get("precision"))  # Capturamos el tipo de precisión
 
+        # Formato de la matriz A; también se puede cargar desde un archivo (por ejemplo un .mtx)
+        matrix_format = request.POST.get("matrix_format", "dense")
+        matrix_file = request.FILES.get("matrix_file")
+        if matrix_file is not None:
+            matrix_a_raw = matrix_file.read().decode("utf-8", errors="replace")
+
+        stream = request.POST.get("stream") == "1"
+
+        # El radio espectral es informativo; en sistemas grandes se puede omitir su estimación
+        compute_spectral_radius = request.POST.get("skip_spectral_radius") != "1"
+
+        # Orden de actualización: "natural" (fila por fila) o "multicolor" (por grupos de filas independientes)
+        ordering = request.POST.get("ordering", "natural")
+
         response_validation = self.method_service.validate_input(
             matrix_a_raw=matrix_a_raw,
             vector_b_raw=vector_b_raw,
@@ -43,6 +62,7 @@ class GaussSeidelView(TemplateView):
             tolerance=tolerance,
             max_iterations=max_iterations,
             matrix_size=matrix_size,
+            matrix_format=matrix_format,
         )
 
         if isinstance(response_validation, str):
@@ -53,6 +73,8 @@ class GaussSeidelView(TemplateView):
                 "have_solution": False,
                 "solution": [],
             }
+            if stream:
+                return stream_iterations_response(None, result=error_response)
             template_data = template_data | error_response
             context["template_data"] = template_data
             return self.render_to_response(context)
@@ -62,6 +84,22 @@ class GaussSeidelView(TemplateView):
         b = response_validation[1]
         x0 = response_validation[2]
 
+        if stream:
+            # Las filas se envían al cliente a medida que se calculan.
+            return stream_iterations_response(
+                self.method_service.iterate(
+                    A=A,
+                    b=b,
+                    x0=x0,
+                    tolerance=tolerance,
+                    max_iterations=max_iterations,
+                    precision=precision,
+                    retention=STREAM_RETENTION,
+                    compute_spectral_radius=compute_spectral_radius,
+                    ordering=ordering,
+                ),
+            )
+
         # Ejecutar el método Gauss-Seidel con los parámetros recibidos
         method_response = self.method_service.solve(
             A=A,
@@ -70,10 +108,12 @@ class GaussSeidelView(TemplateView):
             tolerance=tolerance,
             max_iterations=max_iterations,
             precision=precision,  # Enviar el tipo de precisión al servicio
+            compute_spectral_radius=compute_spectral_radius,
+            ordering=ordering,
         )
 
         # Verificación de éxito y almacenamiento de la respuesta
-        template_data["indexes"] = list(range(1, len(A) + 1))
+        template_data["indexes"] = list(range(1, table_components(len(b)) + 1))
         template_data = template_data | method_response
         context["template_data"] = template_data
         return self.render_to_response(context)
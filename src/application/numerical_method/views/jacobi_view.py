@@ -5,6 +5,11 @@ from src.application.numerical_method.containers.numerical_method_container impo
 )
 from dependency_injector.wiring import inject
 from django.http import HttpRequest, HttpResponse
+from src.application.shared.utils.iteration_table import table_components
+from src.application.shared.utils.stream_iterations import (
+    STREAM_RETENTION,
+    stream_iterations_response,
+)
 
 
 class JacobiView(TemplateView):
@@ -39,6 +44,24 @@ class JacobiView(TemplateView):
         # Capturar la selección de precisión
         precision_type = request.POST.get("precision_type", "decimales_correctos")
 
+        # Formato de la matriz A; también se puede cargar desde un archivo (por ejemplo un .mtx)
+        matrix_format = request.POST.get("matrix_format", "dense")
+        matrix_file = request.FILES.get("matrix_file")
+        if matrix_file is not None:
+            matrix_a_raw = matrix_file.read().decode("utf-8", errors="replace")
+
+        stream = request.POST.get("stream") == "1"
+
+        # El radio espectral es informativo; en sistemas grandes se puede omitir su estimación
+        compute_spectral_radius = request.POST.get("skip_spectral_radius") != "1"
+
+        # Hilos del barrido por bloques en sistemas grandes; vacío usa JACOBI_WORKERS
+        workers_raw = request.POST.get("workers", "").strip()
+        try:
+            workers = int(workers_raw) if workers_raw else None
+        except ValueError:
+            workers = workers_raw  # validate_input lo rechaza con su mensaje
+
         response_validation = self.method_service.validate_input(
             matrix_a_raw=matrix_a_raw,
             vector_b_raw=vector_b_raw,
@@ -46,6 +69,8 @@ class JacobiView(TemplateView):
             tolerance=tolerance,
             max_iterations=max_iterations,
             matrix_size=matrix_size,
+            matrix_format=matrix_format,
+            workers=workers,
         )
 
         if isinstance(response_validation, str):
@@ -56,6 +81,8 @@ class JacobiView(TemplateView):
                 "have_solution": False,
                 "solution": [],
             }
+            if stream:
+                return stream_iterations_response(None, result=error_response)
             template_data = template_data | error_response
             context["template_data"] = template_data
             return self.render_to_response(context)
@@ -65,6 +92,22 @@ class JacobiView(TemplateView):
         b = response_validation[1]
         x0 = response_validation[2]
 
+        if stream:
+            # Las filas se envían al cliente a medida que se calculan.
+            return stream_iterations_response(
+                self.method_service.iterate(
+                    A=A,
+                    b=b,
+                    x0=x0,
+                    tolerance=tolerance,
+                    max_iterations=max_iterations,
+                    precision_type=precision_type,
+                    retention=STREAM_RETENTION,
+                    compute_spectral_radius=compute_spectral_radius,
+                    workers=workers,
+                ),
+            )
+
         # Ejecutar el método Jacobi con los parámetros recibidos y el tipo de precisión
         method_response = self.method_service.solve(
             A=A,
@@ -73,10 +116,12 @@ class JacobiView(TemplateView):
             tolerance=tolerance,
             max_iterations=max_iterations,
             precision_type=precision_type,  # Pasar el tipo de precisión al servicio
+            compute_spectral_radius=compute_spectral_radius,
+            workers=workers,
         )
 
         # Verificación de éxito y almacenamiento de la respuesta
-        template_data["indexes"] = list(range(1, len(A) + 1))
+        template_data["indexes"] = list(range(1, table_components(len(b)) + 1))
         template_data = template_data | method_response
         context["template_data"] = template_data
         return self.render_to_response(context)
@@ -8,6 +8,10 @@ from src.application.numerical_method.containers.numerical_method_container impo
 from dependency_injector.wiring import inject, Provide
 from src.application.shared.utils.plot_function import plot_function
 from django.http import HttpRequest, HttpResponse
+from src.application.shared.utils.stream_iterations import (
+    STREAM_RETENTION,
+    stream_iterations_response,
+)
 
 
 class MultipleRoots1View(TemplateView):
@@ -36,6 +40,8 @@ class MultipleRoots1View(TemplateView):
         function_f = request.POST.get("function_f")
         multiplicity = int(request.POST.get("multiplicity"))
 
+        stream = request.POST.get("stream") == "1"
+
         response_validation = self.method_service.validate_input(
             x0=x0,
             tolerance=tolerance,
@@ -60,10 +66,35 @@ class MultipleRoots1View(TemplateView):
                     "have_solution": False,
                     "root": 0.0,
                 }
+            if stream:
+                return stream_iterations_response(None, result=error_response)
             template_data = template_data | error_response
             context["template_data"] = template_data
             return self.render_to_response(context)
 
+        def plot_result(method_response: dict) -> None:
+            if method_response["is_successful"]:
+                plot_function(
+                    function_f,
+                    method_response["have_solution"],
+                    [(method_response["root"], 0.0)],
+                )
+
+        if stream:
+            # Las filas se envían al cliente a medida que se calculan.
+            return stream_iterations_response(
+                self.method_service.iterate(
+                    x0=x0,
+                    tolerance=tolerance,
+                    max_iterations=max_iterations,
+                    precision=precision,
+                    function_f=function_f,
+                    multiplicity=multiplicity,
+                    retention=STREAM_RETENTION,
+                ),
+                on_result=plot_result,
+            )
+
         method_response = self.method_service.solve(
             x0=x0,
             tolerance=tolerance,
@@ -72,12 +103,7 @@ class MultipleRoots1View(TemplateView):
             function_f=function_f,
             multiplicity=multiplicity,
         )
-        if method_response["is_successful"]:
-            plot_function(
-                function_f,
-                method_response["have_solution"],
-                [(method_response["root"], 0.0)],
-            )
+        plot_result(method_response)
         template_data = template_data | method_response
         context["template_data"] = template_data
         return self.render_to_response(context)
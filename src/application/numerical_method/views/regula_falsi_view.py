@@ -8,6 +8,10 @@ from src.application.numerical_method.containers.numerical_method_container impo
 from dependency_injector.wiring import inject, Provide
 from src.application.shared.utils.plot_function import plot_function
 from django.http import HttpRequest, HttpResponse
+from src.application.shared.utils.stream_iterations import (
+    STREAM_RETENTION,
+    stream_iterations_response,
+)
 
 
 class RegulaFalsiView(TemplateView):
@@ -37,6 +41,9 @@ class RegulaFalsiView(TemplateView):
         max_iterations = int(request.POST.get("max_iterations"))
         function_f = request.POST.get("function_f")
         precision = int(request.POST.get("precision"))
+        variant = request.POST.get("variant", "plain")
+
+        stream = request.POST.get("stream") == "1"
 
         response_validation = self.method_service.validate_input(
             interval_a=interval_a,
@@ -44,6 +51,7 @@ class RegulaFalsiView(TemplateView):
             tolerance=tolerance,
             max_iterations=max_iterations,
             function_f=function_f,
+            variant=variant,
         )
 
         if isinstance(response_validation, str):
@@ -63,10 +71,36 @@ class RegulaFalsiView(TemplateView):
                     "have_solution": False,
                     "root": 0.0,
                 }
+            if stream:
+                return stream_iterations_response(None, result=error_response)
             template_data = template_data | error_response
             context["template_data"] = template_data
             return self.render_to_response(context)
 
+        def plot_result(method_response: dict) -> None:
+            if method_response["is_successful"]:
+                plot_function(
+                    function_f,
+                    method_response["have_solution"],
+                    [(method_response["root"], 0.0)],
+                )
+
+        if stream:
+            # Las filas se envían al cliente a medida que se calculan.
+            return stream_iterations_response(
+                self.method_service.iterate(
+                    interval_a=interval_a,
+                    interval_b=interval_b,
+                    tolerance=tolerance,
+                    max_iterations=max_iterations,
+                    function_f=function_f,
+                    precision=precision,
+                    variant=variant,
+                    retention=STREAM_RETENTION,
+                ),
+                on_result=plot_result,
+            )
+
         method_response = self.method_service.solve(
             interval_a=interval_a,
             interval_b=interval_b,
@@ -74,14 +108,10 @@ class RegulaFalsiView(TemplateView):
             max_iterations=max_iterations,
             function_f=function_f,
             precision=precision,
+            variant=variant,
         )
 
-        if method_response["is_successful"]:
-            plot_function(
-                function_f,
-                method_response["have_solution"],
-                [(method_response["root"], 0.0)],
-            )
+        plot_result(method_response)
 
         template_data = template_data | method_response
         context["template_data"] = template_data
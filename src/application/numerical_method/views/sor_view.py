@@ -5,6 +5,11 @@ from src.application.numerical_method.containers.numerical_method_container impo
 )
 from dependency_injector.wiring import inject
 from django.http import HttpRequest, HttpResponse
+from src.application.shared.utils.iteration_table import table_components
+from src.application.shared.utils.stream_iterations import (
+    STREAM_RETENTION,
+    stream_iterations_response,
+)
 
 
 class SORView(TemplateView):
@@ -34,10 +39,29 @@ class SORView(TemplateView):
         initial_guess_raw = request.POST.get("initial_guess", "")
         tolerance = float(request.POST.get("tolerance"))
         max_iterations = int(request.POST.get("max_iterations"))
-        relaxation_factor = float(request.POST.get("relaxation_factor"))
+        # Si se marca la opción o se deja vacío, el servicio elige w (ver relaxation.py)
+        relaxation_factor_raw = request.POST.get("relaxation_factor", "").strip()
+        if request.POST.get("auto_relaxation") == "1" or not relaxation_factor_raw:
+            relaxation_factor = "auto"
+        else:
+            relaxation_factor = float(relaxation_factor_raw)
         precision_type = int(request.POST.get("precision"))
         matrix_size = int(request.POST.get("matrix_size"))
 
+        # Formato de la matriz A; también se puede cargar desde un archivo (por ejemplo un .mtx)
+        matrix_format = request.POST.get("matrix_format", "dense")
+        matrix_file = request.FILES.get("matrix_file")
+        if matrix_file is not None:
+            matrix_a_raw = matrix_file.read().decode("utf-8", errors="replace")
+
+        stream = request.POST.get("stream") == "1"
+
+        # El radio espectral es informativo; en sistemas grandes se puede omitir su estimación
+        compute_spectral_radius = request.POST.get("skip_spectral_radius") != "1"
+
+        # Orden de actualización: "natural" (fila por fila) o "multicolor" (por grupos de filas independientes)
+        ordering = request.POST.get("ordering", "natural")
+
         # Validar entrada
         response_validation = self.method_service.validate_input(
             matrix_a_raw=matrix_a_raw,
@@ -47,6 +71,7 @@ class SORView(TemplateView):
             max_iterations=max_iterations,
             relaxation_factor=relaxation_factor,
             matrix_size=matrix_size,
+            matrix_format=matrix_format,
         )
 
         if isinstance(response_validation, str):
@@ -58,6 +83,8 @@ class SORView(TemplateView):
                 "have_solution": False,
                 "solution": [],
             }
+            if stream:
+                return stream_iterations_response(None, result=error_response)
             template_data = template_data | error_response
             context["template_data"] = template_data
             return self.render_to_response(context)
@@ -67,6 +94,23 @@ class SORView(TemplateView):
         b = response_validation[1]
         x0 = response_validation[2]
 
+        if stream:
+            # Las filas se envían al cliente a medida que se calculan.
+            return stream_iterations_response(
+                self.method_service.iterate(
+                    A=A,
+                    b=b,
+                    x0=x0,
+                    tolerance=tolerance,
+                    max_iterations=max_iterations,
+                    relaxation_factor=relaxation_factor,
+                    precision_type=precision_type,
+                    retention=STREAM_RETENTION,
+                    compute_spectral_radius=compute_spectral_radius,
+                    ordering=ordering,
+                ),
+            )
+
         # Ejecutar el método SOR con los parámetros recibidos
         method_response = self.method_service.solve(
             A=A,
@@ -76,10 +120,12 @@ class SORView(TemplateView):
             max_iterations=max_iterations,
             relaxation_factor=relaxation_factor,
             precision_type=precision_type,  # Nuevo argumento para precisión
+            compute_spectral_radius=compute_spectral_radius,
+            ordering=ordering,
         )
 
         # Verificación de éxito y almacenamiento de la respuesta
-        template_data["indexes"] = list(range(1, len(A) + 1))
+        template_data["indexes"] = list(range(1, table_components(len(b)) + 1))
         template_data["relaxation_factor"] = relaxation_factor
         template_data = template_data | method_response
         context["template_data"] = template_data
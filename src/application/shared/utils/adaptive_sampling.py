@@ -0,0 +1,122 @@
+from typing import Callable
+import numpy as np
+
+"""
+
+Muestreo adaptativo de funciones para graficar. En lugar de evaluar miles de puntos equiespaciados, se parte de una malla gruesa y en cada ronda se evalúa el punto medio de los subintervalos pendientes (todos en una sola llamada vectorizada): si el punto medio se aleja de la recta entre los extremos más que la tolerancia (en unidades de y, normalmente media décima de píxel) o si uno de los extremos está fuera del dominio, el punto medio se agrega y las dos mitades se revisan en la siguiente ronda; si no, el subintervalo ya se ve recto y no se vuelve a dividir. Así las zonas planas quedan con pocos puntos y las zonas con curvatura, saltos o bordes del dominio se refinan hasta el ancho mínimo.
+
+"""
+
+# Puntos de la malla inicial.
+INITIAL_POINTS = 129
+
+# Número máximo de rondas de subdivisión; cada ronda divide a la mitad el ancho de los subintervalos pendientes.
+MAX_DEPTH = 12
+
+# Límite de evaluaciones, para funciones que oscilan sin control (por ejemplo sin(1/x) cerca de cero).
+MAX_EVALUATIONS = 10000
+
+
+def sample_adaptive(
+    function: Callable[[np.ndarray], np.ndarray],
+    lower: float,
+    upper: float,
+    tolerance: float,
+    y_bounds: tuple[float, float] | None = None,
+    min_width: float | None = None,
+    initial_points: int = INITIAL_POINTS,
+) -> tuple[np.ndarray, np.ndarray, int]:
+    """
+    Muestrea una función en [lower, upper] con subdivisión adaptativa.
+
+    Args:
+        function (Callable): Función vectorizada; recibe un arreglo de x y retorna f(x) con NaN fuera del dominio.
+        lower (float): Extremo inferior del rango.
+        upper (float): Extremo superior del rango.
+        tolerance (float): Distancia vertical máxima entre la curva y la recta que une dos muestras consecutivas.
+        y_bounds (tuple[float, float] | None): Rango visible de y; los valores fuera de él se acotan antes de comparar, así no se refinan las zonas que no se ven.
+        min_width (float | None): Ancho mínimo de un subintervalo; por defecto el rango dividido entre 2**MAX_DEPTH veces la malla inicial.
+        initial_points (int): Puntos de la malla inicial.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray, int]: Valores de x ordenados, valores de f(x) (NaN donde la línea se corta) y número de evaluaciones de la función.
+    """
+    x_vals = np.linspace(lower, upper, initial_points)
+    y_vals = _finite(function(x_vals))
+    evaluations = x_vals.size
+    if min_width is None:
+        min_width = (upper - lower) / ((initial_points - 1) * 2**MAX_DEPTH)
+
+    def visible(values):
+        if y_bounds is None:
+            return values
+        # Un margen de un alto de la gráfica, para que las pendientes que entran al área visible se refinen bien.
+        span = y_bounds[1] - y_bounds[0]
+        return np.clip(values, y_bounds[0] - span, y_bounds[1] + span)
+
+    # Subintervalos pendientes, como pares de extremos.
+    left, right = x_vals[:-1], x_vals[1:]
+    f_left, f_right = y_vals[:-1], y_vals[1:]
+    new_x, new_y, breaks = [], [], []
+
+    for _ in range(MAX_DEPTH):
+        if left.size == 0 or evaluations + left.size > MAX_EVALUATIONS:
+            break
+        middle = (left + right) / 2
+        f_middle = _finite(function(middle))
+        evaluations += middle.size
+
+        # Distancia entre el punto medio y la recta que une los extremos.
+        with np.errstate(invalid="ignore"):
+            deviation = np.abs(
+                visible(f_middle) - (visible(f_left) + visible(f_right)) / 2
+            )
+        defined = np.isfinite(f_left), np.isfinite(f_middle), np.isfinite(f_right)
+        # Un borde del dominio: algunos extremos están definidos y otros no.
+        domain_edge = ~(
+            (defined[0] & defined[1] & defined[2])
+            | ~(defined[0] | defined[1] | defined[2])
+        )
+        refine = domain_edge | (deviation > tolerance)
+
+        new_x.append(middle[refine])
+        new_y.append(f_middle[refine])
+
+        # Las mitades que ya miden el ancho mínimo no se dividen más.
+        narrow = (right - left) / 2 <= min_width
+        if y_bounds is not None:
+            # Un salto más alto que la gráfica en un subintervalo mínimo es una discontinuidad (por ejemplo un polo): la línea se corta ahí.
+            span = y_bounds[1] - y_bounds[0]
+            jump = refine & narrow & ~domain_edge & (np.abs(f_right - f_left) > span)
+            # El corte va en la mitad donde está el salto.
+            on_left = np.abs(f_middle - f_left) > np.abs(f_right - f_middle)
+            breaks.append(
+                np.where(on_left, (left + middle) / 2, (middle + right) / 2)[jump]
+            )
+
+        pending = refine & ~narrow
+        left = np.concatenate((left[pending], middle[pending]))
+        right = np.concatenate((middle[pending], right[pending]))
+        f_left = np.concatenate((f_left[pending], f_middle[pending]))
+        f_right = np.concatenate((f_middle[pending], f_right[pending]))
+
+    x_vals = np.concatenate((x_vals, *new_x))
+    y_vals = np.concatenate((y_vals, *new_y))
+    order = np.argsort(x_vals, kind="stable")
+    x_vals, y_vals = x_vals[order], y_vals[order]
+
+    if breaks:
+        cuts = np.concatenate(breaks)
+        if cuts.size:
+            # Un NaN entre las dos muestras del salto corta el trazo.
+            positions = np.searchsorted(x_vals, cuts, side="right")
+            x_vals = np.insert(x_vals, positions, cuts)
+            y_vals = np.insert(y_vals, positions, np.nan)
+
+    return x_vals, y_vals, evaluations
+
+
+def _finite(values) -> np.ndarray:
+    values = np.array(values, dtype=float)
+    values[~np.isfinite(values)] = np.nan
+    return values
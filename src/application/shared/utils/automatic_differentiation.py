@@ -0,0 +1,347 @@
+import ast
+import math
+from functools import lru_cache
+from types import SimpleNamespace
+from typing import Callable
+from config.settings import EXPRESSION_CACHE_SIZE
+from src.application.shared.utils.compile_expression import (
+    compile_expression_code,
+    normalize_expression,
+)
+
+"""
+
+Diferenciación automática en modo directo (forward mode) con números duales de segundo orden. Cada número guarda el valor de la función y sus dos primeras derivadas, y las operaciones aritméticas y funciones de `math` propagan las derivadas con la regla de la cadena. Al evaluar la expresión compilada una sola vez se obtienen f(x), f'(x) y f''(x) exactos, sin derivación simbólica.
+
+"""
+
+
+class DualNumber:
+    """
+    Número dual de segundo orden: valor, primera derivada y segunda derivada respecto a x.
+    """
+
+    __slots__ = ("value", "first", "second")
+
+    def __init__(self, value: float, first: float = 0.0, second: float = 0.0):
+        self.value = value
+        self.first = first
+        self.second = second
+
+    def __repr__(self) -> str:
+        return f"DualNumber({self.value}, {self.first}, {self.second})"
+
+    def __add__(self, other):
+        other = lift(other)
+        return DualNumber(
+            self.value + other.value,
+            self.first + other.first,
+            self.second + other.second,
+        )
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        other = lift(other)
+        return DualNumber(
+            self.value - other.value,
+            self.first - other.first,
+            self.second - other.second,
+        )
+
+    def __rsub__(self, other):
+        return lift(other) - self
+
+    def __mul__(self, other):
+        other = lift(other)
+        return DualNumber(
+            self.value * other.value,
+            self.first * other.value + self.value * other.first,
+            self.second * other.value
+            + 2 * self.first * other.first
+            + self.value * other.second,
+        )
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other):
+        other = lift(other)
+        value = self.value / other.value
+        first = (self.first - value * other.first) / other.value
+        second = (
+            self.second - 2 * first * other.first - value * other.second
+        ) / other.value
+        return DualNumber(value, first, second)
+
+    def __rtruediv__(self, other):
+        return lift(other) / self
+
+    def __floordiv__(self, other):
+        # La división entera es constante a trozos, su derivada es cero.
+        return DualNumber(self.value // lift(other).value)
+
+    def __rfloordiv__(self, other):
+        return lift(other) // self
+
+    def __mod__(self, other):
+        other = lift(other)
+        return self - other * (self.value // other.value)
+
+    def __rmod__(self, other):
+        return lift(other) % self
+
+    def __pow__(self, other):
+        if isinstance(other, DualNumber):
+            if other.first == 0 and other.second == 0:
+                return _power(self, other.value)
+            # u^v = exp(v * log(u)) cuando el exponente también depende de x.
+            return _exp(other * _log(self))
+        return _power(self, other)
+
+    def __rpow__(self, other):
+        # c^u = exp(u * ln(c)) con base constante.
+        value = math.pow(other, self.value)
+        log_base = math.log(other) if other != 0 else 0.0
+        return _chain(
+            self, value, log_base * value, log_base * log_base * value
+        )
+
+    def __neg__(self):
+        return DualNumber(-self.value, -self.first, -self.second)
+
+    def __pos__(self):
+        return self
+
+    def __abs__(self):
+        sign = math.copysign(1.0, self.value) if self.value != 0 else 0.0
+        return _chain(self, abs(self.value), sign, 0.0)
+
+    def __float__(self):
+        return float(self.value)
+
+    # Las comparaciones y el valor de verdad usan solo el valor; así en una función a trozos
+    # ("x if x > 0 else -x") se deriva la rama que corresponde a x.
+    def __bool__(self):
+        return self.value != 0
+
+    def __eq__(self, other):
+        return self.value == lift(other).value
+
+    def __ne__(self, other):
+        return self.value != lift(other).value
+
+    def __lt__(self, other):
+        return self.value < lift(other).value
+
+    def __le__(self, other):
+        return self.value <= lift(other).value
+
+    def __gt__(self, other):
+        return self.value > lift(other).value
+
+    def __ge__(self, other):
+        return self.value >= lift(other).value
+
+
+def lift(value) -> DualNumber:
+    """Convierte una constante en un número dual con derivadas nulas."""
+    if isinstance(value, DualNumber):
+        return value
+    return DualNumber(float(value))
+
+
+def _chain(u: DualNumber, g: float, g_prime: float, g_double_prime: float):
+    # Regla de la cadena de segundo orden para g(u(x)).
+    return DualNumber(
+        g,
+        g_prime * u.first,
+        g_double_prime * u.first * u.first + g_prime * u.second,
+    )
+
+
+def _power(u: DualNumber, exponent: float) -> DualNumber:
+    u = lift(u)
+    if float(exponent).is_integer():
+        n = int(exponent)
+        power = lambda k: u.value**k if k >= 0 or u.value != 0 else 0.0
+        return _chain(u, u.value**n, n * power(n - 1), n * (n - 1) * power(n - 2))
+    return _chain(
+        u,
+        math.pow(u.value, exponent),
+        exponent * math.pow(u.value, exponent - 1),
+        exponent * (exponent - 1) * math.pow(u.value, exponent - 2),
+    )
+
+
+def _unary(g: Callable, g_prime: Callable, g_double_prime: Callable) -> Callable:
+    # Construye una función de `math` que propaga derivadas a partir de g, g' y g''.
+    def function(u):
+        u = lift(u)
+        return _chain(u, g(u.value), g_prime(u.value), g_double_prime(u.value))
+
+    return function
+
+
+def _log(u, base=None):
+    result = _unary(math.log, lambda v: 1 / v, lambda v: -1 / (v * v))(u)
+    if base is None:
+        return result
+    return result / _log(base)
+
+
+def _sqrt(u):
+    u = lift(u)
+    root = math.sqrt(u.value)
+    return _chain(u, root, 1 / (2 * root), -1 / (4 * u.value * root))
+
+
+_exp = _unary(math.exp, math.exp, math.exp)
+
+
+# Funciones y constantes de `math` con derivada automática.
+DUAL_MATH_FUNCTIONS = {
+    "sin": _unary(math.sin, math.cos, lambda v: -math.sin(v)),
+    "cos": _unary(math.cos, lambda v: -math.sin(v), lambda v: -math.cos(v)),
+    "tan": _unary(
+        math.tan,
+        lambda v: 1 + math.tan(v) ** 2,
+        lambda v: 2 * math.tan(v) * (1 + math.tan(v) ** 2),
+    ),
+    "asin": _unary(
+        math.asin,
+        lambda v: 1 / math.sqrt(1 - v * v),
+        lambda v: v / (1 - v * v) ** 1.5,
+    ),
+    "acos": _unary(
+        math.acos,
+        lambda v: -1 / math.sqrt(1 - v * v),
+        lambda v: -v / (1 - v * v) ** 1.5,
+    ),
+    "atan": _unary(
+        math.atan,
+        lambda v: 1 / (1 + v * v),
+        lambda v: -2 * v / (1 + v * v) ** 2,
+    ),
+    "sinh": _unary(math.sinh, math.cosh, math.sinh),
+    "cosh": _unary(math.cosh, math.sinh, math.cosh),
+    "tanh": _unary(
+        math.tanh,
+        lambda v: 1 - math.tanh(v) ** 2,
+        lambda v: -2 * math.tanh(v) * (1 - math.tanh(v) ** 2),
+    ),
+    "asinh": _unary(
+        math.asinh,
+        lambda v: 1 / math.sqrt(v * v + 1),
+        lambda v: -v / (v * v + 1) ** 1.5,
+    ),
+    "acosh": _unary(
+        math.acosh,
+        lambda v: 1 / math.sqrt(v * v - 1),
+        lambda v: -v / (v * v - 1) ** 1.5,
+    ),
+    "atanh": _unary(
+        math.atanh,
+        lambda v: 1 / (1 - v * v),
+        lambda v: 2 * v / (1 - v * v) ** 2,
+    ),
+    "exp": _exp,
+    "exp2": _unary(
+        math.exp2,
+        lambda v: math.log(2) * math.exp2(v),
+        lambda v: math.log(2) ** 2 * math.exp2(v),
+    ),
+    "expm1": _unary(math.expm1, math.exp, math.exp),
+    "log": _log,
+    "log10": lambda u: _log(u) / math.log(10),
+    "log2": lambda u: _log(u) / math.log(2),
+    "log1p": _unary(
+        math.log1p, lambda v: 1 / (1 + v), lambda v: -1 / (1 + v) ** 2
+    ),
+    "sqrt": _sqrt,
+    "cbrt": _unary(
+        math.cbrt,
+        lambda v: 1 / (3 * math.cbrt(v) ** 2),
+        lambda v: -2 / (9 * math.cbrt(v) ** 5),
+    ),
+    "pow": lambda u, v: lift(u) ** v,
+    "fabs": abs,
+    "floor": _unary(math.floor, lambda v: 0.0, lambda v: 0.0),
+    "ceil": _unary(math.ceil, lambda v: 0.0, lambda v: 0.0),
+    "trunc": _unary(math.trunc, lambda v: 0.0, lambda v: 0.0),
+    "degrees": lambda u: lift(u) * (180 / math.pi),
+    "radians": lambda u: lift(u) * (math.pi / 180),
+    "hypot": lambda *values: _sqrt(sum(lift(v) * lift(v) for v in values)),
+    "pi": math.pi,
+    "e": math.e,
+    "tau": math.tau,
+    "inf": math.inf,
+    "nan": math.nan,
+}
+
+# Funciones integradas permitidas con derivada automática.
+DUAL_BUILTINS = {
+    "abs": abs,
+    "pow": lambda u, v: lift(u) ** v,
+    "min": lambda *values: min(values, key=lambda v: lift(v).value),
+    "max": lambda *values: max(values, key=lambda v: lift(v).value),
+    "round": lambda u, digits=0: DualNumber(round(lift(u).value, digits)),
+}
+
+
+@lru_cache(maxsize=EXPRESSION_CACHE_SIZE)
+def _compile_normalized_dual_expression(
+    source: str,
+) -> Callable[[float], tuple[float, float, float]] | None:
+    code = compile_expression_code(source)
+
+    # Si la expresión usa una función de `math` sin derivada automática no se puede diferenciar.
+    for node in ast.walk(ast.parse(source, mode="eval")):
+        if isinstance(node, ast.Attribute) and node.attr not in DUAL_MATH_FUNCTIONS:
+            return None
+
+    scope = {
+        "__builtins__": {},
+        "math": SimpleNamespace(**DUAL_MATH_FUNCTIONS),
+    } | DUAL_BUILTINS
+    function = eval(code, scope)
+
+    def evaluate(x: float) -> tuple[float, float, float]:
+        result = lift(function(DualNumber(x, 1.0, 0.0)))
+        return result.value, result.first, result.second
+
+    return evaluate
+
+
+def compile_dual_expression(
+    source: str,
+) -> Callable[[float], tuple[float, float, float]] | None:
+    """
+    Compila una expresión para evaluar f(x), f'(x) y f''(x) en una sola pasada.
+
+    Args:
+        source (str): Expresión ingresada por el usuario, por ejemplo "x**2 - math.cos(x)".
+
+    Returns:
+        Callable | None: Función que retorna la tupla (f(x), f'(x), f''(x)), o None si la expresión usa funciones sin derivada automática.
+
+    Raises:
+        SyntaxError: Si la expresión no es válida o usa construcciones no permitidas.
+        NameError: Si la expresión usa nombres no definidos.
+    """
+    return _compile_normalized_dual_expression(normalize_expression(source))
+
+
+def dual_expression_cache_info() -> dict:
+    """
+    Retorna las estadísticas de la caché de expresiones con derivada automática.
+
+    Returns:
+        dict: Aciertos, fallos, tamaño actual y tamaño máximo de la caché.
+    """
+    info = _compile_normalized_dual_expression.cache_info()
+    return {
+        "hits": info.hits,
+        "misses": info.misses,
+        "size": info.currsize,
+        "max_size": info.maxsize,
+    }
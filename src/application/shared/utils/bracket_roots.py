@@ -0,0 +1,147 @@
+import math
+import numpy as np
+from src.application.shared.utils.iteration_table import (
+    DEFAULT_RETENTION,
+    IterationTable,
+)
+from src.application.shared.utils.vectorize_expression import (
+    evaluate_expression_array,
+)
+
+"""
+
+Localiza todas las raíces de una función en un intervalo [a,b]. Primero se evalúa f(x) sobre una malla fina en una sola llamada vectorizada y se buscan los cambios de signo entre puntos consecutivos; cada cambio de signo es un subintervalo que contiene al menos una raíz. Después todos los subintervalos se refinan a la vez con bisección sobre arreglos: en cada iteración se calculan los puntos medios de todos los subintervalos activos y se evalúa la función en una sola llamada, en lugar de repetir el método una vez por cada raíz.
+
+"""
+
+# Número de puntos de la malla con la que se buscan los cambios de signo.
+DEFAULT_GRID_POINTS = 2000
+
+
+def find_sign_changes(
+    function_f: str, interval_a: float, interval_b: float, grid_points: int
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Busca los subintervalos de la malla en los que la función cambia de signo.
+
+    Args:
+        function_f (str): Función ingresada por el usuario.
+        interval_a (float): Extremo inferior del intervalo.
+        interval_b (float): Extremo superior del intervalo.
+        grid_points (int): Número de puntos de la malla.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: Matriz de forma (n, 2) con los extremos de cada subintervalo con cambio de signo, y arreglo con los puntos de la malla donde f(x) es exactamente cero.
+    """
+    x_vals = np.linspace(interval_a, interval_b, grid_points)
+    y_vals = evaluate_expression_array(function_f, x_vals)
+
+    # Los puntos fuera del dominio tienen signo NaN y nunca cumplen la condición.
+    signs = np.sign(y_vals)
+    changes = np.flatnonzero(signs[:-1] * signs[1:] < 0)
+    brackets = np.column_stack((x_vals[changes], x_vals[changes + 1]))
+
+    return brackets, x_vals[y_vals == 0]
+
+
+def bisect_brackets(
+    function_f: str,
+    brackets: np.ndarray,
+    tolerance: float,
+    max_iterations: int,
+    precision: int,
+) -> list[dict]:
+    """
+    Refina simultáneamente todos los subintervalos con el método de bisección.
+
+    Args:
+        function_f (str): Función ingresada por el usuario.
+        brackets (np.ndarray): Matriz de forma (n, 2) con los extremos de cada subintervalo; f debe cambiar de signo en cada uno.
+        tolerance (float): Tolerancia del error.
+        max_iterations (int): Número máximo de iteraciones.
+        precision (int): 1 para error absoluto (decimales correctos), 0 para error relativo (cifras significativas).
+
+    Returns:
+        list[dict]: Por cada subintervalo, un diccionario con "root", "table", "have_solution", "error" e "interval" (subintervalo inicial).
+    """
+    left = brackets[:, 0].astype(float)
+    right = brackets[:, 1].astype(float)
+    f_left = evaluate_expression_array(function_f, left)
+    f_right = evaluate_expression_array(function_f, right)
+
+    count = len(brackets)
+    tables = [
+        IterationTable(
+            ("approximate_value", "f_evaluated", "error"), retention=DEFAULT_RETENTION
+        )
+        for _ in range(count)
+    ]
+    roots = np.zeros(count)
+    errors = np.full(count, math.inf)
+    previous = np.full(count, np.nan)
+    have_solution = np.zeros(count, dtype=bool)
+    active = np.ones(count, dtype=bool)
+
+    # Cota del valor de |f| en el subintervalo inicial, sirve para descartar discontinuidades.
+    initial_bound = np.maximum(np.abs(f_left), np.abs(f_right))
+
+    for current_iteration in range(1, max_iterations + 1):
+        indices = np.flatnonzero(active)
+        if indices.size == 0:
+            break
+
+        # Punto medio de todos los subintervalos activos, evaluados en una sola llamada.
+        midpoints = (left[indices] + right[indices]) / 2
+        f_midpoints = evaluate_expression_array(function_f, midpoints)
+
+        # Error de dispersión; en la primera iteración no hay valor previo para comparar.
+        with np.errstate(divide="ignore", invalid="ignore"):
+            if current_iteration == 1:
+                current_errors = np.full(indices.size, math.inf)
+            elif precision:
+                current_errors = np.abs(midpoints - previous[indices])
+            else:
+                current_errors = np.abs(
+                    (midpoints - previous[indices]) / midpoints
+                )
+
+        for index, Xn, f, error in zip(
+            indices, midpoints, f_midpoints, current_errors
+        ):
+            tables[index].append(
+                current_iteration, approximate_value=Xn, f_evaluated=f, error=error
+            )
+
+        roots[indices] = midpoints
+        errors[indices] = current_errors
+        previous[indices] = midpoints
+
+        # Un subintervalo termina si f(Xn) es cero, si el error es menor a la tolerancia o si f(Xn) no está definida.
+        exact = f_midpoints == 0
+        converged = exact | (current_errors < tolerance)
+        invalid = ~np.isfinite(f_midpoints)
+        have_solution[indices[converged]] = True
+        active[indices[converged | invalid]] = False
+
+        # La raíz queda en [a, Xn] si f(a) y f(Xn) tienen signos opuestos; en otro caso en [Xn, b].
+        on_left = np.sign(f_left[indices]) * np.sign(f_midpoints) < 0
+        right[indices[on_left]] = midpoints[on_left]
+        left[indices[~on_left]] = midpoints[~on_left]
+        f_left[indices[~on_left]] = f_midpoints[~on_left]
+
+    # En un polo (por ejemplo tan(x) en pi/2) el signo cambia pero |f| crece al acercarse; no es raíz.
+    f_roots = evaluate_expression_array(function_f, roots)
+    pole = np.abs(f_roots) > initial_bound
+    have_solution &= ~pole
+
+    return [
+        {
+            "root": float(roots[i]),
+            "table": tables[i],
+            "have_solution": bool(have_solution[i]),
+            "error": float(errors[i]),
+            "interval": (float(brackets[i, 0]), float(brackets[i, 1])),
+        }
+        for i in range(count)
+        if not pole[i]
+    ]
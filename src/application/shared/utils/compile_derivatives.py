@@ -0,0 +1,139 @@
+import ast
+from functools import lru_cache
+from config.settings import EXPRESSION_CACHE_SIZE
+from src.application.shared.utils.automatic_differentiation import (
+    compile_dual_expression,
+)
+from src.application.shared.utils.compile_expression import (
+    compile_expression,
+    normalize_expression,
+    real_valued,
+)
+from src.application.shared.utils.convert_math_to_simply import convert_math_to_sympy
+
+"""
+
+Obtiene f(x), f'(x) y f''(x) como funciones de Python a partir de las funciones ingresadas por el usuario. Hay dos motores de derivación: "automatic", que usa diferenciación automática con números duales sobre la expresión compilada, y "sympy", que deriva simbólicamente con SymPy y convierte el resultado con lambdify. Los resultados se guardan en cachés LRU acotadas cuya llave es la expresión normalizada, así las solicitudes repetidas no vuelven a derivar la función.
+
+"""
+
+DERIVATIVE_ENGINES = ("automatic", "sympy")
+
+
+@lru_cache(maxsize=EXPRESSION_CACHE_SIZE)
+def _compile_normalized_sympy_derivatives(source: str) -> dict:
+    import sympy as sp
+
+    x = sp.symbols("x")
+
+    # Convierte la función ingresada de `math` a `SymPy` y la deriva simbólicamente
+    f_expr = sp.sympify(convert_math_to_sympy(source))
+    f_prime_expr = sp.diff(f_expr, x)
+    f_double_prime_expr = sp.diff(f_prime_expr, x)
+
+    # Crea funciones evaluables en Python utilizando lambdify; como en compile_expression, un resultado complejo es un error de dominio
+    f = real_valued(sp.lambdify(x, f_expr, modules=["math"]))
+    f_prime = real_valued(sp.lambdify(x, f_prime_expr, modules=["math"]))
+    f_double_prime = real_valued(sp.lambdify(x, f_double_prime_expr, modules=["math"]))
+
+    def evaluate(value: float, order: int = 2) -> tuple:
+        derivatives = (f, f_prime, f_double_prime)[: order + 1]
+        return tuple(derivative(value) for derivative in derivatives)
+
+    return {
+        "uses_x": f_expr.free_symbols == {x},
+        "f": f,
+        "f_prime": f_prime,
+        "f_double_prime": f_double_prime,
+        "evaluate": evaluate,
+    }
+
+
+@lru_cache(maxsize=EXPRESSION_CACHE_SIZE)
+def _compile_normalized_automatic_derivatives(source: str) -> dict | None:
+    evaluate_dual = compile_dual_expression(source)
+    if evaluate_dual is None:
+        return None
+
+    # f se evalúa con la expresión compilada: los números duales también calculan f' y f'', y fallan donde
+    # alguna derivada es singular (math.sqrt(x) en 0, math.acos(x) en 1) aunque f sí esté definida.
+    f = compile_expression(source)
+
+    def derivatives_at(value: float) -> tuple:
+        try:
+            return evaluate_dual(value)[1:]
+        except (ArithmeticError, ValueError):
+            # Se usa SymPy, como con DERIVATIVE_ENGINE="sympy"; si ahí también falla el error llega al método
+            sympy_derivatives = _compile_normalized_sympy_derivatives(source)
+            return sympy_derivatives["f_prime"](value), sympy_derivatives["f_double_prime"](value)
+
+    def evaluate(value: float, order: int = 2) -> tuple:
+        fx = f(value)
+        if order == 0:
+            return (fx,)
+        return (fx, *derivatives_at(value)[:order])
+
+    return {
+        "uses_x": any(
+            isinstance(node, ast.Name) and node.id == "x"
+            for node in ast.walk(ast.parse(source, mode="eval"))
+        ),
+        "f": f,
+        "f_prime": lambda value: derivatives_at(value)[0],
+        "f_double_prime": lambda value: derivatives_at(value)[1],
+        "evaluate": evaluate,
+    }
+
+
+def compile_derivatives(function_f: str, engine: str = "automatic") -> dict:
+    """
+    Obtiene f(x), f'(x) y f''(x) como funciones de Python, usando la caché cuando es posible.
+
+    Args:
+        function_f (str): Función ingresada por el usuario con la sintaxis de `math`.
+        engine (str): Motor de derivación, "automatic" (números duales) o "sympy" (derivación simbólica). Si la función usa algo sin derivada automática se usa SymPy.
+
+    Returns:
+        dict: Funciones "f", "f_prime" y "f_double_prime", la función "evaluate(x, order)" que retorna (f(x), f'(x), ...) hasta el orden pedido, y la bandera "uses_x" que indica si la función depende de 'x'.
+
+    Raises:
+        ValueError: Si el motor de derivación no existe.
+        Exception: Si la función no se puede interpretar o derivar.
+    """
+    if engine not in DERIVATIVE_ENGINES:
+        raise ValueError(f"Motor de derivación desconocido: {engine}.")
+
+    source = normalize_expression(function_f)
+    if engine == "automatic":
+        derivatives = _compile_normalized_automatic_derivatives(source)
+        if derivatives is not None:
+            return derivatives
+
+    return _compile_normalized_sympy_derivatives(source)
+
+
+def derivative_cache_info() -> dict:
+    """
+    Retorna las estadísticas de las cachés de derivadas de cada motor.
+
+    Returns:
+        dict: Aciertos, fallos, tamaño actual y tamaño máximo de la caché de cada motor.
+    """
+    return {
+        engine: {
+            "hits": info.hits,
+            "misses": info.misses,
+            "size": info.currsize,
+            "max_size": info.maxsize,
+        }
+        for engine, info in (
+            ("automatic", _compile_normalized_automatic_derivatives.cache_info()),
+            ("sympy", _compile_normalized_sympy_derivatives.cache_info()),
+        )
+    }
+
+
+def clear_derivative_cache() -> None:
+    """Vacía las cachés de derivadas y reinicia sus contadores."""
+    _compile_normalized_automatic_derivatives.cache_clear()
+    _compile_normalized_sympy_derivatives.cache_clear()
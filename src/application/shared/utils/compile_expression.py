@@ -0,0 +1,214 @@
+import ast
+import math
+from functools import lru_cache
+from types import CodeType
+from typing import Callable
+from config.settings import EXPRESSION_CACHE_SIZE
+
+"""
+
+Compila una sola vez las expresiones ingresadas por el usuario (por ejemplo "x**2 - math.cos(x)") en una función de Python f(x). La expresión se valida contra una lista blanca de nodos del AST antes de compilarse, y las funciones resultantes se guardan en una caché LRU acotada cuya llave es la expresión normalizada, de modo que los servicios y las gráficas no vuelven a interpretar el mismo texto en cada iteración.
+
+"""
+
+# Funciones integradas de Python que se permiten dentro de las expresiones.
+ALLOWED_BUILTINS = {
+    "abs": abs,
+    "pow": pow,
+    "min": min,
+    "max": max,
+    "round": round,
+}
+
+# Atributos públicos del módulo math que se permiten (math.sin, math.pi, ...).
+ALLOWED_MATH_ATTRIBUTES = frozenset(
+    name for name in dir(math) if not name.startswith("_")
+)
+
+# Nodos del AST permitidos en una expresión.
+ALLOWED_NODES = (
+    ast.Expression,
+    ast.BinOp,
+    ast.UnaryOp,
+    ast.Call,
+    ast.Attribute,
+    ast.Name,
+    ast.Constant,
+    ast.Load,
+    ast.Add,
+    ast.Sub,
+    ast.Mult,
+    ast.Div,
+    ast.FloorDiv,
+    ast.Mod,
+    ast.Pow,
+    ast.UAdd,
+    ast.USub,
+    # Comparaciones y expresiones condicionales, para funciones a trozos como "x if x > 0 else -x"
+    ast.Compare,
+    ast.IfExp,
+    ast.BoolOp,
+    ast.And,
+    ast.Or,
+    ast.Not,
+    ast.Eq,
+    ast.NotEq,
+    ast.Lt,
+    ast.LtE,
+    ast.Gt,
+    ast.GtE,
+)
+
+
+def normalize_expression(source: str) -> str:
+    """
+    Normaliza el texto de una expresión colapsando los espacios en blanco.
+
+    Args:
+        source (str): Expresión ingresada por el usuario.
+
+    Returns:
+        str: Expresión normalizada usada como llave de la caché.
+    """
+    return " ".join(source.split())
+
+
+def validate_expression_tree(tree: ast.AST) -> None:
+    """
+    Verifica que el AST de la expresión solo contenga nodos, nombres y atributos permitidos.
+
+    Args:
+        tree (ast.AST): Árbol de la expresión en modo "eval".
+
+    Raises:
+        SyntaxError: Si la expresión usa una construcción no permitida.
+        NameError: Si la expresión usa un nombre distinto de 'x', 'math' o una función permitida.
+    """
+    for node in ast.walk(tree):
+        if not isinstance(node, ALLOWED_NODES):
+            raise SyntaxError(
+                f"construcción no permitida en la expresión: {type(node).__name__}"
+            )
+
+        if isinstance(node, ast.Constant) and not isinstance(
+            node.value, (int, float)
+        ):
+            raise SyntaxError("solo se permiten constantes numéricas")
+
+        if isinstance(node, ast.Name) and node.id not in (
+            {"x", "math"} | ALLOWED_BUILTINS.keys()
+        ):
+            raise NameError(f"name '{node.id}' is not defined")
+
+        if isinstance(node, ast.Attribute):
+            if not (isinstance(node.value, ast.Name) and node.value.id == "math"):
+                raise SyntaxError("solo se permiten atributos del módulo 'math'")
+            if node.attr not in ALLOWED_MATH_ATTRIBUTES:
+                raise NameError(f"module 'math' has no attribute '{node.attr}'")
+
+        if isinstance(node, ast.Call):
+            if node.keywords:
+                raise SyntaxError("no se permiten argumentos con nombre")
+            if not isinstance(node.func, (ast.Name, ast.Attribute)):
+                raise SyntaxError("solo se permiten llamadas a funciones de 'math'")
+
+
+def compile_expression_code(source: str) -> CodeType:
+    """
+    Valida una expresión y la compila como el código de "lambda x: <expresión>".
+
+    Args:
+        source (str): Expresión normalizada.
+
+    Returns:
+        CodeType: Código que al evaluarse en un ámbito retorna la función f(x).
+
+    Raises:
+        SyntaxError: Si la expresión no es válida o usa construcciones no permitidas.
+        NameError: Si la expresión usa nombres no definidos.
+    """
+    tree = ast.parse(source, mode="eval")
+    validate_expression_tree(tree)
+
+    # Envolvemos la expresión en "lambda x: <expresión>" para obtener una función real.
+    lambda_tree = ast.Expression(
+        body=ast.Lambda(
+            args=ast.arguments(
+                posonlyargs=[],
+                args=[ast.arg(arg="x")],
+                kwonlyargs=[],
+                kw_defaults=[],
+                defaults=[],
+            ),
+            body=tree.body,
+        )
+    )
+    ast.fix_missing_locations(lambda_tree)
+    return compile(lambda_tree, "<function>", "eval")
+
+
+def real_valued(function: Callable[[float], float]) -> Callable[[float], float]:
+    """
+    Envuelve una función para que lance ValueError cuando su resultado no es un número real.
+
+    Una potencia fraccionaria de un número negativo (x**0.5 con x < 0) da un complejo en lugar de fallar como math.sqrt; se trata igual, como un valor fuera del dominio real.
+    """
+
+    def real_function(x):
+        value = function(x)
+        if type(value) is complex:
+            raise ValueError(
+                f"el resultado en x = {x} no es un número real (por ejemplo, la raíz par de un número negativo)"
+            )
+        return value
+
+    return real_function
+
+
+@lru_cache(maxsize=EXPRESSION_CACHE_SIZE)
+def _compile_normalized_expression(source: str) -> Callable[[float], float]:
+    code = compile_expression_code(source)
+    scope = {"__builtins__": {}, "math": math} | ALLOWED_BUILTINS
+    return real_valued(eval(code, scope))
+
+
+def compile_expression(source: str) -> Callable[[float], float]:
+    """
+    Compila una expresión en función de 'x' y la guarda en la caché LRU.
+
+    Args:
+        source (str): Expresión ingresada por el usuario, por ejemplo "x**2 - math.cos(x)".
+
+    Returns:
+        Callable[[float], float]: Función f(x) equivalente a la expresión.
+
+    Raises:
+        SyntaxError: Si la expresión no es válida o usa construcciones no permitidas.
+        NameError: Si la expresión usa nombres no definidos.
+
+    La función retornada lanza ValueError si el resultado en algún x no es real.
+    """
+    if not isinstance(source, str):
+        raise SyntaxError("la expresión debe ser un texto")
+    return _compile_normalized_expression(normalize_expression(source))
+
+
+def expression_cache_info() -> dict:
+    """
+    Retorna las estadísticas de la caché de expresiones compiladas.
+
+    Returns:
+        dict: Aciertos, fallos, tamaño actual y tamaño máximo de la caché.
+    """
+    info = _compile_normalized_expression.cache_info()
+    return {
+        "hits": info.hits,
+        "misses": info.misses,
+        "size": info.currsize,
+        "max_size": info.maxsize,
+    }
+
+
+def clear_expression_cache() -> None:
+    """Vacía la caché de expresiones compiladas y reinicia sus contadores."""
+    _compile_normalized_expression.cache_clear()
@@ -0,0 +1,42 @@
+import math
+
+"""
+
+Estima el orden de convergencia de un método iterativo a partir de los errores de dispersión guardados en su tabla. Si e(k) es el error de la iteración k, el orden p cumple aproximadamente e(k+1) ≈ C·e(k)^p, es decir, log e(k+1) ≈ log C + p·log e(k). El orden se obtiene como la pendiente de la recta de mínimos cuadrados sobre las últimas iteraciones, lo que suaviza las oscilaciones de métodos como Illinois que alternan pasos rápidos y lentos.
+
+"""
+
+
+# Número máximo de errores finales con los que se ajusta la recta.
+ORDER_FIT_WINDOW = 6
+
+
+def estimate_convergence_order(table: dict) -> float | None:
+    """
+    Estima el orden de convergencia con los últimos errores válidos de la tabla.
+
+    Args:
+        table (dict): Tabla del método con la llave "error" en cada iteración.
+
+    Returns:
+        float | None: Orden de convergencia estimado, o None si no hay suficientes errores para estimarlo.
+    """
+    errors = [
+        math.log(row["error"])
+        for row in table.values()
+        if math.isfinite(row.get("error", math.inf)) and row["error"] > 0
+    ][-ORDER_FIT_WINDOW:]
+    if len(errors) < 3:
+        return None
+
+    # Pendiente de mínimos cuadrados de log e(k+1) contra log e(k).
+    current, following = errors[:-1], errors[1:]
+    mean_current = sum(current) / len(current)
+    mean_following = sum(following) / len(following)
+    variance = sum((e - mean_current) ** 2 for e in current)
+    if variance == 0:
+        return None
+    covariance = sum(
+        (e - mean_current) * (g - mean_following) for e, g in zip(current, following)
+    )
+    return covariance / variance
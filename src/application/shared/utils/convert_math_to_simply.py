@@ -1,5 +1,73 @@
+import ast
+
+# Relaciones de SymPy equivalentes a cada comparación de Python.
+SYMPY_COMPARISONS = {
+    ast.Eq: "Eq",
+    ast.NotEq: "Ne",
+    ast.Lt: "Lt",
+    ast.LtE: "Le",
+    ast.Gt: "Gt",
+    ast.GtE: "Ge",
+}
+
+
+def _call(name, *args):
+    return ast.Call(func=ast.Name(id=name, ctx=ast.Load()), args=list(args), keywords=[])
+
+
+def _piecewise(*pieces):
+    return _call("Piecewise", *(ast.Tuple(elts=list(piece), ctx=ast.Load()) for piece in pieces))
+
+
+class _ConditionalsToSympy(ast.NodeTransformer):
+    # SymPy no puede decidir "x if x > 0 else -x" con x simbólico; la expresión se reescribe como Piecewise
+    def condition(self, node):
+        if isinstance(node, ast.Compare):
+            terms = [self.visit(node.left)] + [self.visit(term) for term in node.comparators]
+            relations = [
+                _call(SYMPY_COMPARISONS[type(op)], terms[i], terms[i + 1])
+                for i, op in enumerate(node.ops)
+            ]
+            return relations[0] if len(relations) == 1 else _call("And", *relations)
+        if isinstance(node, ast.BoolOp):
+            name = "And" if isinstance(node.op, ast.And) else "Or"
+            return _call(name, *(self.condition(value) for value in node.values))
+        if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.Not):
+            return _call("Not", self.condition(node.operand))
+        # Como en Python, un número es verdadero si no es cero
+        return _call("Ne", self.visit(node), ast.Constant(0))
+
+    def visit_IfExp(self, node):
+        return _piecewise(
+            (self.visit(node.body), self.condition(node.test)),
+            (self.visit(node.orelse), ast.Constant(True)),
+        )
+
+    # Una condición usada como número vale 1 o 0, como True y False en Python
+    def visit_Compare(self, node):
+        return _piecewise((ast.Constant(1), self.condition(node)), (ast.Constant(0), ast.Constant(True)))
+
+    visit_BoolOp = visit_Compare
+
+    def visit_UnaryOp(self, node):
+        if isinstance(node.op, ast.Not):
+            return self.visit_Compare(node)
+        return self.generic_visit(node)
+
+
+def convert_conditionals_to_sympy(expr):
+    try:
+        tree = ast.parse(expr, mode="eval")
+    except SyntaxError:
+        return expr
+    if not any(isinstance(node, (ast.Compare, ast.IfExp, ast.BoolOp, ast.Not)) for node in ast.walk(tree)):
+        return expr
+    return ast.unparse(ast.fix_missing_locations(_ConditionalsToSympy().visit(tree)))
+
+
 # Función auxiliar para convertir expresiones de `math` a `SymPy`
 def convert_math_to_sympy(expr):
+    expr = convert_conditionals_to_sympy(expr)
     replacements = {
         "math.exp": "exp",
         "math.log": "log",
@@ -0,0 +1,156 @@
+import numpy as np
+from django.conf import settings
+
+"""
+
+Reducción de puntos de las series antes de graficarlas, conservando su forma. Primero se aplica Ramer–Douglas–Peucker en coordenadas de pantalla: se descartan los puntos que se alejan menos de PLOT_SIMPLIFY_TOLERANCE píxeles de la recta que une a sus vecinos conservados, así una recta de 500 muestras queda en sus dos extremos y las curvas suaves en unas decenas de puntos. Si la serie aún supera PLOT_MAX_POINTS puntos (por ejemplo una función que oscila mucho), se reduce con Largest-Triangle-Three-Buckets (LTTB), que en cada tramo conserva el punto que forma el triángulo de mayor área con sus vecinos y mantiene los picos.
+
+Los valores NaN cortan la línea: cada tramo se reduce por separado y los cortes se conservan.
+
+"""
+
+
+def downsample(
+    x_vals,
+    y_vals,
+    xlim: tuple[float, float] | None = None,
+    ylim: tuple[float, float] | None = None,
+    pixels: tuple[int, int] = (520, 320),
+    tolerance: float | None = None,
+    max_points: int | None = None,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Reduce los puntos de una serie sin cambiar cómo se ve.
+
+    Args:
+        x_vals: Valores de x.
+        y_vals: Valores de y; NaN corta la línea.
+        xlim (tuple[float, float] | None): Rango visible de x; por defecto el de la serie.
+        ylim (tuple[float, float] | None): Rango visible de y; por defecto el de la serie.
+        pixels (tuple[int, int]): Tamaño aproximado del área de la gráfica en píxeles.
+        tolerance (float | None): Distancia máxima en píxeles para descartar un punto; 0 desactiva Douglas–Peucker. Por defecto PLOT_SIMPLIFY_TOLERANCE.
+        max_points (int | None): Número máximo de puntos; por defecto PLOT_MAX_POINTS.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: Valores de x y de y conservados.
+    """
+    if tolerance is None:
+        tolerance = settings.PLOT_SIMPLIFY_TOLERANCE
+    if max_points is None:
+        max_points = settings.PLOT_MAX_POINTS
+
+    x_vals = np.asarray(x_vals, dtype=float)
+    y_vals = np.asarray(y_vals, dtype=float)
+    if x_vals.size <= 2:
+        return x_vals, y_vals
+
+    finite = np.isfinite(x_vals) & np.isfinite(y_vals)
+    if not finite.any():
+        return x_vals, y_vals
+
+    # Coordenadas de pantalla: la tolerancia se mide en píxeles en ambos ejes.
+    x_px = _to_pixels(x_vals, xlim or _extent(x_vals[finite]), pixels[0])
+    y_px = _to_pixels(y_vals, ylim or _extent(y_vals[finite]), pixels[1])
+    if ylim is not None:
+        # Fuera del área visible solo importa por dónde sale y entra la línea.
+        y_px = np.clip(y_px, -pixels[1], 2 * pixels[1])
+
+    edges = np.diff(np.concatenate(([0], finite.astype(np.int8), [0])))
+    runs = list(zip(np.flatnonzero(edges == 1), np.flatnonzero(edges == -1)))
+
+    kept = []
+    for start, end in runs:
+        indices = np.arange(start, end)
+        if tolerance > 0 and indices.size > 2:
+            indices = indices[_douglas_peucker(x_px[indices], y_px[indices], tolerance)]
+        kept.append(indices)
+
+    total = sum(indices.size for indices in kept)
+    if total > max_points:
+        for position, indices in enumerate(kept):
+            # Cada tramo recibe una parte del límite proporcional a su número de puntos.
+            target = max(3, max_points * indices.size // total)
+            if indices.size > target:
+                kept[position] = indices[
+                    _largest_triangle_three_buckets(x_px[indices], y_px[indices], target)
+                ]
+
+    # Entre dos tramos se conserva un NaN para que la línea siga cortada.
+    selected = []
+    for position, indices in enumerate(kept):
+        selected.append(indices)
+        if position + 1 < len(kept):
+            selected.append(np.array([indices[-1] + 1]))
+    selected = np.concatenate(selected)
+    return x_vals[selected], y_vals[selected]
+
+
+def _extent(values: np.ndarray) -> tuple[float, float]:
+    lower, upper = float(values.min()), float(values.max())
+    return (lower, upper) if upper > lower else (lower - 1, upper + 1)
+
+
+def _to_pixels(values: np.ndarray, limits: tuple[float, float], size: int) -> np.ndarray:
+    with np.errstate(invalid="ignore", over="ignore"):
+        return (values - limits[0]) / (limits[1] - limits[0]) * size
+
+
+def _douglas_peucker(x_px: np.ndarray, y_px: np.ndarray, tolerance: float) -> np.ndarray:
+    """
+    Índices que conserva Ramer–Douglas–Peucker; se usa una pila en lugar de recursión.
+    """
+    keep = np.zeros(x_px.size, dtype=bool)
+    keep[0] = keep[-1] = True
+    stack = [(0, x_px.size - 1)]
+    while stack:
+        first, last = stack.pop()
+        if last - first < 2:
+            continue
+        dx = x_px[last] - x_px[first]
+        dy = y_px[last] - y_px[first]
+        inner_x = x_px[first + 1 : last] - x_px[first]
+        inner_y = y_px[first + 1 : last] - y_px[first]
+        length = np.hypot(dx, dy)
+        if length > 0:
+            distances = np.abs(dx * inner_y - dy * inner_x) / length
+        else:
+            distances = np.hypot(inner_x, inner_y)
+        farthest = int(np.argmax(distances))
+        if distances[farthest] > tolerance:
+            index = first + 1 + farthest
+            keep[index] = True
+            stack.append((first, index))
+            stack.append((index, last))
+    return np.flatnonzero(keep)
+
+
+def _largest_triangle_three_buckets(
+    x_px: np.ndarray, y_px: np.ndarray, target: int
+) -> np.ndarray:
+    """
+    Índices que conserva LTTB: el primero, el último y uno por cada uno de los `target - 2` grupos intermedios.
+    """
+    size = x_px.size
+    # Límites de los grupos intermedios, sin el primer ni el último punto.
+    bounds = np.linspace(1, size - 1, target - 1).astype(int)
+    selected = np.empty(target, dtype=int)
+    selected[0], selected[-1] = 0, size - 1
+
+    previous = 0
+    for bucket in range(target - 2):
+        start, end = bounds[bucket], bounds[bucket + 1]
+        # Vértice del siguiente grupo: el promedio de sus puntos (o el último punto).
+        if bucket + 2 < target - 1:
+            next_start, next_end = end, bounds[bucket + 2]
+            next_x = x_px[next_start:next_end].mean()
+            next_y = y_px[next_start:next_end].mean()
+        else:
+            next_x, next_y = x_px[-1], y_px[-1]
+        # Área (al doble) del triángulo formado con el punto anterior y el promedio siguiente.
+        areas = np.abs(
+            (x_px[previous] - next_x) * (y_px[start:end] - y_px[previous])
+            - (x_px[previous] - x_px[start:end]) * (next_y - y_px[previous])
+        )
+        previous = start + int(np.argmax(areas))
+        selected[bucket + 1] = previous
+    return selected
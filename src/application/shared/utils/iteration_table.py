@@ -0,0 +1,391 @@
+import bisect
+import math
+import operator
+from array import array
+from typing import Iterator, NamedTuple
+
+"""
+
+Tabla de iteraciones columnar para los métodos numéricos. En lugar de guardar un diccionario por iteración (con llaves de texto y flotantes empaquetados), cada columna se guarda en un arreglo `array('d')` preasignado que crece de forma geométrica, así una tabla de decenas de miles de iteraciones ocupa 8 bytes por celda. Las columnas vectoriales (por ejemplo X en los métodos de sistemas de ecuaciones) se guardan aplanadas en un solo arreglo.
+
+Con una política de retención (`RetentionPolicy`) la tabla conserva las primeras filas, las últimas filas y una muestra de cada `stride` iteraciones entre ambas; la última fila siempre se conserva. Si la muestra intermedia supera su límite, el paso se duplica y se descarta la mitad de la muestra, así el número de filas (y el tamaño del HTML) queda acotado sin importar cuántas iteraciones haga el método. El número total de iteraciones y el mínimo y máximo de cada columna se calculan sobre todas las filas agregadas, no solo sobre las conservadas.
+
+La tabla se comporta como el diccionario {iteración: fila} que usaban los servicios: `table.items`, `table.values`, `table[i]["error"]` y `{% if table %}` funcionan igual, por lo que las plantillas como result_table_SNENL.html no cambian. Cada fila es una vista liviana sobre los arreglos, no una copia.
+
+"""
+
+# Capacidad inicial (en filas) de los arreglos de cada columna.
+INITIAL_CAPACITY = 16
+
+# Número máximo de componentes de X que los métodos de sistemas de ecuaciones guardan por fila; en sistemas grandes la tabla muestra solo las primeras.
+MAX_TABLE_COMPONENTS = 10
+
+
+class RetentionPolicy(NamedTuple):
+    """
+    Filas que conserva una tabla de iteraciones.
+
+    Attributes:
+        head (int): Número de primeras filas que se conservan.
+        tail (int): Número de últimas filas que se conservan (al menos una, la fila final).
+        stride (int): Entre las primeras y las últimas se conserva una fila cada `stride` iteraciones; 0 no conserva ninguna.
+        middle (int): Número máximo de filas intermedias; al superarlo el paso se duplica.
+    """
+
+    head: int = 50
+    tail: int = 50
+    stride: int = 10
+    middle: int = 100
+
+    @property
+    def max_rows(self) -> int:
+        return self.head + max(1, self.tail) + self.middle
+
+
+# Política que usan los servicios por defecto: las ejecuciones de hasta 100 iteraciones se conservan completas.
+DEFAULT_RETENTION = RetentionPolicy()
+
+
+def table_components(size: int) -> int:
+    """
+    Número de componentes de un vector de tamaño `size` que se guardan en cada fila de la tabla.
+    """
+    return min(size, MAX_TABLE_COMPONENTS)
+
+
+class IterationRow:
+    """
+    Vista de solo lectura de una fila de la tabla, con la interfaz de un diccionario.
+    """
+
+    __slots__ = ("_table", "_index")
+
+    def __init__(self, table: "IterationTable", index: int):
+        self._table = table
+        self._index = index
+
+    def __getitem__(self, column: str):
+        return self._table.cell(self._index, column)
+
+    def __contains__(self, column: str) -> bool:
+        return column == "iteration" or column in self._table.widths
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.keys())
+
+    def __len__(self) -> int:
+        return len(self._table.widths) + 1
+
+    def __repr__(self) -> str:
+        return f"IterationRow({self.to_dict()})"
+
+    def get(self, column: str, default=None):
+        return self[column] if column in self else default
+
+    def keys(self) -> list[str]:
+        return ["iteration", *self._table.widths]
+
+    def values(self) -> list:
+        return [self[column] for column in self.keys()]
+
+    def items(self) -> list[tuple]:
+        return [(column, self[column]) for column in self.keys()]
+
+    @property
+    def skipped(self) -> int:
+        """
+        Número de iteraciones omitidas antes de esta fila.
+        """
+        return self._table.skipped_before(self._index)
+
+    def to_dict(self) -> dict:
+        return dict(self.items())
+
+
+class IterationTable:
+    """
+    Tabla de iteraciones con almacenamiento columnar en arreglos de tipo double.
+    """
+
+    __slots__ = (
+        "widths",
+        "retention",
+        "total_rows",
+        "_stride",
+        "_head_count",
+        "_middle_count",
+        "_minimum",
+        "_maximum",
+        "_iterations",
+        "_buffers",
+        "_size",
+        "_capacity",
+    )
+
+    def __init__(
+        self,
+        columns: tuple[str, ...],
+        vector_columns: dict[str, int] | None = None,
+        capacity: int = INITIAL_CAPACITY,
+        retention: RetentionPolicy | None = None,
+    ):
+        """
+        Args:
+            columns (tuple[str, ...]): Nombres de las columnas escalares (la columna "iteration" se agrega siempre).
+            vector_columns (dict[str, int] | None): Columnas vectoriales con su número de componentes.
+            capacity (int): Número de filas preasignadas.
+            retention (RetentionPolicy | None): Filas que se conservan; None conserva todas.
+        """
+        self.widths = {column: 1 for column in columns} | (vector_columns or {})
+        if retention is not None:
+            retention = retention._replace(tail=max(1, retention.tail))
+            capacity = min(capacity, retention.max_rows + 1)
+        self.retention = retention
+        self.total_rows = 0
+        self._stride = retention.stride if retention is not None else 0
+        self._head_count = 0
+        self._middle_count = 0
+        self._minimum = {column: math.inf for column in columns}
+        self._maximum = {column: -math.inf for column in columns}
+        self._capacity = max(1, capacity)
+        self._size = 0
+        self._iterations = array("q", bytes(8 * self._capacity))
+        self._buffers = {
+            column: array("d", bytes(8 * self._capacity * width))
+            for column, width in self.widths.items()
+        }
+
+    def append(self, iteration: int, **values) -> None:
+        """
+        Agrega una fila al final de la tabla.
+
+        Args:
+            iteration (int): Número de la iteración.
+            **values: Valor de cada columna; las columnas vectoriales reciben una secuencia.
+
+        Raises:
+            KeyError: Si falta alguna columna o se recibe una columna desconocida.
+            ValueError: Si algún valor no es un número real (por ejemplo un complejo).
+        """
+        if values.keys() != self.widths.keys():
+            raise KeyError(
+                f"Columnas esperadas {list(self.widths)}, recibidas {list(values)}."
+            )
+        if self._size == self._capacity:
+            self._grow()
+
+        index = self._size
+        self._iterations[index] = iteration
+        for column, width in self.widths.items():
+            try:
+                if width == 1:
+                    self._buffers[column][index] = values[column]
+                else:
+                    start = index * width
+                    self._buffers[column][start : start + width] = array(
+                        "d", values[column]
+                    )
+            except TypeError:
+                raise ValueError(
+                    f"La columna '{column}' de la iteración {iteration} recibió un valor que no es un número real: {values[column]!r}."
+                ) from None
+        self._size += 1
+
+        # El resumen se calcula con todas las filas, incluso las que luego se descartan.
+        self.total_rows += 1
+        for column in self._minimum:
+            value = values[column]
+            if math.isfinite(value):
+                if value < self._minimum[column]:
+                    self._minimum[column] = value
+                if value > self._maximum[column]:
+                    self._maximum[column] = value
+
+        if self.retention is not None:
+            self._retain()
+
+    def _grow(self) -> None:
+        # Duplicamos la capacidad para que agregar filas cueste O(1) amortizado.
+        added = self._capacity
+        self._iterations.frombytes(bytes(8 * added))
+        for column, width in self.widths.items():
+            self._buffers[column].frombytes(bytes(8 * added * width))
+        self._capacity += added
+
+    def _retain(self) -> None:
+        # Las filas se guardan en orden: primeras filas, muestra intermedia y últimas filas.
+        if self._head_count < self.retention.head:
+            self._head_count += 1
+            return
+        tail_start = self._head_count + self._middle_count
+        if self._size - tail_start <= self.retention.tail:
+            return
+
+        # La fila más antigua de las últimas sale de ese grupo: pasa a la muestra o se descarta.
+        if self._stride and self._iterations[tail_start] % self._stride == 0:
+            self._middle_count += 1
+            if self._middle_count > self.retention.middle:
+                self._thin_middle()
+        else:
+            self._remove(tail_start)
+
+    def _remove(self, index: int) -> None:
+        # Corremos una posición las filas siguientes (las últimas filas son pocas).
+        size = self._size
+        self._iterations[index : size - 1] = self._iterations[index + 1 : size]
+        for column, width in self.widths.items():
+            buffer = self._buffers[column]
+            buffer[index * width : (size - 1) * width] = buffer[
+                (index + 1) * width : size * width
+            ]
+        self._size -= 1
+
+    def _thin_middle(self) -> None:
+        # Duplicamos el paso y conservamos solo las filas intermedias que siguen siendo múltiplos.
+        self._stride *= 2
+        start = self._head_count
+        kept = [
+            index
+            for index in range(start, start + self._middle_count)
+            if self._iterations[index] % self._stride == 0
+        ]
+        kept += range(start + self._middle_count, self._size)
+        for target, index in enumerate(kept, start):
+            if target == index:
+                continue
+            self._iterations[target] = self._iterations[index]
+            for column, width in self.widths.items():
+                buffer = self._buffers[column]
+                buffer[target * width : (target + 1) * width] = buffer[
+                    index * width : (index + 1) * width
+                ]
+        removed = self._size - start - len(kept)
+        self._middle_count -= removed
+        self._size -= removed
+
+    def cell(self, index: int, column: str):
+        """
+        Retorna el valor de una columna en la fila de posición `index` (empezando en cero).
+        """
+        if column == "iteration":
+            return self._iterations[index]
+        width = self.widths[column]
+        if width == 1:
+            return self._buffers[column][index]
+        return self._buffers[column][index * width : (index + 1) * width].tolist()
+
+    def last(self, column: str):
+        """
+        Retorna en O(1) el valor de una columna en la última fila agregada.
+
+        Raises:
+            IndexError: Si la tabla está vacía.
+        """
+        if self._size == 0:
+            raise IndexError("La tabla de iteraciones está vacía.")
+        return self.cell(self._size - 1, column)
+
+    def last_row(self) -> IterationRow:
+        """
+        Retorna la vista de la última fila agregada. La vista se debe leer antes de agregar otra fila, porque al descartar filas las posiciones cambian.
+
+        Raises:
+            IndexError: Si la tabla está vacía.
+        """
+        if self._size == 0:
+            raise IndexError("La tabla de iteraciones está vacía.")
+        return IterationRow(self, self._size - 1)
+
+    def column(self, column: str) -> list:
+        """
+        Retorna todos los valores de una columna, en orden de iteración.
+        """
+        if column == "iteration":
+            return self._iterations[: self._size].tolist()
+        width = self.widths[column]
+        values = self._buffers[column][: self._size * width].tolist()
+        if width == 1:
+            return values
+        return [values[i : i + width] for i in range(0, len(values), width)]
+
+    @property
+    def omitted_rows(self) -> int:
+        """
+        Número de filas que se descartaron por la política de retención.
+        """
+        return self.total_rows - self._size
+
+    @property
+    def summary(self) -> dict[str, dict[str, float]]:
+        """
+        Mínimo y máximo de cada columna escalar sobre todas las iteraciones (se ignoran los valores infinitos o NaN).
+        """
+        return {
+            column: {
+                "minimum": self._minimum[column],
+                "maximum": self._maximum[column],
+            }
+            for column in self._minimum
+            if self._minimum[column] <= self._maximum[column]
+        }
+
+    def skipped_before(self, index: int) -> int:
+        """
+        Número de iteraciones omitidas entre la fila de posición `index` y la anterior.
+        """
+        if index == 0:
+            return 0
+        return self._iterations[index] - self._iterations[index - 1] - 1
+
+    def _position(self, iteration: int) -> int:
+        # Si no se han descartado filas las iteraciones son consecutivas y la posición se obtiene en O(1).
+        try:
+            iteration = operator.index(iteration)
+        except TypeError:
+            raise KeyError(iteration) from None
+        if self._size == 0:
+            raise KeyError(iteration)
+        index = iteration - self._iterations[0]
+        if 0 <= index < self._size and self._iterations[index] == iteration:
+            return index
+        index = bisect.bisect_left(self._iterations, iteration, 0, self._size)
+        if index == self._size or self._iterations[index] != iteration:
+            raise KeyError(iteration)
+        return index
+
+    def __getitem__(self, iteration: int) -> IterationRow:
+        return IterationRow(self, self._position(iteration))
+
+    def __contains__(self, iteration: int) -> bool:
+        try:
+            self._position(iteration)
+        except KeyError:
+            return False
+        return True
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self.keys())
+
+    def __repr__(self) -> str:
+        return f"IterationTable({len(self)} filas, columnas={list(self.widths)})"
+
+    def keys(self) -> list[int]:
+        return self._iterations[: self._size].tolist()
+
+    def values(self) -> Iterator[IterationRow]:
+        return (IterationRow(self, index) for index in range(self._size))
+
+    def items(self) -> Iterator[tuple[int, IterationRow]]:
+        return (
+            (self._iterations[index], IterationRow(self, index))
+            for index in range(self._size)
+        )
+
+    def to_dict(self) -> dict:
+        """
+        Convierte la tabla al formato anterior {iteración: {columna: valor}}.
+        """
+        return {iteration: row.to_dict() for iteration, row in self.items()}
@@ -0,0 +1,43 @@
+import importlib
+from typing import Callable
+
+"""
+
+Permite registrar clases en el contenedor de dependencias sin importarlas al arrancar la aplicación. El módulo de la clase (y las librerías pesadas que este importa, como numpy, sympy, scipy o matplotlib) solo se carga la primera vez que se crea una instancia.
+
+"""
+
+
+def lazy_factory(path: str) -> Callable:
+    """
+    Crea una fábrica que importa la clase indicada solo cuando se invoca por primera vez.
+
+    Args:
+        path (str): Ruta completa de la clase, por ejemplo "paquete.modulo.Clase".
+
+    Returns:
+        Callable: Función que recibe los argumentos del constructor y retorna una instancia de la clase.
+    """
+    module_name, class_name = path.rsplit(".", 1)
+
+    def create(*args, **kwargs):
+        target_class = getattr(importlib.import_module(module_name), class_name)
+        return target_class(*args, **kwargs)
+
+    create.__qualname__ = create.__name__ = class_name
+    return create
+
+
+def load_pyplot():
+    """
+    Importa matplotlib.pyplot con el backend "Agg" (sin interfaz gráfica) la primera vez que se necesita graficar.
+
+    Returns:
+        module: El módulo matplotlib.pyplot.
+    """
+    import matplotlib
+
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
+    return plt
@@ -0,0 +1,41 @@
+from typing import Callable
+import numpy as np
+from scipy.sparse.linalg import LinearOperator
+
+"""
+
+Operadores sin matriz para los métodos de Krylov (GMRES y BiCGSTAB). Estos métodos solo usan A a través de productos A·v, así que además de una matriz densa o dispersa aceptan un `LinearOperator` de scipy o una función v -> A·v; así se resuelven sistemas cuya matriz nunca se forma (por ejemplo un operador de diferencias finitas aplicado sobre la malla).
+
+"""
+
+
+def is_matrix_free(A) -> bool:
+    """
+    Indica si A es un operador sin matriz (un LinearOperator o una función) en lugar de una matriz.
+    """
+    return isinstance(A, LinearOperator) or callable(A)
+
+
+def as_linear_operator(
+    A: LinearOperator | Callable[[np.ndarray], np.ndarray], size: int
+) -> LinearOperator:
+    """
+    Envuelve un operador sin matriz como LinearOperator de tamaño `size`.
+
+    Args:
+        A: LinearOperator, o función que recibe v y retorna A·v.
+        size (int): Número de incógnitas del sistema.
+
+    Returns:
+        LinearOperator: Operador que admite `A @ v`.
+
+    Raises:
+        ValueError: Si el operador no es cuadrado de tamaño `size`.
+    """
+    if not isinstance(A, LinearOperator):
+        A = LinearOperator((size, size), matvec=A, dtype=float)
+    if A.shape != (size, size):
+        raise ValueError(
+            f"El operador A debe ser de tamaño {size}x{size} para ser compatible con el vector b."
+        )
+    return A
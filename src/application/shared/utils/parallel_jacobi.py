@@ -0,0 +1,108 @@
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+from scipy import sparse
+
+"""
+
+Barrido de Jacobi por bloques de filas para sistemas grandes, densos o dispersos (CSR). Las filas se reparten en bloques contiguos y cada bloque calcula su parte de x1 = (b - R·x0) / diag(A) directamente sobre el vector de salida compartido, junto con el máximo de |x1 - x0| de sus filas. Como en Jacobi cada fila solo lee x0, los bloques no dependen entre sí y se reparten entre los hilos de un ThreadPoolExecutor.
+
+Es la misma iteración de Jacobi (por puntos), no Jacobi por bloques en el sentido de resolver los bloques diagonales de A: eso cambiaría el método y sus resultados. Los bloques tampoco dependen del número de hilos (BLOCK_ROWS filas o BLOCK_NONZEROS entradas por bloque), así que con 1 o con k hilos cada bloque hace exactamente las mismas operaciones y el resultado es idéntico bit a bit.
+
+NumPy libera el GIL dentro del producto matriz-vector (BLAS), y scipy dentro del producto de una matriz CSR, así que los hilos sí corren al mismo tiempo. Si la biblioteca BLAS ya usa varios hilos por llamada conviene limitarla a uno (por ejemplo OPENBLAS_NUM_THREADS=1) para no tener más hilos que núcleos.
+
+El número de hilos por defecto y el número mínimo de entradas de R (n² en una matriz densa) se configuran con JACOBI_WORKERS y JACOBI_PARALLEL_MIN_NONZEROS.
+
+"""
+
+# Filas por bloque de una matriz densa.
+BLOCK_ROWS = 256
+
+# Entradas distintas de cero por bloque (aproximadamente) de una matriz dispersa.
+BLOCK_NONZEROS = 1 << 16
+
+
+class ParallelJacobiSweep:
+    """
+    Barrido de Jacobi repartido por bloques de filas, en un ThreadPoolExecutor si hay más de un hilo.
+    """
+
+    def __init__(self, R, inverse_diagonal: np.ndarray, b: np.ndarray, workers: int):
+        """
+        Args:
+            R: Matriz A sin su diagonal, densa o dispersa (CSR).
+            inverse_diagonal (np.ndarray): Inverso de la diagonal de A.
+            b (np.ndarray): Vector de términos independientes.
+            workers (int): Número de hilos; con 1 los bloques se calculan en el hilo que llama.
+        """
+        n = len(b)
+        self.inverse_diagonal = inverse_diagonal
+        self.b = b
+        if sparse.issparse(R):
+            R = sparse.csr_matrix(R)
+            # Límites con casi el mismo número de entradas por bloque, según los punteros de fila de CSR
+            targets = np.arange(0, R.nnz, BLOCK_NONZEROS)
+            bounds = np.searchsorted(R.indptr, targets, side="left")
+            bounds = np.unique(np.concatenate(([0], bounds, [n])))
+        else:
+            R = np.ascontiguousarray(R)
+            bounds = np.unique(np.concatenate((np.arange(0, n, BLOCK_ROWS), [n])))
+        self.blocks = list(zip(bounds[:-1], bounds[1:]))
+        # Las filas de cada bloque se separan una sola vez; rebanar una matriz CSR la copia
+        self._row_blocks = [R[start:stop] for start, stop in self.blocks]
+        self._is_sparse = sparse.issparse(R)
+        # Espacio de trabajo para |x1 - x0|, también repartido por bloques
+        self._difference = np.empty(n)
+        self._workers = max(1, min(workers, len(self.blocks)))
+        self._executor = (
+            ThreadPoolExecutor(max_workers=self._workers, thread_name_prefix="jacobi")
+            if self._workers > 1
+            else None
+        )
+
+    @property
+    def workers(self) -> int:
+        return self._workers
+
+    def sweep(self, x0: np.ndarray, x1: np.ndarray) -> float:
+        """
+        Calcula una iteración de Jacobi.
+
+        Args:
+            x0 (np.ndarray): Aproximación actual (no se modifica).
+            x1 (np.ndarray): Vector de salida, compartido por todos los hilos.
+
+        Returns:
+            float: Norma infinito de x1 - x0.
+        """
+        if self._executor is None:
+            return max(
+                self._update_block(rows, start, stop, x0, x1)
+                for rows, (start, stop) in zip(self._row_blocks, self.blocks)
+            )
+        futures = [
+            self._executor.submit(self._update_block, rows, start, stop, x0, x1)
+            for rows, (start, stop) in zip(self._row_blocks, self.blocks)
+        ]
+        return max(future.result() for future in futures)
+
+    def _update_block(self, rows, start: int, stop: int, x0: np.ndarray, x1: np.ndarray) -> float:
+        # Cada bloque escribe solo en su rebanada de x1 (el producto CSR sí crea un arreglo temporal por bloque)
+        block = x1[start:stop]
+        if self._is_sparse:
+            np.copyto(block, rows @ x0)
+        else:
+            np.dot(rows, x0, out=block)
+        np.subtract(self.b[start:stop], block, out=block)
+        np.multiply(block, self.inverse_diagonal[start:stop], out=block)
+
+        difference = self._difference[start:stop]
+        np.subtract(block, x0[start:stop], out=difference)
+        np.abs(difference, out=difference)
+        return float(difference.max())
+
+    def close(self) -> None:
+        """
+        Termina los hilos del ejecutor.
+        """
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
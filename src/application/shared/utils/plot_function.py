@@ -1,48 +1,147 @@
-import numpy as np
-from config.settings import BASE_DIR
-import matplotlib.pyplot as plt
-import math
 import textwrap
-import matplotlib
-
-matplotlib.use("Agg")
+from src.application.shared.utils.lazy_import import load_pyplot
+from src.application.shared.utils.plot_store import (
+    plot_key,
+    render_plot,
+    render_svg,
+    use_matplotlib,
+)
 
 
 def plot_function(
     function_f: str, have_solution: bool, points: list[tuple[float, float]]
-) -> None:
-    output_file = BASE_DIR / "static/img/numerical_method/function_plot.svg"
+) -> str:
+    points = list(points)
+    key = plot_key("function_plot", function_f, have_solution, points)
+    draw = _draw_function_matplotlib if use_matplotlib() else _draw_function_svg
+    return render_plot(
+        "function_plot", key, lambda: draw(function_f, have_solution, points)
+    )
+
+
+# Tamaño aproximado (en píxeles) del área de la gráfica, con el que se calcula la tolerancia del muestreo.
+PLOT_AREA_PIXELS = (520, 320)
+
+# Fracción de píxel que la curva dibujada se puede alejar de la función.
+SAMPLING_TOLERANCE_PIXELS = 0.25
+
+# Rango en el que se buscan raíces cuando el método no encontró solución.
+ROOT_SEARCH_RANGE = (-100, 100)
+
+
+def _function_samples(
+    function_f: str, have_solution: bool, points: list[tuple[float, float]]
+):
+    """
+    Elige el rango de la gráfica y evalúa la función con muestreo adaptativo.
+
+    Returns:
+        tuple: Valores de x, valores de f(x) (NaN fuera del dominio) y límites (xlim, ylim) de la gráfica.
+    """
+    # Los módulos que usan numpy se importan al graficar para no cargarlo al arrancar la aplicación
+    from src.application.shared.utils.adaptive_sampling import sample_adaptive
+    from src.application.shared.utils.downsample import downsample
+    from src.application.shared.utils.vectorize_expression import (
+        evaluate_expression_array,
+    )
 
-    # Obtener los valores de x y y de los puntos para el rango de la gráfica
+    def function(x_vals):
+        return evaluate_expression_array(function_f, x_vals)
+
+    xlim, ylim = _plot_limits(function_f, function, have_solution, points)
+
+    width, height = PLOT_AREA_PIXELS
+    x_vals, y_vals, _ = sample_adaptive(
+        function,
+        *xlim,
+        tolerance=(ylim[1] - ylim[0]) / height * SAMPLING_TOLERANCE_PIXELS,
+        y_bounds=ylim,
+        min_width=(xlim[1] - xlim[0]) / width * SAMPLING_TOLERANCE_PIXELS,
+    )
+    x_vals, y_vals = downsample(x_vals, y_vals, xlim, ylim, PLOT_AREA_PIXELS)
+    return x_vals, y_vals, (xlim, ylim)
+
+
+def _plot_limits(function_f: str, function, have_solution: bool, points):
+    import numpy as np
+    from src.application.shared.utils.bracket_roots import find_sign_changes
+
+    # Ventana alrededor de los puntos, como antes: 4 unidades a cada lado
     x_coords = [point[0] for point in points]
     y_coords = [point[1] for point in points]
+    lower, upper = min(x_coords) - 4, max(x_coords) + 4
+    bottom, top = min(y_coords) - 4, max(y_coords) + 4
 
-    min_x, max_x = min(x_coords) - 1, max(x_coords) + 1
-    min_y, max_y = min(y_coords) - 1, max(y_coords) + 1
-
-    # Generar un rango más ajustado de valores de x para la evaluación de la función
     if not have_solution:
-        x_vals = np.linspace(-100, 100, 10000)
-    else:
-        x_vals = np.linspace(min_x - 3, max_x + 3, 10000)
-
-    # Evaluar la función de forma segura
-    y_vals = []
-    valid_x = []
-    for val in x_vals:
-        try:
-            y = eval(function_f, {"math": math, "x": val})
-            if not (np.isnan(y) or np.isinf(y)):
-                y_vals.append(y)
-                valid_x.append(val)
-        except Exception:
-            continue
+        # Sin solución se amplía la ventana hasta la raíz más cercana, si hay alguna en el rango de búsqueda.
+        brackets, zeros = find_sign_changes(function_f, *ROOT_SEARCH_RANGE, 401)
+        roots = np.concatenate((brackets.mean(axis=1), zeros))
+        if roots.size:
+            nearest = roots[np.argmin(np.abs(roots - (lower + upper) / 2))]
+            lower, upper = min(lower, nearest - 1), max(upper, nearest + 1)
+
+    x_vals = np.linspace(lower, upper, 129)
+    y_vals = function(x_vals)
+    finite = np.isfinite(y_vals)
+
+    if finite.any():
+        # La ventana se recorta a la parte del dominio donde f está definida, sin dejar de mostrar los puntos.
+        step = x_vals[1] - x_vals[0]
+        defined = x_vals[finite]
+        lower = max(lower, min(defined[0] - step, min(x_coords) - 1))
+        upper = min(upper, max(defined[-1] + step, max(x_coords) + 1))
+
+        # Si la curva queda completamente fuera del rango de y, el rango se amplía para mostrarla.
+        y_finite = y_vals[finite]
+        if not ((y_finite >= bottom) & (y_finite <= top)).any():
+            low, high = np.percentile(y_finite, [5, 95])
+            margin = max((high - low) * 0.05, 1.0)
+            bottom = min(bottom, low - margin)
+            top = max(top, high + margin)
+
+    return (float(lower), float(upper)), (float(bottom), float(top))
+
+
+def _function_title(function_f: str) -> str:
+    wrapped_title = "\n".join(textwrap.wrap(function_f, width=50))
+    return f"f(x) = {wrapped_title}"
+
+
+def _draw_function_svg(
+    function_f: str, have_solution: bool, points: list[tuple[float, float]]
+) -> bytes:
+    from src.application.shared.utils.svg_writer import SvgFigure
+
+    x_vals, y_vals, (xlim, ylim) = _function_samples(function_f, have_solution, points)
+
+    figure = SvgFigure(600, 400, title=_function_title(function_f), xlabel="x", ylabel="y")
+    figure.xlim, figure.ylim = xlim, ylim
+    figure.axhline(0, color="red", dash="4 3")
+    figure.axvline(0, color="red", dash="4 3")
+    figure.line(x_vals, y_vals, color="#a18262", label="f(x)")
+
+    if have_solution:
+        figure.scatter(
+            [x for x, _ in points], [y for _, y in points], color="#f7dc6f"
+        )
+        for x, y in points:
+            figure.text(x, y, f"({x}, {y})")
+
+    return figure.render()
+
+
+def _draw_function_matplotlib(
+    function_f: str, have_solution: bool, points: list[tuple[float, float]]
+) -> bytes:
+    plt = load_pyplot()
+
+    x_vals, y_vals, (xlim, ylim) = _function_samples(function_f, have_solution, points)
 
     # Crear la figura
     plt.figure(figsize=(6, 4))
 
     # Graficar la función en el rango ajustado
-    plt.plot(valid_x, y_vals, color="#a18262", label="f(x)")
+    plt.plot(x_vals, y_vals, color="#a18262", label="f(x)")
 
     if have_solution:
         for x, y in points:
@@ -50,8 +149,8 @@ def plot_function(
             plt.text(x, y, f"({x}, {y})", fontsize=9, verticalalignment="bottom")
 
     # Ajustar los límites de los ejes para el recuadro de la grafica como tal
-    plt.xlim(min_x - 3, max_x + 3)
-    plt.ylim(min_y - 3, max_y + 3)
+    plt.xlim(*xlim)
+    plt.ylim(*ylim)
 
     # Ejes y etiquetas
     plt.axhline(y=0, color="red", linestyle="--", linewidth=1)
@@ -59,13 +158,11 @@ def plot_function(
     plt.xlabel("x")
     plt.ylabel("y")
 
-    wrapped_title = "\n".join(textwrap.wrap(function_f, width=50))
-    plt.title(f"f(x) = {wrapped_title}", fontsize=10, y=1.1)
+    plt.title(_function_title(function_f), fontsize=10, y=1.1)
 
     plt.grid(True)
     plt.legend()
     plt.tight_layout()
 
     # Guardar la gráfica
-    plt.savefig(output_file, format="svg")
-    plt.close()
+    return render_svg(plt)
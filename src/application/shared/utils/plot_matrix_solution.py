@@ -1,51 +1,125 @@
-import matplotlib.pyplot as plt
-import numpy as np
-from config.settings import BASE_DIR
+from src.application.shared.utils.lazy_import import load_pyplot
+from src.application.shared.utils.plot_store import (
+    plot_key,
+    render_plot,
+    render_svg,
+    use_matplotlib,
+)
 
+# Tamaño aproximado (en píxeles) del área de las gráficas de este módulo.
+FIGURE_PIXELS = (720, 520)
 
-def plot_matrix_solution(iterations: dict, solution: list[float], spectral_radius: float):
+
+def plot_matrix_solution(iterations: dict, solution: list[float], spectral_radius: float | None) -> str:
     """
     Grafica las soluciones iterativas de un sistema de ecuaciones lineales (Jacobi para matrices 2x2).
 
     Args:
         iterations (dict): Diccionario con las iteraciones y los valores aproximados de X.
         solution (list[float]): Solución aproximada del sistema.
-        spectral_radius (float): Radio espectral para mostrar en la gráfica.
+        spectral_radius (float | None): Radio espectral para mostrar en la gráfica; None si no se calculó.
 
     Returns:
-        None: Genera un archivo SVG con la gráfica.
+        str: Llave de la gráfica SVG en el almacén de gráficas.
     """
-    output_file = BASE_DIR / "static/img/numerical_method/matrix_solution_plot.svg"
-
     # Extraer valores de iteración
     x1_values = [iteration["X"][0] for iteration in iterations.values()]
     x2_values = [iteration["X"][1] for iteration in iterations.values()]
     iteration_numbers = list(iterations.keys())
 
+    key = plot_key(
+        "matrix_solution_plot",
+        iteration_numbers,
+        x1_values,
+        x2_values,
+        solution,
+        spectral_radius,
+    )
+    draw = (
+        _draw_matrix_solution_matplotlib
+        if use_matplotlib()
+        else _draw_matrix_solution_svg
+    )
+    return render_plot(
+        "matrix_solution_plot",
+        key,
+        lambda: draw(
+            iteration_numbers, x1_values, x2_values, solution, spectral_radius
+        ),
+    )
+
+
+def _solution_title(spectral_radius: float | None) -> str:
+    if spectral_radius is None:
+        return "Evolución iterativa"
+    return f"Evolución iterativa (Radio espectral: {spectral_radius:.4f})"
+
+
+def _iteration_series(iteration_numbers: list[int], values: list[float]):
+    from src.application.shared.utils.downsample import downsample
+
+    # Cada punto es una iteración con su marcador: no se simplifica, solo se limita el número de puntos.
+    return downsample(iteration_numbers, values, pixels=FIGURE_PIXELS, tolerance=0)
+
+
+def _draw_matrix_solution_svg(
+    iteration_numbers: list[int],
+    x1_values: list[float],
+    x2_values: list[float],
+    solution: list[float],
+    spectral_radius: float | None,
+) -> bytes:
+    from src.application.shared.utils.svg_writer import SvgFigure
+
+    x1_series = _iteration_series(iteration_numbers, x1_values)
+    x2_series = _iteration_series(iteration_numbers, x2_values)
+
+    figure = SvgFigure(
+        800,
+        600,
+        title=_solution_title(spectral_radius),
+        xlabel="Iteraciones",
+        ylabel="Valor de X",
+    )
+    figure.line(*x1_series, label="x1 (iterativo)", marker=True)
+    figure.line(*x2_series, label="x2 (iterativo)", marker=True)
+    figure.axhline(solution[0], color="blue", label=f"x1 solución: {solution[0]:.4f}")
+    figure.axhline(solution[1], color="green", label=f"x2 solución: {solution[1]:.4f}")
+    return figure.render()
+
+
+def _draw_matrix_solution_matplotlib(
+    iteration_numbers: list[int],
+    x1_values: list[float],
+    x2_values: list[float],
+    solution: list[float],
+    spectral_radius: float | None,
+) -> bytes:
+    plt = load_pyplot()
+
     # Crear la figura
     plt.figure(figsize=(8, 6))
 
     # Graficar las soluciones x1 y x2 por iteración
-    plt.plot(iteration_numbers, x1_values, label="x1 (iterativo)", marker="o", linestyle="-")
-    plt.plot(iteration_numbers, x2_values, label="x2 (iterativo)", marker="o", linestyle="-")
+    plt.plot(*_iteration_series(iteration_numbers, x1_values), label="x1 (iterativo)", marker="o", linestyle="-")
+    plt.plot(*_iteration_series(iteration_numbers, x2_values), label="x2 (iterativo)", marker="o", linestyle="-")
 
     # Añadir la solución final
     plt.axhline(y=solution[0], color="blue", linestyle="-", label=f"x1 solución: {solution[0]:.4f}")
     plt.axhline(y=solution[1], color="green", linestyle="-", label=f"x2 solución: {solution[1]:.4f}")
 
     # Detalles de la gráfica
-    plt.title(f"Evolución iterativa (Radio espectral: {spectral_radius:.4f})")
+    plt.title(_solution_title(spectral_radius))
     plt.xlabel("Iteraciones")
     plt.ylabel("Valor de X")
     plt.legend()
     plt.grid(True)
 
     # Guardar la gráfica como SVG
-    plt.savefig(output_file, format="svg")
-    plt.close()
+    return render_svg(plt)
 
 
-def plot_system_equations(A: list[list[float]], b: list[float], solution: list[float]):
+def plot_system_equations(A: list[list[float]], b: list[float], solution: list[float]) -> str:
     """
     Genera una gráfica de las ecuaciones de un sistema 2x2 y su solución.
 
@@ -55,21 +129,64 @@ def plot_system_equations(A: list[list[float]], b: list[float], solution: list[f
         solution (list[float]): Solución del sistema.
 
     Returns:
-        None: Genera un archivo SVG con la gráfica.
+        str: Llave de la gráfica SVG en el almacén de gráficas.
     """
-    output_file = BASE_DIR / "static/img/numerical_method/system_plot.svg"
+    key = plot_key("system_plot", A, b, solution)
+    draw = (
+        _draw_system_equations_matplotlib
+        if use_matplotlib()
+        else _draw_system_equations_svg
+    )
+    return render_plot("system_plot", key, lambda: draw(A, b, solution))
+
+
+def _system_lines(A: list[list[float]], b: list[float]):
+    import numpy as np
+    from src.application.shared.utils.downsample import downsample
 
     # Crear las ecuaciones como funciones de x
     x = np.linspace(-10, 10, 500)
-    y1 = (b[0] - A[0][0] * x) / A[0][1]  # Primera ecuación
-    y2 = (b[1] - A[1][0] * x) / A[1][1]  # Segunda ecuación
+    with np.errstate(divide="ignore", invalid="ignore"):
+        y1 = (b[0] - A[0][0] * x) / A[0][1]  # Primera ecuación
+        y2 = (b[1] - A[1][0] * x) / A[1][1]  # Segunda ecuación
+
+    # Las ecuaciones son rectas: de las 500 muestras quedan los extremos.
+    return (
+        *downsample(x, y1, pixels=FIGURE_PIXELS),
+        *downsample(x, y2, pixels=FIGURE_PIXELS),
+    )
+
+
+def _draw_system_equations_svg(
+    A: list[list[float]], b: list[float], solution: list[float]
+) -> bytes:
+    from src.application.shared.utils.svg_writer import SvgFigure
+
+    x1, y1, x2, y2 = _system_lines(A, b)
+
+    figure = SvgFigure(800, 600, title="Sistema de ecuaciones 2x2", xlabel="x", ylabel="y")
+    figure.axhline(0, color="black", width=0.5)
+    figure.axvline(0, color="black", width=0.5)
+    figure.line(x1, y1, color="blue", label="Ecuación 1")
+    figure.line(x2, y2, color="green", label="Ecuación 2")
+    figure.scatter(solution[0], solution[1], color="red", label="Solución")
+    figure.text(solution[0], solution[1], f"({solution[0]:.4f}, {solution[1]:.4f})", size=10)
+    return figure.render()
+
+
+def _draw_system_equations_matplotlib(
+    A: list[list[float]], b: list[float], solution: list[float]
+) -> bytes:
+    plt = load_pyplot()
+
+    x1, y1, x2, y2 = _system_lines(A, b)
 
     # Crear la gráfica
     plt.figure(figsize=(8, 6))
     
     # Graficar las ecuaciones con líneas continuas
-    plt.plot(x, y1, label="Ecuación 1", color="blue", linestyle="-", linewidth=1.5)
-    plt.plot(x, y2, label="Ecuación 2", color="green", linestyle="-", linewidth=1.5)
+    plt.plot(x1, y1, label="Ecuación 1", color="blue", linestyle="-", linewidth=1.5)
+    plt.plot(x2, y2, label="Ecuación 2", color="green", linestyle="-", linewidth=1.5)
     
     # Añadir el punto de solución y su anotación
     plt.scatter(solution[0], solution[1], color="red", label="Solución", zorder=5)
@@ -92,5 +209,4 @@ def plot_system_equations(A: list[list[float]], b: list[float], solution: list[f
     plt.legend()
 
     # Guardar la gráfica como SVG
-    plt.savefig(output_file, format="svg")
-    plt.close()
+    return render_svg(plt)
@@ -1,13 +1,16 @@
-import numpy as np
-from config.settings import BASE_DIR
-import matplotlib.pyplot as plt
-import matplotlib
-from scipy.interpolate import CubicSpline
+from src.application.shared.utils.lazy_import import load_pyplot
+from src.application.shared.utils.plot_store import (
+    plot_key,
+    render_plot,
+    render_svg,
+    use_matplotlib,
+)
 
-matplotlib.use("Agg")
+# Tamaño aproximado (en píxeles) del área de la gráfica del spline cúbico.
+FIGURE_PIXELS = (720, 520)
 
 
-def plot_spline_linear(points: list[tuple[float, float]]) -> None:
+def plot_spline_linear(points: list[tuple[float, float]]) -> str:
     """
     Genera una gráfica para el spline lineal conectando los puntos dados.
 
@@ -15,9 +18,36 @@ def plot_spline_linear(points: list[tuple[float, float]]) -> None:
         points (list[tuple[float, float]]): Lista de puntos (x, y) para graficar.
 
     Returns:
-        None: Genera un archivo SVG con la gráfica.
+        str: Llave de la gráfica SVG en el almacén de gráficas.
     """
-    output_file = BASE_DIR / "static/img/numerical_method/spline_linear_plot.svg"
+    key = plot_key("spline_linear_plot", points)
+    draw = _draw_spline_linear_matplotlib if use_matplotlib() else _draw_spline_linear_svg
+    return render_plot("spline_linear_plot", key, lambda: draw(points))
+
+
+def _draw_spline_linear_svg(points: list[tuple[float, float]]) -> bytes:
+    from src.application.shared.utils.svg_writer import SvgFigure
+
+    x_coords = [point[0] for point in points]
+    y_coords = [point[1] for point in points]
+
+    figure = SvgFigure(600, 400, title="Spline Lineal", xlabel="x", ylabel="y")
+    figure.xlim = (min(x_coords) - 1, max(x_coords) + 1)
+    figure.ylim = (min(y_coords) - 1, max(y_coords) + 1)
+    figure.axhline(0, color="red", dash="4 3")
+    figure.axvline(0, color="red", dash="4 3")
+
+    # Los tramos consecutivos forman una sola polilínea.
+    figure.line(x_coords, y_coords, color="#a18262", label="Tramo 1")
+    figure.scatter(x_coords, y_coords, color="#f7dc6f")
+    for x, y in points:
+        figure.text(x, y, f"({x:.1f}, {y:.1f})")
+
+    return figure.render()
+
+
+def _draw_spline_linear_matplotlib(points: list[tuple[float, float]]) -> bytes:
+    plt = load_pyplot()
 
     # Crear la figura
     plt.figure(figsize=(6, 4))
@@ -58,21 +88,59 @@ def plot_spline_linear(points: list[tuple[float, float]]) -> None:
     plt.tight_layout()
 
     # Guardar la gráfica
-    plt.savefig(output_file, format="svg")
-    plt.close()
+    return render_svg(plt)
 
 
-def plot_spline_cubic(title: str, points: list[tuple[float, float]], x_values, y_values):
-    output_file = BASE_DIR / "static/img/numerical_method/spline_cubic_plot.svg"
+def plot_spline_cubic(
+    title: str, points: list[tuple[float, float]], x_values, y_values
+) -> str:
+    key = plot_key("spline_cubic_plot", title, points, x_values, y_values)
+    draw = _draw_spline_cubic_matplotlib if use_matplotlib() else _draw_spline_cubic_svg
+    return render_plot(
+        "spline_cubic_plot",
+        key,
+        lambda: draw(title, points, x_values, y_values),
+    )
 
-    plt.figure(figsize=(8, 6))
+
+def _spline_cubic_curve(x_values, y_values):
+    import numpy as np
+    from scipy.interpolate import CubicSpline
+    from src.application.shared.utils.downsample import downsample
 
     # Crear el spline cúbico con scipy
     cs = CubicSpline(x_values, y_values, bc_type="natural")
 
     # Generar un rango continuo de x para graficar el spline cúbico
     x_range = np.linspace(min(x_values), max(x_values), 500)
-    y_range = cs(x_range)
+    return downsample(x_range, cs(x_range), pixels=FIGURE_PIXELS)
+
+
+def _draw_spline_cubic_svg(
+    title: str, points: list[tuple[float, float]], x_values, y_values
+) -> bytes:
+    from src.application.shared.utils.svg_writer import SvgFigure
+
+    x_range, y_range = _spline_cubic_curve(x_values, y_values)
+
+    figure = SvgFigure(800, 600, title=title, xlabel="x", ylabel="y")
+    figure.axhline(0, color="black", width=0.5, dash="4 3")
+    figure.axvline(0, color="black", width=0.5, dash="4 3")
+    figure.line(x_range, y_range, color="blue", label="Spline Cúbico")
+    figure.scatter([x for x, _ in points], [y for _, y in points], color="red")
+    for x, y in points:
+        figure.text(x, y, f"({x:.1f}, {y:.1f})")
+    return figure.render()
+
+
+def _draw_spline_cubic_matplotlib(
+    title: str, points: list[tuple[float, float]], x_values, y_values
+) -> bytes:
+    plt = load_pyplot()
+
+    plt.figure(figsize=(8, 6))
+
+    x_range, y_range = _spline_cubic_curve(x_values, y_values)
 
     # Graficar el spline cúbico
     plt.plot(x_range, y_range, label="Spline Cúbico", color="blue")
@@ -100,5 +168,4 @@ def plot_spline_cubic(title: str, points: list[tuple[float, float]], x_values, y
     plt.grid(True)
 
     # Guardar la gráfica
-    plt.savefig(output_file, format="svg")
-    plt.close()
+    return render_svg(plt)
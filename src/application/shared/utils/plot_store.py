@@ -0,0 +1,368 @@
+import hashlib
+import io
+import json
+import os
+import re
+import tempfile
+import threading
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Callable, Iterator
+from django.conf import settings
+from django.urls import reverse
+from django.utils.module_loading import import_string
+
+"""
+
+Almacén de gráficas direccionado por contenido. Cada gráfica se identifica con un hash de los datos con los que se dibuja (tipo de gráfica, función, puntos, etc.), de modo que dos solicitudes con los mismos datos comparten la misma gráfica: se dibuja una sola vez y después se sirve desde el almacén. Como la llave depende solo del contenido, varias solicitudes concurrentes ya no se sobrescriben las gráficas entre sí, y el navegador puede guardar cada gráfica en caché indefinidamente.
+
+Las llaves incluyen el dibujante configurado en PLOT_RENDERER ("svg" o "matplotlib") y la reducción de puntos (PLOT_SIMPLIFY_TOLERANCE y PLOT_MAX_POINTS), así cambiar la configuración no sirve gráficas dibujadas con la anterior.
+
+El almacén se elige con la variable PLOT_STORE_BACKEND (PLOT_STORE_MAX_ENTRIES limita el número de gráficas en todos):
+    memory: caché LRU en la memoria del proceso; solo sirve con un único proceso, porque la solicitud que pide la gráfica puede llegar a otro proceso que no la tiene.
+    directory: un directorio local (PLOT_STORE_LOCATION), compartido por todos los procesos del servidor (por defecto).
+    shared: un directorio compartido entre varios nodos, con una caché LRU local delante.
+También se puede indicar la ruta completa de una clase que herede de PlotStore.
+
+Las gráficas dibujadas durante una solicitud se registran por nombre (por ejemplo "function_plot") y las plantillas reciben sus URLs en la variable `plots`.
+
+"""
+
+# Versión del dibujo de las gráficas; cambiarla invalida las gráficas ya guardadas.
+PLOT_FORMAT_VERSION = 1
+
+_KEY_PATTERN = re.compile(r"^[0-9a-f]{32}$")
+
+
+def _json_default(value):
+    # Arreglos y escalares de numpy, y cualquier otra secuencia de valores.
+    if hasattr(value, "tolist"):
+        return value.tolist()
+    try:
+        return list(value)
+    except TypeError:
+        return repr(value)
+
+
+def plot_key(kind: str, *inputs) -> str:
+    """
+    Calcula la llave de una gráfica a partir de los datos con los que se dibuja.
+
+    Args:
+        kind (str): Tipo de gráfica, por ejemplo "function_plot".
+        *inputs: Datos de la gráfica.
+
+    Returns:
+        str: Hash hexadecimal de 32 caracteres.
+    """
+    payload = json.dumps(
+        [
+            PLOT_FORMAT_VERSION,
+            settings.PLOT_RENDERER,
+            settings.PLOT_SIMPLIFY_TOLERANCE,
+            settings.PLOT_MAX_POINTS,
+            kind,
+            *inputs,
+        ],
+        default=_json_default,
+        sort_keys=True,
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()[:32]
+
+
+def is_plot_key(key: str) -> bool:
+    return bool(_KEY_PATTERN.match(key))
+
+
+class PlotStore(ABC):
+    """
+    Almacén de gráficas SVG indexadas por llave.
+    """
+
+    @abstractmethod
+    def get(self, key: str) -> bytes | None:
+        pass
+
+    @abstractmethod
+    def put(self, key: str, content: bytes) -> None:
+        pass
+
+    def has(self, key: str) -> bool:
+        return self.get(key) is not None
+
+
+class MemoryPlotStore(PlotStore):
+    """
+    Caché LRU en memoria; descarta la gráfica usada hace más tiempo al superar `max_entries`.
+    """
+
+    def __init__(self, max_entries: int = 256, **kwargs):
+        self.max_entries = max(1, max_entries)
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> bytes | None:
+        with self._lock:
+            content = self._entries.get(key)
+            if content is not None:
+                self._entries.move_to_end(key)
+            return content
+
+    def put(self, key: str, content: bytes) -> None:
+        with self._lock:
+            self._entries[key] = content
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+
+class DirectoryPlotStore(PlotStore):
+    """
+    Guarda cada gráfica como un archivo `<location>/<ab>/<llave>.svg`.
+
+    El directorio se limita a unas `max_entries` gráficas: leer una gráfica actualiza la fecha de modificación de su archivo y, cada tanto, al guardar se borran las de fecha más antigua (LRU entre todos los procesos que comparten el directorio).
+    """
+
+    def __init__(self, location: str | Path, max_entries: int = 256, **kwargs):
+        self.location = Path(location)
+        self.max_entries = max(1, max_entries)
+        # El directorio se recorre una vez cada `_prune_interval` gráficas guardadas por este proceso, no en cada una
+        self._prune_interval = max(1, self.max_entries // 10)
+        self._puts_since_prune = 0
+        self._prune_lock = threading.Lock()
+
+    def _path(self, key: str) -> Path:
+        return self.location / key[:2] / f"{key}.svg"
+
+    def get(self, key: str) -> bytes | None:
+        path = self._path(key)
+        try:
+            content = path.read_bytes()
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        return content
+
+    def has(self, key: str) -> bool:
+        return self._path(key).exists()
+
+    def put(self, key: str, content: bytes) -> None:
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Se escribe en un archivo temporal y se renombra, así nunca se lee una gráfica a medio escribir.
+        descriptor, temporary_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(descriptor, "wb") as file:
+                file.write(content)
+            os.replace(temporary_path, path)
+        except BaseException:
+            os.unlink(temporary_path)
+            raise
+
+        with self._prune_lock:
+            self._puts_since_prune += 1
+            if self._puts_since_prune < self._prune_interval:
+                return
+            self._puts_since_prune = 0
+        self.prune()
+
+    def prune(self) -> int:
+        """
+        Borra las gráficas usadas hace más tiempo hasta dejar `max_entries`.
+
+        Returns:
+            int: Número de gráficas borradas.
+        """
+        entries = []
+        for path in self.location.glob("*/*.svg"):
+            try:
+                entries.append((path.stat().st_mtime, path))
+            except FileNotFoundError:
+                # Otro proceso la borró mientras se recorría el directorio
+                continue
+        if len(entries) <= self.max_entries:
+            return 0
+
+        entries.sort()
+        removed = 0
+        for _, path in entries[: len(entries) - self.max_entries]:
+            try:
+                path.unlink()
+                removed += 1
+            except FileNotFoundError:
+                continue
+        return removed
+
+
+class SharedDirectoryPlotStore(DirectoryPlotStore):
+    """
+    Directorio compartido entre varios nodos (por ejemplo un volumen de red). Como las gráficas nunca cambian para una misma llave, cada nodo las guarda también en una caché LRU local y solo lee el directorio la primera vez; si dos nodos escriben la misma gráfica a la vez, el renombrado atómico deja una sola copia válida.
+    """
+
+    def __init__(self, location: str | Path, max_entries: int = 256, **kwargs):
+        super().__init__(location, max_entries)
+        self._cache = MemoryPlotStore(max_entries)
+
+    def get(self, key: str) -> bytes | None:
+        content = self._cache.get(key)
+        if content is None:
+            content = super().get(key)
+            if content is not None:
+                self._cache.put(key, content)
+        else:
+            self._touch(key, content)
+        return content
+
+    def has(self, key: str) -> bool:
+        content = self._cache.get(key)
+        if content is not None:
+            self._touch(key, content)
+            return True
+        return super().has(key)
+
+    def _touch(self, key: str, content: bytes) -> None:
+        # Una gráfica servida desde la caché local también cuenta como usada en el directorio; si otro nodo ya la
+        # borró se vuelve a escribir, así los demás nodos la pueden servir
+        try:
+            os.utime(self._path(key))
+        except FileNotFoundError:
+            DirectoryPlotStore.put(self, key, content)
+
+    def put(self, key: str, content: bytes) -> None:
+        super().put(key, content)
+        self._cache.put(key, content)
+
+
+PLOT_STORE_BACKENDS = {
+    "memory": MemoryPlotStore,
+    "directory": DirectoryPlotStore,
+    "shared": SharedDirectoryPlotStore,
+}
+
+_store = None
+_store_lock = threading.Lock()
+
+# Candados por llave (repartidos por el hash): dos solicitudes con la misma gráfica no la dibujan dos veces, y las gráficas distintas se dibujan al mismo tiempo.
+_render_locks = tuple(threading.Lock() for _ in range(64))
+
+# pyplot usa un estado global, así que con PLOT_RENDERER="matplotlib" se dibuja una gráfica a la vez.
+_pyplot_lock = threading.Lock()
+
+_rendered_plots: ContextVar[dict | None] = ContextVar("rendered_plots", default=None)
+
+
+def get_plot_store() -> PlotStore:
+    """
+    Retorna el almacén configurado en PLOT_STORE_BACKEND (se crea la primera vez que se usa).
+    """
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                backend = settings.PLOT_STORE_BACKEND
+                store_class = PLOT_STORE_BACKENDS.get(backend) or import_string(backend)
+                _store = store_class(
+                    location=settings.PLOT_STORE_LOCATION,
+                    max_entries=settings.PLOT_STORE_MAX_ENTRIES,
+                )
+    return _store
+
+
+def use_matplotlib() -> bool:
+    """
+    Indica si las gráficas se dibujan con matplotlib (PLOT_RENDERER="matplotlib") en lugar del generador SVG propio.
+    """
+    return settings.PLOT_RENDERER == "matplotlib"
+
+
+def render_svg(plt) -> bytes:
+    """
+    Guarda la figura actual de pyplot como SVG en memoria y la cierra.
+    """
+    buffer = io.BytesIO()
+    plt.savefig(buffer, format="svg")
+    plt.close()
+    return buffer.getvalue()
+
+
+def render_plot(name: str, key: str, draw: Callable[[], bytes]) -> str:
+    """
+    Dibuja una gráfica solo si no está en el almacén y la registra en la solicitud actual.
+
+    Args:
+        name (str): Nombre con el que las plantillas acceden a la gráfica, por ejemplo "function_plot".
+        key (str): Llave de la gráfica, calculada con `plot_key`.
+        draw (Callable[[], bytes]): Función que dibuja la gráfica y retorna el SVG.
+
+    Returns:
+        str: La llave de la gráfica.
+    """
+    store = get_plot_store()
+    if not store.has(key):
+        with _render_locks[int(key[:8], 16) % len(_render_locks)]:
+            if not store.has(key):
+                with _pyplot_lock if use_matplotlib() else nullcontext():
+                    content = draw()
+                store.put(key, content)
+
+    plots = _rendered_plots.get()
+    if plots is not None:
+        plots[name] = key
+    return key
+
+
+@contextmanager
+def collect_plots(plots: dict | None = None) -> Iterator[dict]:
+    """
+    Registra en `plots` las gráficas dibujadas dentro del bloque, con la forma {nombre: llave}.
+    """
+    plots = {} if plots is None else plots
+    token = _rendered_plots.set(plots)
+    try:
+        yield plots
+    finally:
+        _rendered_plots.reset(token)
+
+
+def current_plots() -> dict:
+    """
+    Retorna una copia de las gráficas registradas hasta ahora en la solicitud actual.
+    """
+    return dict(_rendered_plots.get() or {})
+
+
+def plot_urls(plots: dict) -> dict:
+    """
+    Convierte {nombre: llave} en {nombre: {"url": ..., "download_url": ...}}.
+    """
+    return {
+        name: {
+            "url": reverse("numerical_method:plot", args=[key]),
+            "download_url": reverse("numerical_method:download_svg", args=[key]),
+        }
+        for name, key in plots.items()
+    }
+
+
+class PlotStoreMiddleware:
+    """
+    Registra las gráficas dibujadas durante cada solicitud en `request.plots`.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        with collect_plots() as plots:
+            request.plots = plots
+            return self.get_response(request)
+
+
+def plots_context(request) -> dict:
+    """
+    Procesador de contexto: expone a las plantillas las URLs de las gráficas de la solicitud.
+    """
+    return {"plots": plot_urls(getattr(request, "plots", {}))}
@@ -0,0 +1,160 @@
+import math
+from typing import Callable
+import numpy as np
+from scipy import sparse
+from scipy.sparse.linalg import spilu
+from src.application.shared.utils.linear_operator import is_matrix_free
+from src.application.shared.utils.sparse_matrix import (
+    triangular_solver,
+)
+
+"""
+
+Precondicionadores para los métodos de Krylov. Cada uno se entrega como una función que aplica M⁻¹ a un residuo, sin formar M⁻¹:
+
+    none: M = I.
+    jacobi: M = D; aplicar M⁻¹ es dividir entre la diagonal.
+    ssor: M = (D + w·L)·D⁻¹·(D + w·U) / (w·(2 - w)); una sustitución hacia adelante y otra hacia atrás.
+    ichol: Cholesky incompleto IC(0), M = L·Lᵀ con L restringida al patrón de la parte triangular inferior de A.
+    ilu: factorización LU incompleta con umbral de descarte (SuperLU), M = L·U; no exige simetría.
+
+El gradiente conjugado necesita un M simétrico definido positivo (PRECONDITIONERS); GMRES y BiCGSTAB admiten también ILU (NONSYMMETRIC_PRECONDITIONERS). Con un operador sin matriz solo se puede usar "none" o una función propia que aplique M⁻¹.
+
+"""
+
+# Precondicionadores disponibles, en el orden en que se muestran en el formulario.
+PRECONDITIONERS = ("none", "jacobi", "ssor", "ichol")
+
+# Precondicionadores de GMRES y BiCGSTAB, que no necesitan que M sea simétrico.
+NONSYMMETRIC_PRECONDITIONERS = ("none", "jacobi", "ssor", "ilu")
+
+# Factor de relajación del precondicionador SSOR; con w = 1 es Gauss-Seidel simétrico.
+SSOR_RELAXATION = 1.0
+
+
+def build_preconditioner(
+    A,
+    preconditioner: str | Callable[[np.ndarray], np.ndarray],
+    relaxation_factor: float = SSOR_RELAXATION,
+) -> Callable[[np.ndarray], np.ndarray]:
+    """
+    Construye la función r -> M⁻¹·r del precondicionador pedido.
+
+    Args:
+        A: Matriz densa o dispersa (simétrica definida positiva para "ichol"), o un operador sin matriz.
+        preconditioner (str | Callable): Uno de PRECONDITIONERS o NONSYMMETRIC_PRECONDITIONERS, o una función que ya aplica M⁻¹.
+        relaxation_factor (float): Factor de relajación w del precondicionador SSOR.
+
+    Returns:
+        Callable: Función que aplica M⁻¹ a un vector.
+
+    Raises:
+        ValueError: Si el precondicionador no existe, necesita la matriz A explícita o la factorización incompleta falla.
+    """
+    if callable(preconditioner):
+        return preconditioner
+
+    if preconditioner == "none":
+        return lambda residual: residual.copy()
+
+    if is_matrix_free(A):
+        raise ValueError(
+            f"El precondicionador {preconditioner} necesita la matriz A explícita; con un operador sin matriz use 'none' o una función que aplique M⁻¹."
+        )
+
+    diagonal = A.diagonal() if sparse.issparse(A) else np.diag(A)
+    if preconditioner in ("jacobi", "ssor") and np.any(diagonal == 0):
+        raise ValueError(
+            f"El precondicionador {preconditioner} divide entre la diagonal de A, que no debe tener ceros."
+        )
+
+    if preconditioner == "jacobi":
+        inverse_diagonal = 1 / diagonal
+        return lambda residual: inverse_diagonal * residual
+
+    if preconditioner == "ssor":
+        w = relaxation_factor
+        if sparse.issparse(A):
+            lower = (sparse.diags(diagonal) + w * sparse.tril(A, -1)).tocsr()
+            upper = (sparse.diags(diagonal) + w * sparse.triu(A, 1)).tocsr()
+        else:
+            lower = np.diag(diagonal) + w * np.tril(A, -1)
+            upper = np.diag(diagonal) + w * np.triu(A, 1)
+        scale = w * (2 - w)
+        solve_lower = triangular_solver(lower, lower=True)
+        solve_upper = triangular_solver(upper, lower=False)
+        return lambda residual: scale * solve_upper(diagonal * solve_lower(residual))
+
+    if preconditioner == "ichol":
+        factor = incomplete_cholesky(A)
+        solve_lower = triangular_solver(factor, lower=True)
+        solve_upper = triangular_solver(factor.T, lower=False)
+        return lambda residual: solve_upper(solve_lower(residual))
+
+    if preconditioner == "ilu":
+        try:
+            # Con el orden de grado mínimo de A + Aᵀ el factor incompleto aproxima a A mucho mejor que con COLAMD, el orden por defecto
+            return spilu(sparse.csc_matrix(A, dtype=float), permc_spec="MMD_AT_PLUS_A").solve
+        except RuntimeError as error:
+            raise ValueError(
+                "La factorización LU incompleta encontró un pivote nulo: la matriz A es singular o ILU no existe para ella."
+            ) from error
+
+    choices = dict.fromkeys(PRECONDITIONERS + NONSYMMETRIC_PRECONDITIONERS)
+    raise ValueError(f"El precondicionador debe ser uno de: {', '.join(choices)}.")
+
+
+def incomplete_cholesky(A) -> sparse.csr_matrix:
+    """
+    Factor L de Cholesky incompleto sin relleno, IC(0): L·Lᵀ ≈ A y L tiene el patrón de tril(A).
+
+    La factorización es secuencial por filas: cada entrada l_ik usa las filas i y k ya calculadas.
+
+    Args:
+        A: Matriz simétrica definida positiva, densa o dispersa.
+
+    Returns:
+        sparse.csr_matrix: Factor triangular inferior L.
+
+    Raises:
+        ValueError: Si aparece un pivote no positivo (A no es definida positiva o IC(0) no existe para A).
+    """
+    lower = sparse.tril(sparse.csr_matrix(A, dtype=float), format="csr")
+    lower.sum_duplicates()
+    lower.sort_indices()
+    n = lower.shape[0]
+    indptr = lower.indptr.tolist()
+    indices = lower.indices.tolist()
+    values = lower.data.tolist()
+
+    # Posición de cada columna dentro de su fila, para cruzar las filas i y k
+    row_positions = []
+    for i in range(n):
+        start, end = indptr[i], indptr[i + 1]
+        if end == start or indices[end - 1] != i:
+            raise ValueError("La diagonal de la matriz A no debe tener ceros.")
+        row_positions.append(dict(zip(indices[start : end - 1], range(start, end - 1))))
+
+    for i in range(n):
+        start, end = indptr[i], indptr[i + 1]
+        positions = row_positions[i]
+        for p in range(start, end - 1):
+            k = indices[p]
+            # Producto de las filas i y k en las columnas j < k que ambas tienen
+            total = 0.0
+            for q in range(indptr[k], indptr[k + 1] - 1):
+                other = positions.get(indices[q])
+                if other is not None:
+                    total += values[other] * values[q]
+            values[p] = (values[p] - total) / values[indptr[k + 1] - 1]
+
+        pivot = values[end - 1] - sum(value * value for value in values[start : end - 1])
+        if pivot <= 0:
+            raise ValueError(
+                "El Cholesky incompleto encontró un pivote no positivo: la matriz A no es definida positiva o IC(0) no existe para ella."
+            )
+        values[end - 1] = math.sqrt(pivot)
+
+    return sparse.csr_matrix(
+        (np.array(values), lower.indices, lower.indptr), shape=lower.shape
+    )
@@ -0,0 +1,139 @@
+import math
+import numpy as np
+from scipy import sparse
+from src.application.shared.utils.spectral_radius import estimate_spectral_radius
+
+"""
+
+Elección automática del factor de relajación w de SOR. Para matrices consistentemente ordenadas en el orden de los barridos (el orden rojo-negro de una matriz con la propiedad A, o el orden natural de una tridiagonal o de una malla de 5 puntos) la teoría de Young relaciona los radios espectrales de Jacobi, Gauss-Seidel y SOR:
+
+    ρ_GS = ρ_J²        w_opt = 2 / (1 + sqrt(1 - ρ_J²))        ρ_SOR(w_opt) = w_opt - 1
+
+así que basta estimar ρ_J con Arnoldi (ver spectral_radius.py). La propiedad A sola no basta: con otro orden de las filas las relaciones no valen y w_opt puede quedar muy lejos del óptimo. Para las demás matrices, o si ρ_J no se pudo estimar, se empieza con w = 1 (Gauss-Seidel) y, cuando la razón entre errores consecutivos se estabiliza, se toma como estimación de ρ_GS y se cambia a 2 / (1 + sqrt(1 - ρ_GS)).
+
+"""
+
+# Valor del factor de relajación que pide la elección automática.
+RELAXATION_AUTO = "auto"
+
+# Número máximo de iteraciones con w = 1 para observar la razón de los errores.
+ADAPTATION_ITERATIONS = 20
+
+# Cambio relativo entre dos razones consecutivas con el que se considera estable.
+RATIO_TOLERANCE = 0.01
+
+
+def optimal_relaxation_factor(jacobi_radius: float) -> float:
+    """
+    w óptimo de SOR para una matriz consistentemente ordenada.
+
+    Args:
+        jacobi_radius (float): Radio espectral de la matriz de iteración de Jacobi (menor que 1).
+
+    Returns:
+        float: Factor de relajación en [1, 2).
+    """
+    return 2 / (1 + math.sqrt(1 - jacobi_radius**2))
+
+
+class AutomaticRelaxation:
+    """
+    Factor de relajación de SOR calculado a partir de A o ajustado con los errores de las primeras iteraciones.
+    """
+
+    def __init__(self, A, consistently_ordered: bool):
+        """
+        Args:
+            A: Matriz del sistema, densa o dispersa, sin ceros en la diagonal.
+            consistently_ordered (bool): Si A es consistentemente ordenada en el orden de los barridos.
+        """
+        self.jacobi_radius = None
+        self.gauss_seidel_radius = None
+        self.relaxation_factor = 1.0
+        self.adapting = True
+        self.observed_iterations = 0
+        self._previous_error = None
+        self._previous_ratio = None
+
+        if consistently_ordered:
+            diagonal = A.diagonal() if sparse.issparse(A) else np.diag(A)
+            inverse_diagonal = 1 / diagonal
+            if sparse.issparse(A):
+                off_diagonal = (A - sparse.diags(diagonal)).tocsr()
+            else:
+                off_diagonal = A - np.diag(diagonal)
+            jacobi_radius = estimate_spectral_radius(
+                lambda v: inverse_diagonal * (off_diagonal @ v), A.shape[0]
+            )
+            if jacobi_radius is not None and jacobi_radius < 1:
+                self.jacobi_radius = jacobi_radius
+                self.gauss_seidel_radius = jacobi_radius**2
+                self.relaxation_factor = optimal_relaxation_factor(jacobi_radius)
+                self.adapting = False
+
+    def observe(self, error: float) -> float | None:
+        """
+        Registra el error de una iteración mientras w = 1 se está observando.
+
+        Args:
+            error (float): Norma de la diferencia entre dos aproximaciones consecutivas.
+
+        Returns:
+            float | None: El nuevo w si hay que cambiarlo, si no None.
+        """
+        if not self.adapting:
+            return None
+
+        self.observed_iterations += 1
+        ratio = error / self._previous_error if self._previous_error else None
+        self._previous_error = error
+        if ratio is None:
+            return None
+
+        stable = (
+            self._previous_ratio is not None
+            and abs(ratio - self._previous_ratio) <= RATIO_TOLERANCE * ratio
+        )
+        self._previous_ratio = ratio
+        if not stable and self.observed_iterations < ADAPTATION_ITERATIONS:
+            return None
+
+        self.adapting = False
+        if not 0 < ratio < 1:
+            # Gauss-Seidel no converge (o ya convergió): se conserva w = 1
+            return None
+        self.gauss_seidel_radius = ratio
+        self.relaxation_factor = optimal_relaxation_factor(math.sqrt(ratio))
+        return self.relaxation_factor
+
+    def estimated_savings(self) -> float | None:
+        """
+        Fracción estimada de iteraciones que SOR ahorra frente a Gauss-Seidel, con ρ_SOR ≈ w - 1.
+        """
+        if self.gauss_seidel_radius is None or self.relaxation_factor <= 1:
+            return None
+        sor_radius = self.relaxation_factor - 1
+        if self.gauss_seidel_radius == 0 or sor_radius == 0:
+            return None
+        # El número de iteraciones para reducir el error es proporcional a 1 / |log ρ|
+        return 1 - math.log(self.gauss_seidel_radius) / math.log(sor_radius)
+
+    def message(self) -> str:
+        """
+        Describe el w elegido y el ahorro estimado, para el mensaje del método.
+        """
+        if self.jacobi_radius is not None:
+            origin = f"a partir del radio espectral de Jacobi ≈ {self.jacobi_radius:.6f}"
+        elif self.gauss_seidel_radius is not None:
+            origin = (
+                f"con la razón de los errores de las primeras {self.observed_iterations} "
+                f"iteraciones (ρ_GS ≈ {self.gauss_seidel_radius:.6f})"
+            )
+        else:
+            return "Factor de relajación automático: no se pudo estimar, se usó w = 1 (Gauss-Seidel)."
+
+        message = f"Factor de relajación automático w = {self.relaxation_factor:.6f}, calculado {origin}."
+        savings = self.estimated_savings()
+        if savings is not None:
+            message += f" Ahorro estimado frente a Gauss-Seidel: {savings:.0%} de las iteraciones."
+        return message
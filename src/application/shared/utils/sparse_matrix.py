@@ -0,0 +1,159 @@
+import io
+from typing import Callable
+import numpy as np
+from scipy import sparse
+from scipy.io import mmread
+from scipy.linalg import solve_triangular
+from scipy.sparse.linalg import LinearOperator, splu
+
+"""
+
+Lectura de sistemas de ecuaciones dispersos para los métodos iterativos (Jacobi, Gauss-Seidel y SOR). La matriz A se guarda en formato CSR (filas comprimidas), así la memoria crece con el número de entradas distintas de cero y no con n², y cada barrido de los métodos es un producto matriz-vector o una sustitución sobre la matriz dispersa.
+
+Formatos admitidos para A:
+    triplets: una entrada "i j valor" por línea (o separadas por punto y coma), con índices desde 1. Las entradas repetidas se suman.
+    matrix_market: texto en formato Matrix Market (coordinate o array), como los archivos .mtx. Jacobi deja los archivos "array" como matrices densas, sin el límite de 6x6 del formato por filas.
+
+"""
+
+# Formatos de entrada de la matriz A; "dense" es el formato por filas de siempre ("1 2; 3 4").
+MATRIX_FORMATS = ("dense", "triplets", "matrix_market")
+
+
+def parse_sparse_matrix(
+    matrix_raw: str, matrix_format: str, keep_dense: bool = False
+) -> sparse.csr_matrix | np.ndarray:
+    """
+    Convierte el texto de la matriz A en una matriz CSR.
+
+    Args:
+        matrix_raw (str): Texto con la matriz.
+        matrix_format (str): "triplets" o "matrix_market".
+        keep_dense (bool): Si un archivo Matrix Market "array" (denso) se deja como arreglo de NumPy en lugar de pasarlo a CSR.
+
+    Returns:
+        sparse.csr_matrix | np.ndarray: Matriz dispersa, o densa si keep_dense y el archivo es "array".
+
+    Raises:
+        ValueError: Si el texto no tiene el formato indicado.
+    """
+    if matrix_format == "matrix_market":
+        try:
+            matrix = mmread(io.StringIO(matrix_raw.strip() + "\n"))
+        except Exception as error:
+            raise ValueError(
+                "La matriz A no tiene un formato Matrix Market válido."
+            ) from error
+        if keep_dense and not sparse.issparse(matrix):
+            return np.asarray(matrix, dtype=float)
+        return sparse.csr_matrix(matrix, dtype=float)
+
+    rows, columns, values = [], [], []
+    for entry in matrix_raw.replace(";", "\n").splitlines():
+        if not entry.strip() or entry.lstrip().startswith("%"):
+            continue
+        parts = entry.split()
+        if len(parts) != 3:
+            raise ValueError(
+                "Cada entrada de la matriz A debe tener la forma 'fila columna valor'."
+            )
+        try:
+            rows.append(int(parts[0]) - 1)
+            columns.append(int(parts[1]) - 1)
+            values.append(float(parts[2]))
+        except ValueError:
+            raise ValueError("Todas las entradas deben ser numéricas.") from None
+
+    if not values:
+        raise ValueError("La matriz A no tiene entradas.")
+    if min(rows) < 0 or min(columns) < 0:
+        raise ValueError("Los índices de la matriz A empiezan en 1.")
+
+    size = max(max(rows), max(columns)) + 1
+    return sparse.csr_matrix((values, (rows, columns)), shape=(size, size))
+
+
+def parse_vector(vector_raw: str, size: int) -> np.ndarray:
+    """
+    Convierte un vector separado por espacios; un solo valor se repite en las `size` componentes.
+
+    Raises:
+        ValueError: Si algún valor no es numérico.
+    """
+    values = np.array([float(num) for num in vector_raw.split()], dtype=float)
+    if values.size == 1:
+        return np.full(size, values[0])
+    return values
+
+
+def validate_sparse_system(
+    matrix_a_raw: str,
+    vector_b_raw: str,
+    initial_guess_raw: str,
+    matrix_format: str,
+    nonzero_diagonal: bool = True,
+    keep_dense: bool = False,
+) -> str | list:
+    """
+    Valida un sistema con la matriz A en un formato disperso.
+
+    Args:
+        nonzero_diagonal (bool): Si se exige que la diagonal de A no tenga ceros; los métodos de Krylov no dividen entre ella.
+        keep_dense (bool): Si un archivo Matrix Market "array" se deja denso (ver parse_sparse_matrix).
+
+    Returns:
+        str | list: Mensaje de error, o [A, b, x0] con A en formato CSR (o densa) y b, x0 como arreglos.
+    """
+    try:
+        A = parse_sparse_matrix(matrix_a_raw, matrix_format, keep_dense)
+    except ValueError as error:
+        return str(error)
+
+    try:
+        b = parse_vector(vector_b_raw, A.shape[0])
+        x0 = parse_vector(initial_guess_raw, A.shape[0])
+    except ValueError:
+        return "Todas las entradas deben ser numéricas."
+
+    if A.shape[0] != A.shape[1]:
+        return "La matriz A debe ser cuadrada."
+
+    if len(b) != A.shape[0] or len(x0) != A.shape[0]:
+        return "El vector b y x0 deben ser compatibles con el tamaño de la matriz A."
+
+    # Jacobi, Gauss-Seidel y SOR dividen entre la diagonal de A
+    if nonzero_diagonal and np.any(A.diagonal() == 0):
+        return "La diagonal de la matriz A no debe tener ceros."
+
+    return [A, b, x0]
+
+
+def dense_rows(A) -> list[list[float]]:
+    """
+    Convierte A (densa, dispersa o un operador) en lista de filas; solo se usa con matrices pequeñas, para las gráficas.
+    """
+    if sparse.issparse(A):
+        return A.toarray().tolist()
+    if isinstance(A, LinearOperator):
+        return (A @ np.eye(A.shape[1])).tolist()
+    return np.asarray(A).tolist()
+
+
+def triangular_solver(M, lower: bool = True) -> Callable[[np.ndarray], np.ndarray]:
+    """
+    Prepara la solución de M·x = rhs con M triangular (densa o dispersa) para usarla en cada iteración.
+
+    Con M dispersa se factoriza una sola vez con SuperLU en orden natural y sin pivoteo (la factorización de una matriz triangular no agrega entradas), así cada solución es una sustitución en C en lugar del recorrido fila por fila de spsolve_triangular.
+
+    Args:
+        M: Matriz triangular sin ceros en la diagonal.
+        lower (bool): True si M es triangular inferior (sustitución hacia adelante).
+
+    Returns:
+        Callable: Función que recibe rhs y retorna x.
+    """
+    if sparse.issparse(M):
+        return splu(
+            sparse.csc_matrix(M), permc_spec="NATURAL", diag_pivot_thresh=0
+        ).solve
+    return lambda rhs: solve_triangular(M, rhs, lower=lower, check_finite=False)
@@ -0,0 +1,129 @@
+import math
+from typing import Callable
+import numpy as np
+from django.conf import settings
+from scipy.sparse.linalg import (
+    ArpackError,
+    ArpackNoConvergence,
+    LinearOperator,
+    eigs,
+)
+
+"""
+
+Radio espectral de la matriz de iteración T de un método estacionario sin formar T. El método solo entrega una función que aplica T a un vector (un producto matriz-vector y, en Gauss-Seidel y SOR, una sustitución hacia adelante con la parte triangular de A, densa o dispersa) y el radio espectral se estima con el método de Arnoldi reiniciado (ARPACK, `eigs`), que solo necesita productos T·v en lugar de invertir una matriz y calcular todos sus valores propios.
+
+No se usa el método de la potencia: converge con la razón |λ₂/λ₁|, que en los sistemas donde importa el radio espectral (ρ cerca de 1) también está cerca de 1, y deja de avanzar con un par dominante ±ρ o complejo conjugado, como en la matriz de iteración de Jacobi de una matriz con la propiedad A. Detenerlo cuando la estimación casi no cambia da un radio muy lejano del verdadero; Arnoldi se detiene con el residuo ‖T·v - λ·v‖, y un par ±ρ no le impide converger.
+
+Arnoldi no converge cuando muchos valores propios tienen (casi) el mismo módulo, como SOR con w cercano a w_opt, donde todos quedan sobre el círculo |λ| = w - 1, ni con matrices muy lejanas de ser normales (Gauss-Seidel con diagonal dominante). En esos casos se usa la tasa de crecimiento ρ = lim ‖T^k·v‖^(1/k): la media geométrica de ‖T·v_k‖ en la segunda mitad de una serie de productos, que no depende de cuántos valores propios compartan el módulo máximo y deja atrás el transitorio de las matrices no normales. Si tampoco así se obtiene un número finito el radio se reporta como no estimado.
+
+La precisión relativa y el número máximo de reinicios se configuran con SPECTRAL_RADIUS_TOLERANCE y SPECTRAL_RADIUS_MAX_ITERATIONS.
+
+"""
+
+# Productos T·v de la tasa de crecimiento por cada reinicio permitido a Arnoldi.
+GROWTH_STEPS_PER_ITERATION = 20
+
+# Hasta este tamaño T se forma columna por columna y se usa la descomposición densa, que balancea T y por eso también
+# sirve con matrices de iteración muy lejanas de ser normales (Gauss-Seidel y SOR con diagonal dominante), donde los
+# valores de Ritz de Arnoldi se quedan en el pseudoespectro y no convergen al radio verdadero.
+DENSE_SIZE = 300
+
+
+def estimate_spectral_radius(
+    apply: Callable[[np.ndarray], np.ndarray],
+    size: int,
+    tolerance: float | None = None,
+    max_iterations: int | None = None,
+) -> float | None:
+    """
+    Estima el radio espectral de T.
+
+    Args:
+        apply (Callable): Función que recibe un vector v y retorna T·v.
+        size (int): Tamaño de T.
+        tolerance (float | None): Tolerancia relativa del residuo, ‖T·v - λ·v‖ ≤ tolerance·|λ|; por defecto SPECTRAL_RADIUS_TOLERANCE.
+        max_iterations (int | None): Número máximo de reinicios de Arnoldi; por defecto SPECTRAL_RADIUS_MAX_ITERATIONS.
+
+    Returns:
+        float | None: Módulo del valor propio de mayor módulo (con todos los valores propios hasta DENSE_SIZE, con Arnoldi o la tasa de crecimiento en otro caso), o None si no se pudo estimar.
+    """
+    if tolerance is None:
+        tolerance = settings.SPECTRAL_RADIUS_TOLERANCE
+    if max_iterations is None:
+        max_iterations = settings.SPECTRAL_RADIUS_MAX_ITERATIONS
+
+    if size <= DENSE_SIZE:
+        T = np.column_stack([apply(column) for column in np.eye(size)])
+        return float(max(abs(np.linalg.eigvals(T))))
+
+    operator = LinearOperator((size, size), matvec=apply, dtype=float)
+    # Vector inicial con componentes en todas las direcciones propias (fijo, así el resultado no cambia entre solicitudes)
+    start = np.random.default_rng(0).random(size)
+    try:
+        values = eigs(
+            operator,
+            k=1,
+            which="LM",
+            tol=tolerance,
+            maxiter=max_iterations,
+            v0=start,
+            return_eigenvectors=False,
+        )
+    except ArpackNoConvergence as error:
+        # Se usa lo que alcanzó a converger, o la tasa de crecimiento si nada convergió
+        values = error.eigenvalues
+        if len(values) == 0:
+            return growth_rate(apply, start, GROWTH_STEPS_PER_ITERATION * max_iterations)
+    except ArpackError:
+        # Por ejemplo si T·v = 0 para todo v (Gauss-Seidel con A triangular inferior)
+        return growth_rate(apply, start, GROWTH_STEPS_PER_ITERATION * max_iterations)
+
+    return float(max(abs(np.asarray(values))))
+
+
+def growth_rate(apply: Callable[[np.ndarray], np.ndarray], start: np.ndarray, steps: int) -> float | None:
+    """
+    Estima ρ(T) como la media geométrica de ‖T·v_k‖ (v_k normalizado) en la segunda mitad de `steps` productos.
+
+    Args:
+        apply (Callable): Función que recibe un vector v y retorna T·v.
+        start (np.ndarray): Vector inicial.
+        steps (int): Número de productos T·v.
+
+    Returns:
+        float | None: Estimación de ρ(T), o None si los productos dejan de ser finitos.
+    """
+    vector = start / np.linalg.norm(start)
+    steps = max(steps, 2)
+    log_growth = 0.0
+    for step in range(steps):
+        vector = apply(vector)
+        norm = float(np.linalg.norm(vector))
+        if norm == 0:
+            return 0.0
+        if not math.isfinite(norm):
+            return None
+        vector /= norm
+        # La primera mitad solo deja pasar el transitorio
+        if step >= steps // 2:
+            log_growth += math.log(norm)
+    return math.exp(log_growth / (steps - steps // 2))
+
+
+def spectral_radius_message(spectral_radius: float | None, size: int, computed: bool = True) -> str:
+    """
+    Texto con el radio espectral para el mensaje de un método; arriba de DENSE_SIZE se aclara que es una estimación.
+
+    Args:
+        spectral_radius (float | None): Resultado de estimate_spectral_radius.
+        size (int): Tamaño de T.
+        computed (bool): Si se pidió calcular el radio espectral.
+    """
+    if not computed:
+        return ""
+    if spectral_radius is None:
+        return " (el radio espectral no se pudo estimar)"
+    if size <= DENSE_SIZE:
+        return f" y el radio espectral es de = {spectral_radius}"
+    return f" y el radio espectral estimado es de ≈ {spectral_radius:.6g}"
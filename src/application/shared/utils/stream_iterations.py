@@ -0,0 +1,133 @@
+import json
+import logging
+import math
+from typing import Callable, Generator
+from django.http import StreamingHttpResponse
+from src.application.shared.utils.iteration_table import RetentionPolicy
+from src.application.shared.utils.plot_store import (
+    collect_plots,
+    current_plots,
+    plot_urls,
+)
+
+"""
+
+Ejecución de los métodos iterativos como generadores. Cada servicio expone `iterate(...)`, un generador que entrega cada fila de la tabla en cuanto se calcula y retorna (con `return`) la respuesta final del método. `solve(...)` consume el generador completo, mientras que las vistas pueden transmitir las filas al cliente como eventos enviados por el servidor (server-sent events), así el tiempo hasta el primer byte no depende del número de iteraciones.
+
+"""
+
+# Al transmitir, la tabla del servicio conserva solo las últimas filas; las demás ya se enviaron al cliente.
+STREAM_RETENTION = RetentionPolicy(head=0, tail=16, stride=0, middle=0)
+
+# Generador de un método: entrega las filas de la tabla y retorna la respuesta final.
+IterationGenerator = Generator[object, None, dict]
+
+logger = logging.getLogger(__name__)
+
+
+def run_iterations(iterations: IterationGenerator) -> dict:
+    """
+    Ejecuta todas las iteraciones de un método y retorna su respuesta final.
+
+    Args:
+        iterations (Generator): Generador retornado por `iterate(...)`.
+
+    Returns:
+        dict: Respuesta final del método (el valor retornado por el generador).
+    """
+    while True:
+        try:
+            next(iterations)
+        except StopIteration as stop:
+            return stop.value
+
+
+def _json_value(value):
+    # JSON no admite infinito ni NaN, se envían como texto.
+    if isinstance(value, float) and not math.isfinite(value):
+        return str(value)
+    if isinstance(value, (list, tuple)):
+        return [_json_value(item) for item in value]
+    if hasattr(value, "tolist"):
+        return _json_value(value.tolist())
+    return value
+
+
+def format_event(event: str, data: dict) -> str:
+    """
+    Da formato de evento enviado por el servidor a un diccionario.
+
+    Args:
+        event (str): Nombre del evento, "row" o "result".
+        data (dict): Datos del evento.
+
+    Returns:
+        str: Evento con el formato "event: ...\\ndata: ...\\n\\n".
+    """
+    payload = json.dumps({key: _json_value(value) for key, value in data.items()})
+    return f"event: {event}\ndata: {payload}\n\n"
+
+
+def error_result(error: Exception) -> dict:
+    """
+    Respuesta final de un método que lanzó una excepción, con la forma de los errores de las vistas.
+    """
+    return {
+        "message_method": f"El método falló durante las iteraciones: {error}",
+        "table": {},
+        "is_successful": False,
+        "have_solution": False,
+    }
+
+
+def stream_iterations_response(
+    iterations: IterationGenerator | None,
+    result: dict | None = None,
+    on_result: Callable[[dict], None] | None = None,
+) -> StreamingHttpResponse:
+    """
+    Transmite las filas de un método iterativo a medida que se calculan.
+
+    Args:
+        iterations (Generator | None): Generador retornado por `iterate(...)`, o None si solo se envía `result`.
+        result (dict | None): Respuesta que se envía sin iterar, por ejemplo un error de validación.
+        on_result (Callable | None): Función que recibe la respuesta final antes de enviarla (por ejemplo para graficar).
+
+    Returns:
+        StreamingHttpResponse: Respuesta con un evento "row" por iteración y un evento "result" al final (con las URLs de las gráficas en "plots").
+    """
+    # Gráficas dibujadas por la vista antes de transmitir, por ejemplo al validar los datos.
+    plots = current_plots()
+
+    def events():
+        response = result
+        failed = False
+        if iterations is not None:
+            while True:
+                try:
+                    # El generador se ejecuta después de que la vista retornó, las gráficas se registran aquí.
+                    with collect_plots(plots):
+                        row = next(iterations)
+                except StopIteration as stop:
+                    response = stop.value
+                    break
+                except Exception as error:
+                    # Sin un evento "result" el cliente se quedaría esperando con la tabla incompleta.
+                    logger.exception("El método falló mientras transmitía sus iteraciones")
+                    response = error_result(error)
+                    failed = True
+                    break
+                yield format_event("row", row.to_dict())
+
+        if on_result is not None and not failed:
+            with collect_plots(plots):
+                on_result(response)
+
+        # La tabla ya se envió fila por fila.
+        data = {key: value for key, value in response.items() if key != "table"}
+        yield format_event("result", data | {"plots": plot_urls(plots)})
+
+    response = StreamingHttpResponse(events(), content_type="text/event-stream")
+    response["Cache-Control"] = "no-cache"
+    response["X-Accel-Buffering"] = "no"
+    return response
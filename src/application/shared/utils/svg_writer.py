@@ -0,0 +1,365 @@
+import math
+from xml.sax.saxutils import escape
+import numpy as np
+
+"""
+
+Generador mínimo de gráficas SVG para las gráficas de líneas de la aplicación (funciones, splines lineales y soluciones iterativas). Las gráficas solo tienen polilíneas, marcadores, ejes, cuadrícula, textos y leyenda, así que en lugar de crear una figura completa de matplotlib el SVG se escribe directamente: cada serie se convierte a coordenadas de pantalla con numpy y se emite como un único elemento <path> con coordenadas redondeadas a una décima de píxel. El resultado es mucho más liviano y rápido de generar; matplotlib se conserva como alternativa con PLOT_RENDERER="matplotlib".
+
+"""
+
+# Márgenes (en píxeles) alrededor del área de la gráfica: izquierda, derecha, arriba y abajo.
+MARGINS = (64, 16, 16, 48)
+
+# Colores por defecto de las series, los mismos que usa matplotlib.
+DEFAULT_COLORS = ("#1f77b4", "#ff7f0e", "#2ca02c", "#d62728", "#9467bd")
+
+FONT = 'font-family="DejaVu Sans, Arial, sans-serif"'
+
+
+def nice_ticks(lower: float, upper: float, count: int = 6) -> list[float]:
+    """
+    Calcula marcas "redondas" (múltiplos de 1, 2 o 5 por una potencia de 10) dentro de [lower, upper].
+
+    Args:
+        lower (float): Límite inferior del eje.
+        upper (float): Límite superior del eje.
+        count (int): Número aproximado de marcas.
+
+    Returns:
+        list[float]: Posiciones de las marcas.
+    """
+    span = upper - lower
+    if not math.isfinite(span) or span <= 0:
+        return [lower]
+    raw_step = span / max(1, count)
+    magnitude = 10 ** math.floor(math.log10(raw_step))
+    step = next(
+        factor * magnitude
+        for factor in (1, 2, 2.5, 5, 10)
+        if factor * magnitude >= raw_step
+    )
+    first = math.ceil(lower / step)
+    last = math.floor(upper / step)
+    return [index * step for index in range(first, last + 1)]
+
+
+def format_number(value: float) -> str:
+    # Cero exacto en lugar de valores como -1.2e-16 que resultan de multiplicar el paso.
+    if abs(value) < 1e-12:
+        return "0"
+    return f"{value:g}"
+
+
+class SvgFigure:
+    """
+    Figura SVG con un único par de ejes.
+    """
+
+    def __init__(
+        self,
+        width: int = 600,
+        height: int = 400,
+        title: str = "",
+        xlabel: str = "",
+        ylabel: str = "",
+    ):
+        self.width = width
+        self.height = height
+        self.title_lines = title.split("\n") if title else []
+        self.xlabel = xlabel
+        self.ylabel = ylabel
+        self.xlim = None
+        self.ylim = None
+        self.grid = True
+        self._series = []
+        self._texts = []
+        self._reference_lines = []
+
+    def line(
+        self,
+        x,
+        y,
+        color: str | None = None,
+        width: float = 1.5,
+        label: str | None = None,
+        dash: str | None = None,
+        marker: bool = False,
+    ) -> None:
+        """
+        Agrega una polilínea; los valores NaN o infinitos cortan la línea.
+        """
+        color = color or DEFAULT_COLORS[len(self._series) % len(DEFAULT_COLORS)]
+        self._series.append(
+            {
+                "x": np.asarray(x, dtype=float),
+                "y": np.asarray(y, dtype=float),
+                "color": color,
+                "width": width,
+                "label": label,
+                "dash": dash,
+                "line": True,
+                "marker": marker,
+            }
+        )
+
+    def scatter(
+        self, x, y, color: str | None = None, label: str | None = None
+    ) -> None:
+        """
+        Agrega marcadores circulares sin línea.
+        """
+        color = color or DEFAULT_COLORS[len(self._series) % len(DEFAULT_COLORS)]
+        self._series.append(
+            {
+                "x": np.atleast_1d(np.asarray(x, dtype=float)),
+                "y": np.atleast_1d(np.asarray(y, dtype=float)),
+                "color": color,
+                "width": 0,
+                "label": label,
+                "dash": None,
+                "line": False,
+                "marker": True,
+            }
+        )
+
+    def axhline(
+        self,
+        y: float,
+        color: str = "black",
+        width: float = 1,
+        dash: str | None = None,
+        label: str | None = None,
+    ) -> None:
+        self._reference_lines.append(("h", float(y), color, width, dash, label))
+
+    def axvline(
+        self, x: float, color: str = "black", width: float = 1, dash: str | None = None
+    ) -> None:
+        self._reference_lines.append(("v", float(x), color, width, dash, None))
+
+    def text(self, x: float, y: float, content: str, size: int = 9) -> None:
+        self._texts.append((float(x), float(y), content, size))
+
+    def _auto_limits(self, axis: str) -> tuple[float, float]:
+        values = [series[axis][np.isfinite(series[axis])] for series in self._series]
+        # Las líneas horizontales cuentan para el eje y y las verticales para el eje x, como en matplotlib.
+        orientation = "h" if axis == "y" else "v"
+        values.append(
+            np.array(
+                [line[1] for line in self._reference_lines if line[0] == orientation]
+            )
+        )
+        values = np.concatenate(values)
+        if values.size == 0:
+            return (-1.0, 1.0)
+        lower, upper = float(values.min()), float(values.max())
+        # Igual que matplotlib, se deja un 5 % de margen a cada lado.
+        padding = (upper - lower) * 0.05 or max(abs(lower) * 0.05, 0.5)
+        return (lower - padding, upper + padding)
+
+    def render(self) -> bytes:
+        """
+        Genera el documento SVG.
+
+        Returns:
+            bytes: SVG codificado en UTF-8.
+        """
+        xlim = self.xlim or self._auto_limits("x")
+        ylim = self.ylim or self._auto_limits("y")
+        left, right, top, bottom = MARGINS
+        top += 18 * len(self.title_lines)
+        plot_width = self.width - left - right
+        plot_height = self.height - top - bottom
+
+        def to_x(values):
+            return left + (np.asarray(values, dtype=float) - xlim[0]) / (
+                xlim[1] - xlim[0]
+            ) * plot_width
+
+        def to_y(values):
+            return top + (ylim[1] - np.asarray(values, dtype=float)) / (
+                ylim[1] - ylim[0]
+            ) * plot_height
+
+        parts = [
+            f'<svg xmlns="http://www.w3.org/2000/svg" width="{self.width}" height="{self.height}" viewBox="0 0 {self.width} {self.height}">',
+            f'<rect width="{self.width}" height="{self.height}" fill="white"/>',
+            f'<clipPath id="area"><rect x="{left}" y="{top}" width="{plot_width}" height="{plot_height}"/></clipPath>',
+        ]
+
+        # Título centrado, una línea por renglón.
+        for index, line in enumerate(self.title_lines):
+            parts.append(
+                f'<text x="{self.width / 2:.1f}" y="{20 + 18 * index}" text-anchor="middle" font-size="12" {FONT}>{escape(line)}</text>'
+            )
+
+        # Cuadrícula y marcas de los ejes.
+        x_ticks = nice_ticks(*xlim)
+        y_ticks = nice_ticks(*ylim)
+        grid = []
+        labels = []
+        for tick in x_ticks:
+            position = float(to_x(tick))
+            grid.append(f"M{position:.1f} {top}V{top + plot_height}")
+            labels.append(
+                f'<text x="{position:.1f}" y="{top + plot_height + 14}" text-anchor="middle">{format_number(tick)}</text>'
+            )
+        for tick in y_ticks:
+            position = float(to_y(tick))
+            grid.append(f"M{left} {position:.1f}H{left + plot_width}")
+            labels.append(
+                f'<text x="{left - 4}" y="{position + 3:.1f}" text-anchor="end">{format_number(tick)}</text>'
+            )
+        if self.grid:
+            parts.append(
+                f'<path d="{"".join(grid)}" stroke="#b0b0b0" stroke-width="0.8" stroke-opacity="0.6" fill="none"/>'
+            )
+        parts.append(f'<g font-size="10" {FONT}>{"".join(labels)}</g>')
+        if self.xlabel:
+            parts.append(
+                f'<text x="{left + plot_width / 2:.1f}" y="{self.height - 10}" text-anchor="middle" font-size="11" {FONT}>{escape(self.xlabel)}</text>'
+            )
+        if self.ylabel:
+            parts.append(
+                f'<text transform="translate(14 {top + plot_height / 2:.1f}) rotate(-90)" text-anchor="middle" font-size="11" {FONT}>{escape(self.ylabel)}</text>'
+            )
+
+        # Contenido recortado al área de la gráfica.
+        parts.append('<g clip-path="url(#area)">')
+        for orientation, value, color, width, dash, _ in self._reference_lines:
+            dash_attribute = f' stroke-dasharray="{dash}"' if dash else ""
+            if orientation == "h":
+                position = float(to_y(value))
+                path = f"M{left} {position:.1f}H{left + plot_width}"
+            else:
+                position = float(to_x(value))
+                path = f"M{position:.1f} {top}V{top + plot_height}"
+            parts.append(
+                f'<path d="{path}" stroke="{color}" stroke-width="{width}"{dash_attribute}/>'
+            )
+
+        for series in self._series:
+            x_pixels = to_x(series["x"])
+            y_pixels = to_y(series["y"])
+            if series["line"]:
+                path = polyline_path(
+                    x_pixels, y_pixels, (top - plot_height, top + 2 * plot_height)
+                )
+                if path:
+                    dash_attribute = (
+                        f' stroke-dasharray="{series["dash"]}"' if series["dash"] else ""
+                    )
+                    parts.append(
+                        f'<path d="{path}" stroke="{series["color"]}" stroke-width="{series["width"]}" fill="none" stroke-linejoin="round"{dash_attribute}/>'
+                    )
+            if series["marker"]:
+                finite = np.isfinite(x_pixels) & np.isfinite(y_pixels)
+                circles = "".join(
+                    f"M{x - 3.5:.1f} {y:.1f}a3.5 3.5 0 1 0 7 0a3.5 3.5 0 1 0 -7 0"
+                    for x, y in zip(x_pixels[finite], y_pixels[finite])
+                )
+                if circles:
+                    parts.append(f'<path d="{circles}" fill="{series["color"]}"/>')
+        parts.append("</g>")
+
+        # Textos sobre los puntos.
+        for x, y, content, size in self._texts:
+            parts.append(
+                f'<text x="{float(to_x(x)):.1f}" y="{float(to_y(y)) - 4:.1f}" font-size="{size}" {FONT}>{escape(content)}</text>'
+            )
+
+        # Marco del área de la gráfica.
+        parts.append(
+            f'<rect x="{left}" y="{top}" width="{plot_width}" height="{plot_height}" fill="none" stroke="black" stroke-width="0.8"/>'
+        )
+        parts.append(self._legend(left + plot_width, top))
+        parts.append("</svg>")
+        return "".join(parts).encode("utf-8")
+
+    def _legend(self, right: float, top: float) -> str:
+        entries = [
+            (series["label"], series["color"], series["line"], series["dash"])
+            for series in self._series
+            if series["label"]
+        ] + [
+            (label, color, True, dash)
+            for _, _, color, _, dash, label in self._reference_lines
+            if label
+        ]
+        if not entries:
+            return ""
+        longest = max(len(label) for label, *_ in entries)
+        width = 40 + 6 * longest
+        x = right - width - 8
+        y = top + 8
+        parts = [
+            f'<rect x="{x:.1f}" y="{y:.1f}" width="{width}" height="{8 + 16 * len(entries)}" fill="white" fill-opacity="0.8" stroke="#cccccc" rx="3"/>'
+        ]
+        for index, (label, color, is_line, dash) in enumerate(entries):
+            row = y + 12 + 16 * index
+            if is_line:
+                dash_attribute = f' stroke-dasharray="{dash}"' if dash else ""
+                parts.append(
+                    f'<path d="M{x + 6:.1f} {row:.1f}h20" stroke="{color}" stroke-width="1.5"{dash_attribute}/>'
+                )
+            else:
+                parts.append(
+                    f'<circle cx="{x + 16:.1f}" cy="{row:.1f}" r="3.5" fill="{color}"/>'
+                )
+            parts.append(
+                f'<text x="{x + 32:.1f}" y="{row + 3.5:.1f}" font-size="10" {FONT}>{escape(label)}</text>'
+            )
+        return "".join(parts)
+
+
+def _column_extremes(xs: np.ndarray, ys: np.ndarray) -> np.ndarray:
+    # Grupos de puntos consecutivos en la misma columna de píxeles.
+    columns = np.floor(xs)
+    groups = np.concatenate(([0], np.cumsum(columns[1:] != columns[:-1])))
+    starts = np.flatnonzero(np.diff(groups, prepend=-1))
+    ends = np.append(starts[1:], xs.size) - 1
+    # Ordenando por grupo y después por y, el primero de cada grupo es el mínimo y el último el máximo.
+    order = np.lexsort((ys, groups))
+    return np.unique(np.concatenate((starts, ends, order[starts], order[ends])))
+
+
+def polyline_path(
+    x_pixels: np.ndarray, y_pixels: np.ndarray, y_bounds: tuple[float, float]
+) -> str:
+    """
+    Convierte una serie en coordenadas de pantalla al atributo "d" de un <path>.
+
+    Los valores no finitos cortan la línea en varios tramos y los valores muy alejados del área visible se acotan para que el SVG no tenga números enormes. De cada grupo de puntos consecutivos que caen en la misma columna de píxeles solo se conservan el primero, el último, el mínimo y el máximo: la línea dibujada es la misma y una curva de 10000 muestras queda con unos pocos puntos por columna.
+
+    Args:
+        x_pixels (np.ndarray): Coordenadas x en píxeles.
+        y_pixels (np.ndarray): Coordenadas y en píxeles.
+        y_bounds (tuple[float, float]): Rango al que se acotan las coordenadas y.
+
+    Returns:
+        str: Comandos del path, o texto vacío si no hay puntos válidos.
+    """
+    finite = np.isfinite(x_pixels) & np.isfinite(y_pixels)
+    x_rounded = np.round(x_pixels, 1)
+    y_rounded = np.round(np.clip(y_pixels, *y_bounds), 1)
+
+    # Índices donde empieza y termina cada tramo de valores finitos.
+    edges = np.diff(np.concatenate(([0], finite.astype(np.int8), [0])))
+    starts = np.flatnonzero(edges == 1)
+    ends = np.flatnonzero(edges == -1)
+
+    segments = []
+    for start, end in zip(starts, ends):
+        xs = x_rounded[start:end]
+        ys = y_rounded[start:end]
+        if xs.size > 2:
+            keep = _column_extremes(xs, ys)
+            xs, ys = xs[keep], ys[keep]
+        if xs.size > 1:
+            keep = np.ones(xs.size, dtype=bool)
+            keep[1:] = (xs[1:] != xs[:-1]) | (ys[1:] != ys[:-1])
+            xs, ys = xs[keep], ys[keep]
+        coordinates = "L".join(f"{x:g} {y:g}" for x, y in zip(xs.tolist(), ys.tolist()))
+        segments.append("M" + coordinates)
+    return "".join(segments)
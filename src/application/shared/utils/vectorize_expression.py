@@ -0,0 +1,175 @@
+import ast
+import math
+from functools import lru_cache, reduce
+from types import SimpleNamespace
+from typing import Callable
+import numpy as np
+from config.settings import EXPRESSION_CACHE_SIZE
+from src.application.shared.utils.compile_expression import (
+    compile_expression,
+    compile_expression_code,
+    normalize_expression,
+)
+
+"""
+
+Evalúa las expresiones del usuario sobre un arreglo completo de valores de x en una sola llamada, reemplazando las funciones de `math` por sus equivalentes universales (ufuncs) de NumPy. Los valores NaN, infinitos y fuera del dominio se descartan con máscaras booleanas. Si la expresión usa una función que no tiene equivalente vectorizado (por ejemplo math.factorial) se recurre a la evaluación punto a punto.
+
+"""
+
+
+def _log(value, base=None):
+    # math.log admite una base opcional, np.log no.
+    if base is None:
+        return np.log(value)
+    return np.log(value) / np.log(base)
+
+
+# Equivalentes en NumPy de las funciones y constantes de `math`.
+NUMPY_MATH_FUNCTIONS = {
+    "sin": np.sin,
+    "cos": np.cos,
+    "tan": np.tan,
+    "asin": np.arcsin,
+    "acos": np.arccos,
+    "atan": np.arctan,
+    "atan2": np.arctan2,
+    "sinh": np.sinh,
+    "cosh": np.cosh,
+    "tanh": np.tanh,
+    "asinh": np.arcsinh,
+    "acosh": np.arccosh,
+    "atanh": np.arctanh,
+    "exp": np.exp,
+    "exp2": np.exp2,
+    "expm1": np.expm1,
+    "log": _log,
+    "log10": np.log10,
+    "log2": np.log2,
+    "log1p": np.log1p,
+    "sqrt": np.sqrt,
+    "cbrt": np.cbrt,
+    "pow": np.power,
+    "fabs": np.fabs,
+    "floor": np.floor,
+    "ceil": np.ceil,
+    "trunc": np.trunc,
+    "fmod": np.fmod,
+    "copysign": np.copysign,
+    "hypot": np.hypot,
+    "degrees": np.degrees,
+    "radians": np.radians,
+    "pi": math.pi,
+    "e": math.e,
+    "tau": math.tau,
+    "inf": math.inf,
+    "nan": math.nan,
+}
+
+# Equivalentes en NumPy de las funciones integradas permitidas.
+NUMPY_BUILTINS = {
+    "abs": np.abs,
+    "pow": np.power,
+    "min": lambda *values: reduce(np.minimum, values),
+    "max": lambda *values: reduce(np.maximum, values),
+    "round": np.round,
+}
+
+
+@lru_cache(maxsize=EXPRESSION_CACHE_SIZE)
+def _compile_normalized_vectorized_expression(
+    source: str,
+) -> Callable[[np.ndarray], np.ndarray] | None:
+    code = compile_expression_code(source)
+
+    # Si la expresión usa algo de `math` sin equivalente en NumPy no se puede vectorizar.
+    for node in ast.walk(ast.parse(source, mode="eval")):
+        if isinstance(node, ast.Attribute) and node.attr not in NUMPY_MATH_FUNCTIONS:
+            return None
+
+    scope = {
+        "__builtins__": {},
+        "math": SimpleNamespace(**NUMPY_MATH_FUNCTIONS),
+    } | NUMPY_BUILTINS
+    return eval(code, scope)
+
+
+def compile_vectorized_expression(
+    source: str,
+) -> Callable[[np.ndarray], np.ndarray] | None:
+    """
+    Compila una expresión en una función que recibe y retorna arreglos de NumPy.
+
+    Args:
+        source (str): Expresión ingresada por el usuario, por ejemplo "x**2 - math.cos(x)".
+
+    Returns:
+        Callable | None: Función vectorizada f(x), o None si la expresión no se puede vectorizar.
+
+    Raises:
+        SyntaxError: Si la expresión no es válida o usa construcciones no permitidas.
+        NameError: Si la expresión usa nombres no definidos.
+    """
+    if not isinstance(source, str):
+        raise SyntaxError("la expresión debe ser un texto")
+    return _compile_normalized_vectorized_expression(normalize_expression(source))
+
+
+def evaluate_expression_array(source: str, x_vals: np.ndarray) -> np.ndarray:
+    """
+    Evalúa una expresión sobre todos los valores de x, dejando NaN en los puntos inválidos.
+
+    Args:
+        source (str): Expresión ingresada por el usuario.
+        x_vals (np.ndarray): Valores de x en los que se evalúa la función.
+
+    Returns:
+        np.ndarray: Valores de f(x) con la misma forma de x_vals; NaN donde la función no está definida.
+    """
+    x_vals = np.asarray(x_vals, dtype=float)
+
+    try:
+        evaluate_vectorized = compile_vectorized_expression(source)
+    except (SyntaxError, NameError):
+        return np.full(x_vals.shape, np.nan)
+
+    if evaluate_vectorized is not None:
+        try:
+            with np.errstate(all="ignore"):
+                result = np.asarray(evaluate_vectorized(x_vals))
+            # Los resultados complejos (por ejemplo (-8)**(1/3)) no pertenecen al dominio real.
+            if np.iscomplexobj(result):
+                result = np.where(result.imag == 0, result.real, np.nan)
+            return np.broadcast_to(result.astype(float), x_vals.shape).copy()
+        except Exception:
+            pass
+
+    # Evaluación punto a punto para expresiones que no se pueden vectorizar.
+    evaluate_f = compile_expression(source)
+    y_vals = np.full(x_vals.shape, np.nan)
+    for i, val in enumerate(x_vals):
+        try:
+            y_vals[i] = evaluate_f(val)
+        except Exception:
+            continue
+    return y_vals
+
+
+def evaluate_expression_on_grid(
+    source: str, x_vals: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Evalúa una expresión sobre todos los valores de x y descarta los puntos inválidos.
+
+    Args:
+        source (str): Expresión ingresada por el usuario.
+        x_vals (np.ndarray): Valores de x en los que se evalúa la función.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: Valores de x válidos y sus respectivos valores de f(x).
+    """
+    x_vals = np.asarray(x_vals, dtype=float)
+    y_vals = evaluate_expression_array(source, x_vals)
+
+    valid = np.isfinite(y_vals)
+    return x_vals[valid], y_vals[valid]
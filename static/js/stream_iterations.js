@@ -0,0 +1,122 @@
+/*
+ * Muestra las iteraciones de un método a medida que el servidor las calcula.
+ * Si la casilla "stream" del formulario está marcada, el formulario se envía con fetch y la respuesta
+ * (eventos enviados por el servidor) se lee por partes: cada evento "row" agrega una fila a la tabla y
+ * el evento "result" muestra el mensaje del método y la gráfica.
+ */
+(function () {
+  const form = document.querySelector('form[data-stream-form]')
+  const output = document.querySelector('[data-stream-output]')
+  if (!form || !output) {
+    return
+  }
+
+  const message = output.querySelector('[data-stream-message]')
+  const head = output.querySelector('thead')
+  const body = output.querySelector('tbody')
+  const plot = output.querySelector('[data-stream-plot]')
+
+  function formatValue(value) {
+    return Array.isArray(value) ? value.join(', ') : String(value)
+  }
+
+  function addRow(row) {
+    if (!head.firstChild) {
+      const header = document.createElement('tr')
+      Object.keys(row).forEach(function (key) {
+        const cell = document.createElement('th')
+        cell.scope = 'col'
+        cell.textContent = key === 'iteration' ? 'i' : key
+        header.appendChild(cell)
+      })
+      head.appendChild(header)
+    }
+    const line = document.createElement('tr')
+    Object.values(row).forEach(function (value) {
+      const cell = document.createElement('td')
+      cell.textContent = formatValue(value)
+      line.appendChild(cell)
+    })
+    const previous = body.lastElementChild
+    if (previous) {
+      previous.classList.remove('table-warning')
+    }
+    line.classList.add('table-warning')
+    body.appendChild(line)
+  }
+
+  function showResult(result) {
+    message.textContent = result.message_method
+    const plotUrls = (result.plots || {})[plot ? plot.dataset.plot : '']
+    if (plot && plotUrls && result.is_successful) {
+      plot.src = plotUrls.url
+      plot.hidden = false
+    }
+  }
+
+  function handleEvent(block) {
+    let name = 'message'
+    let data = ''
+    block.split('\n').forEach(function (line) {
+      if (line.startsWith('event: ')) {
+        name = line.slice(7)
+      } else if (line.startsWith('data: ')) {
+        data += line.slice(6)
+      }
+    })
+    if (!data) {
+      return
+    }
+    if (name === 'row') {
+      addRow(JSON.parse(data))
+    } else if (name === 'result') {
+      showResult(JSON.parse(data))
+    }
+  }
+
+  async function streamIterations() {
+    head.replaceChildren()
+    body.replaceChildren()
+    message.textContent = 'Calculando iteraciones...'
+    if (plot) {
+      plot.hidden = true
+    }
+    output.hidden = false
+
+    const response = await fetch(form.action, { method: 'POST', body: new FormData(form) })
+    if (!(response.headers.get('Content-Type') || '').startsWith('text/event-stream')) {
+      // El método no transmite sus iteraciones en este modo, se muestra la página completa.
+      document.open()
+      document.write(await response.text())
+      document.close()
+      return
+    }
+
+    const reader = response.body.getReader()
+    const decoder = new TextDecoder()
+    let buffer = ''
+    while (true) {
+      const { value, done } = await reader.read()
+      if (done) {
+        break
+      }
+      buffer += decoder.decode(value, { stream: true })
+      const blocks = buffer.split('\n\n')
+      buffer = blocks.pop()
+      blocks.forEach(handleEvent)
+    }
+    if (buffer) {
+      handleEvent(buffer)
+    }
+  }
+
+  form.addEventListener('submit', function (event) {
+    if (!form.elements.stream || !form.elements.stream.checked) {
+      return
+    }
+    event.preventDefault()
+    streamIterations().catch(function (error) {
+      message.textContent = 'No se pudieron recibir las iteraciones: ' + error.message
+    })
+  })
+})()